@@ -1,5 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from app.schemas.diary import DiaryCreate, DiaryResponse, DiaryUpdate
+from app.core.config import settings
+from app.core.fast_json import render_rows
+from app.schemas.diary import DiaryCreate, DiaryResponse, DiaryRowListAdapter, DiaryUpdate
 from app.services.diary_service import DiaryService
 from app.core.security import get_current_user
 
@@ -12,11 +14,13 @@ async def create_diary(payload: DiaryCreate, current_user=Depends(get_current_us
 
 @router.get("/", response_model=list[DiaryResponse], description="get all diaries")
 async def list_diaries(current_user=Depends(get_current_user)):
+    if settings.FAST_JSON_RESPONSES:
+        return render_rows(DiaryRowListAdapter, await DiaryService.list_rows_for_user(current_user))
     return await DiaryService.list_for_user(current_user)
 
 @router.get("/{diary_id}", response_model=DiaryResponse, description="get a diary by id")
 async def get_diary(diary_id: int, current_user=Depends(get_current_user)):
-    diary = await DiaryService.get_or_404(diary_id)
+    diary = await DiaryService.get_record_or_404(diary_id)
     if diary.user_id != current_user.id:
         raise HTTPException(status_code=403, detail="Forbidden")
     return diary
@@ -0,0 +1,18 @@
+from fastapi import APIRouter, Depends
+
+from app.core.security import get_current_user
+from app.models.user import User
+from app.schemas.home import HomeResponse
+from app.services.home_service import HomeService
+
+router = APIRouter(prefix="/api/v1/home", tags=["Home"])
+
+
+@router.get(
+    "",
+    response_model=HomeResponse,
+    summary="홈 화면",
+    description="내 정보, 최신 일기, 랜덤 명언, 랜덤 질문을 한 번에 조회 (일부 섹션이 실패하면 null + errors)",
+)
+async def get_home(current_user: User = Depends(get_current_user)):
+    return await HomeService.get_home(current_user)
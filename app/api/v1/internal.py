@@ -0,0 +1,87 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import PlainTextResponse
+
+from app.core.cache_bus import cache_bus
+from app.core.metrics import registry
+from app.core.profiler import profiler
+from app.core.security import require_internal_access
+from app.core.startup import startup_report
+from app.db.pool_stats import get_pool_stats
+from app.middleware.rate_limit import get_limiter_stats
+
+# 운영/부하 테스트용 내부 API (X-Internal-Token 필요)
+router = APIRouter(
+    tags=["Internal"],
+    dependencies=[Depends(require_internal_access)],
+    include_in_schema=False,
+)
+
+
+@router.get("/internal/db/pool", summary="DB 커넥션 풀 상태")
+async def get_db_pool_stats():
+    # 연결별 풀 크기, 사용 중 연결 수, 대기 수, acquire 대기 시간
+    return get_pool_stats()
+
+
+@router.get("/internal/limits", summary="요청 제한 / 부하 차단 상태")
+async def get_request_limits():
+    # 처리 중 / 대기 중 요청 수, 토큰 버킷별 추적 중인 키 수
+    return get_limiter_stats()
+
+
+@router.get("/internal/cache-bus", summary="워커 간 캐시 무효화 상태")
+async def get_cache_bus_stats():
+    # 이 워커의 수신 상태, 토픽별 핸들러 수, 발행/수신 이벤트 수
+    return cache_bus.stats()
+
+
+@router.get("/internal/startup", summary="워커 기동 시간")
+async def get_startup_report():
+    # 단계별 기동 시간 + import가 오래 걸린 모듈 (누적 / 자체 시간)
+    return startup_report.summary(include_modules=True)
+
+
+@router.get("/internal/profiles", summary="프로파일 목록")
+async def list_profiles():
+    # 헤더로 요청한 최근 프로파일 + 백그라운드 샘플링으로 누적된 라우트별 요청 수
+    return {
+        "recent": [profile.summary() for profile in reversed(profiler.recent.values())],
+        "aggregate": dict(profiler.aggregate_requests),
+    }
+
+
+@router.get(
+    "/internal/profiles/aggregate",
+    summary="라우트별 누적 프로파일 (collapsed stacks)",
+    response_class=PlainTextResponse,
+)
+async def get_aggregate_profile(route: Optional[str] = None):
+    # route 예: "GET /api/v1/diaries/" (없으면 전체 라우트), 값은 누적 시간(us)
+    return PlainTextResponse(profiler.collapsed_aggregate(route))
+
+
+@router.delete("/internal/profiles/aggregate", summary="라우트별 누적 프로파일 초기화")
+async def reset_aggregate_profile():
+    profiler.reset_aggregate()
+    return {"detail": "reset"}
+
+
+@router.get(
+    "/internal/profiles/{profile_id}",
+    summary="요청 프로파일 (collapsed stacks)",
+    response_class=PlainTextResponse,
+)
+async def get_profile(profile_id: int):
+    # flamegraph.pl / speedscope 에 그대로 넣을 수 있는 형식, 값은 누적 시간(us)
+    profile = profiler.recent.get(profile_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return PlainTextResponse(profile.collapsed())
+
+
+@router.get("/metrics", summary="Prometheus 메트릭", response_class=PlainTextResponse)
+async def get_metrics():
+    # Prometheus 텍스트 노출 형식 (라우트별 요청 시간 / DB 시간 / 쿼리 수 히스토그램 등)
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
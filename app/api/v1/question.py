@@ -1,5 +1,10 @@
 #app\api\v1\question.py
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from app.core.security import get_current_user
+from app.models.user import User
+from app.schemas.question import QuestionCategoryResponse, QuestionResponse, TodayQuestionResponse
 from app.scraping.question_scraper import scrape_and_save_questions
 from app.services.question_service import QuestionService
 
@@ -24,14 +29,52 @@ async def scrap_question():
     return result
 
 
-@router.get("/random")
-async def get_random_question():
-    quote = await QuestionService.get_random()
+@router.get("/random", response_model=QuestionResponse)
+async def get_random_question(
+    category: Optional[str] = Query(default=None, max_length=50, description="질문 카테고리"),
+):
+    quote = await QuestionService.get_random(category)
     if not quote:
         raise HTTPException(status_code=404, detail="No question found")
     return quote
 
 
+@router.get(
+    "/questions/today",
+    response_model=TodayQuestionResponse,
+    summary="오늘의 질문",
+    description="로그인한 사용자에게 배정된 오늘의 질문 조회 (미리 배정되지 않았으면 즉시 배정)",
+)
+async def get_today_question(current_user: User = Depends(get_current_user)):
+    question = await QuestionService.get_today(current_user.id)
+    if not question:
+        raise HTTPException(status_code=404, detail="No question found")
+    return question
+
+
+@router.get(
+    "/questions/categories",
+    response_model=list[QuestionCategoryResponse],
+    summary="질문 카테고리 목록",
+    description="카테고리별 질문 수 조회 (인메모리 카탈로그, DB 조회 없음)",
+)
+async def get_question_categories():
+    return await QuestionService.get_categories()
+
+
+@router.get(
+    "/questions/categories/{category}/random",
+    response_model=QuestionResponse,
+    summary="카테고리별 랜덤 질문",
+    description="지정한 카테고리 안에서 랜덤 질문 1개 조회 (인메모리 카탈로그, DB 조회 없음)",
+)
+async def get_random_question_by_category(category: str):
+    question = await QuestionService.get_random(category)
+    if not question:
+        raise HTTPException(status_code=404, detail="No question found")
+    return question
+
+
 # ============================================================
 # 랜덤 자기성찰 질문 제공 API
 # ------------------------------------------------------------
@@ -1,8 +1,18 @@
 from fastapi import APIRouter, Depends, Query, HTTPException
-from app.core.security import get_current_user
+from app.core.config import settings
+from app.core.fast_json import render_rows
+from app.core.security import get_current_user, require_internal_access
 from app.models.user import User
-from app.schemas.quote import QuoteBookmarkResponse, QuoteResponse
+from app.schemas.quote import (
+    QuoteBookmarkResponse,
+    QuoteBookmarkRowListAdapter,
+    QuoteRankResponse,
+    QuoteResponse,
+    QuoteRowListAdapter,
+    QuoteSearchResponse,
+)
 from app.scraping.quote_scraper import scrape_and_save_quotes
+from app.services.quote_search_service import QuoteSearchService
 from app.services.quote_service import QuoteBookmarkService, QuoteService
 
 
@@ -34,6 +44,8 @@ async def scrape_quotes(
     description="DB에 저장된 모든 명언 조회",
 )
 async def get_all_quotes():
+    if settings.FAST_JSON_RESPONSES:
+        return render_rows(QuoteRowListAdapter, await QuoteService.get_all_rows())
     quotes = await QuoteService.get_all()
     return quotes
 
@@ -51,6 +63,54 @@ async def get_random_quote():
     return quote
 
 
+@router.get(
+    "/top",
+    response_model=list[QuoteRankResponse],
+    summary="인기 명언 조회",
+    description="북마크 수가 많은 순으로 명언 상위 N개 조회",
+)
+async def get_top_quotes(
+    limit: int = Query(default=10, ge=1, le=100, description="조회할 명언 수"),
+):
+    return await QuoteService.get_top(limit)
+
+
+""" #######################################
+############ 명언 검색 ######################
+####################################### """
+@router.get(
+    "/search",
+    response_model=QuoteSearchResponse,
+    summary="명언 검색 / 작가 자동완성",
+    description="인메모리 인덱스에서 명언 내용 부분 일치 검색과 작가명 접두사 자동완성을 함께 수행",
+)
+async def search_quotes(
+    q: str = Query(min_length=1, max_length=100, description="검색어"),
+    limit: int = Query(default=20, ge=1, le=100, description="최대 결과 수"),
+):
+    return QuoteSearchService.search(q, limit)
+
+
+@router.get(
+    "/search/stats",
+    summary="검색 인덱스 상태",
+    description="검색 인덱스 크기와 메모리 사용량 조회",
+)
+async def get_search_index_stats():
+    return QuoteSearchService.stats()
+
+
+@router.post(
+    "/bookmark-counts/reconcile",
+    summary="북마크 수 재계산",
+    description="Bookmark 테이블 기준으로 명언의 bookmark_count를 보정 (내부용: X-Internal-Token 필요)",
+    dependencies=[Depends(require_internal_access)],
+)
+async def reconcile_bookmark_counts():
+    fixed = await QuoteService.reconcile_bookmark_counts()
+    return {"message": f"Reconciled bookmark_count for {fixed} quotes."}
+
+
 """ #######################################
 ############ 명언 북마크 #####################
 ####################################### """
@@ -78,6 +138,10 @@ async def add_bookmark(
 async def get_my_bookmarks(
     current_user: User = Depends(get_current_user),
 ):
+    if settings.FAST_JSON_RESPONSES:
+        return render_rows(
+            QuoteBookmarkRowListAdapter, await QuoteBookmarkService.get_bookmark_rows(current_user)
+        )
     bookmarks = await QuoteBookmarkService.get_bookmarks(current_user)
     return bookmarks
 
@@ -0,0 +1,44 @@
+import time
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """
+    프로세스 로컬 TTL 캐시
+    - 짧은 TTL 동안 같은 조회 결과를 재사용하기 위한 용도 (예: /quotes/top)
+    - ttl <= 0 이면 캐시를 사용하지 않음
+    - maxsize를 넘으면 가장 먼저 들어온 항목부터 제거
+    """
+
+    __slots__ = ("ttl", "maxsize", "_data")
+
+    def __init__(self, ttl: float, maxsize: int = 128):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: dict[Hashable, tuple[float, Any]] = {}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._data.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if self.ttl <= 0:
+            return
+        if key not in self._data and len(self._data) >= self.maxsize:
+            self._data.pop(next(iter(self._data)))
+        self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def pop(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
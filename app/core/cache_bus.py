@@ -0,0 +1,204 @@
+import asyncio
+import inspect
+import json
+import logging
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Optional, Union
+
+from tortoise import connections
+
+from app.core.config import settings
+from app.db.base import TORTOISE_ORM
+from app.models.cache_event import CacheInvalidation
+
+logger = logging.getLogger(__name__)
+
+# 무효화 토픽 (payload가 빈 문자열이면 해당 토픽의 캐시 전체 무효화)
+TOPIC_QUOTES = "quotes"                    # 명언 추가/삭제 → 검색 인덱스, 인기 명언
+TOPIC_BOOKMARKS = "bookmarks"              # 북마크 변경 → 인기 명언
+TOPIC_QUESTIONS = "questions"              # 질문 추가 → 질문 카탈로그
+TOPIC_TOKEN_BLACKLIST = "token_blacklist"  # 로그아웃 → 토큰 블랙리스트 (payload: 토큰 digest)
+
+Handler = Callable[[str], Union[None, Awaitable[None]]]
+
+
+class CacheBus:
+    """
+    워커(프로세스) 간 캐시 무효화
+    - publish(): 이 프로세스의 핸들러를 바로 실행하고, 다른 워커에 이벤트 전달
+    - Postgres: NOTIFY로 전달, 워커마다 LISTEN 전용 연결 1개 유지
+      (연결이 끊겼다 다시 붙으면 그 사이 이벤트를 놓쳤을 수 있으므로 전체 무효화)
+    - 그 외 DB: cacheinvalidation 테이블에 기록하고 주기적으로 폴링
+    - 같은 (토픽, payload) 처리가 진행 중이면 중복 이벤트는 합쳐서 끝난 뒤 1번만 더 처리
+    """
+
+    CHANNEL = "cache_invalidation"
+
+    def __init__(self):
+        self.origin = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._handlers: dict[str, list[Handler]] = {}
+        # 처리 중인 (토픽, payload) → 처리 중에 같은 이벤트가 또 왔는지
+        self._pending: dict[tuple[str, str], bool] = {}
+        self._task: Optional[asyncio.Task] = None
+        # 다른 워커에서 받은 이벤트 처리 태스크 (참조를 잡아 두지 않으면 GC로 사라질 수 있음)
+        self._dispatch_tasks: set[asyncio.Task] = set()
+        self.received_total = 0
+        self.published_total = 0
+
+    def subscribe(self, topic: str, handler: Handler) -> None:
+        self._handlers.setdefault(topic, []).append(handler)
+
+    @staticmethod
+    def _use_notify() -> bool:
+        return connections.get("default").capabilities.dialect == "postgres"
+
+    async def publish(self, topic: str, payload: str = "") -> None:
+        await self.dispatch(topic, payload)
+        self.published_total += 1
+        if not settings.CACHE_BUS_ENABLED:
+            return
+        try:
+            if self._use_notify():
+                message = json.dumps({"o": self.origin, "t": topic, "p": payload})
+                await connections.get("default").execute_query(
+                    "SELECT pg_notify($1, $2)", [self.CHANNEL, message]
+                )
+            else:
+                await CacheInvalidation.create(topic=topic, payload=payload, origin=self.origin)
+        except Exception:
+            # 전달에 실패해도 쓰기 자체는 성공했으므로 요청을 실패시키지 않음 (다른 워커는 TTL로 만료)
+            logger.exception("Failed to publish cache invalidation %s:%s", topic, payload)
+
+    async def dispatch(self, topic: str, payload: str = "") -> None:
+        key = (topic, payload)
+        if key in self._pending:
+            # 처리 중인 핸들러가 이미 읽은 데이터보다 새 쓰기가 있으므로 끝난 뒤 1번 더 실행
+            self._pending[key] = True
+            return
+        self._pending[key] = False
+        try:
+            while True:
+                for handler in self._handlers.get(topic, ()):
+                    try:
+                        result = handler(payload)
+                        if inspect.isawaitable(result):
+                            await result
+                    except Exception:
+                        logger.exception("Cache invalidation handler failed for %s:%s", topic, payload)
+                if not self._pending[key]:
+                    break
+                self._pending[key] = False
+        finally:
+            del self._pending[key]
+
+    async def invalidate_all(self) -> None:
+        for topic in list(self._handlers):
+            await self.dispatch(topic, "")
+
+    def _receive(self, origin: str, topic: str, payload: str) -> None:
+        if origin == self.origin:
+            return
+        self.received_total += 1
+        task = asyncio.create_task(self.dispatch(topic, payload))
+        self._dispatch_tasks.add(task)
+        task.add_done_callback(self._dispatch_tasks.discard)
+
+    # ------------------------------------------------------------
+    # 수신 (main.py startup / shutdown)
+    # ------------------------------------------------------------
+    def start(self) -> None:
+        if not settings.CACHE_BUS_ENABLED or self._task is not None:
+            return
+        runner = self._listen_forever if self._use_notify() else self._poll_forever
+        self._task = asyncio.create_task(runner())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _listen_forever(self) -> None:
+        import asyncpg  # Postgres를 쓸 때만 필요
+
+        credentials = TORTOISE_ORM["connections"]["default"]["credentials"]
+        connected_before = False
+        while True:
+            conn = None
+            try:
+                conn = await asyncpg.connect(
+                    host=credentials["host"],
+                    port=credentials["port"],
+                    user=credentials["user"],
+                    password=credentials["password"],
+                    database=credentials["database"],
+                    timeout=settings.DB_CONNECT_TIMEOUT,
+                )
+                closed = asyncio.Event()
+                conn.add_termination_listener(lambda _conn: closed.set())
+                await conn.add_listener(self.CHANNEL, self._on_notify)
+                if connected_before:
+                    # 끊겨 있던 동안의 이벤트를 놓쳤을 수 있음
+                    await self.invalidate_all()
+                connected_before = True
+                await closed.wait()
+                logger.warning("Cache invalidation LISTEN connection closed, reconnecting")
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Cache invalidation LISTEN connection failed")
+            finally:
+                if conn is not None and not conn.is_closed():
+                    await conn.close()
+            await asyncio.sleep(settings.CACHE_BUS_RECONNECT_SECONDS)
+
+    def _on_notify(self, _conn, _pid, _channel, message: str) -> None:
+        try:
+            event = json.loads(message)
+            self._receive(event["o"], event["t"], event.get("p", ""))
+        except (ValueError, KeyError):
+            logger.warning("Ignoring malformed cache invalidation message: %r", message)
+
+    async def _poll_forever(self) -> None:
+        last_id = None
+        last_pruned = datetime.now(timezone.utc)
+        while True:
+            try:
+                if last_id is None:
+                    latest = await CacheInvalidation.all().order_by("-id").first()
+                    last_id = latest.id if latest else 0
+                rows = await CacheInvalidation.filter(id__gt=last_id).order_by("id").values_list(
+                    "id", "origin", "topic", "payload"
+                )
+                for event_id, origin, topic, payload in rows:
+                    last_id = event_id
+                    self._receive(origin, topic, payload)
+
+                now = datetime.now(timezone.utc)
+                retention = timedelta(seconds=settings.CACHE_BUS_EVENT_RETENTION_SECONDS)
+                if now - last_pruned > retention:
+                    await CacheInvalidation.filter(created_at__lt=now - retention).delete()
+                    last_pruned = now
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Cache invalidation polling failed")
+            await asyncio.sleep(settings.CACHE_BUS_POLL_INTERVAL_SECONDS)
+
+    def stats(self) -> dict:
+        return {
+            "origin": self.origin,
+            "running": self._task is not None and not self._task.done(),
+            "topics": {topic: len(handlers) for topic, handlers in self._handlers.items()},
+            "published_total": self.published_total,
+            "received_total": self.received_total,
+        }
+
+
+cache_bus = CacheBus()
@@ -9,6 +9,118 @@ class Settings(BaseSettings):
     DB_NAME: str = "my_diary_db"
     DATABASE_URL: str = ""
 
+    # DB 커넥션 풀 설정 (uvicorn 워커 1개 기준, asyncpg / aiomysql 공통)
+    DB_POOL_MIN_SIZE: int = 1
+    DB_POOL_MAX_SIZE: int = 10
+    DB_CONNECT_TIMEOUT: float = 10.0  # 초
+    DB_MAX_INACTIVE_CONNECTION_LIFETIME: float = 300.0  # 초 (MySQL은 pool_recycle로 사용)
+    # asyncpg 전용 설정
+    DB_STATEMENT_CACHE_SIZE: int = 100  # prepared statement 캐시 (pgbouncer transaction 모드면 0)
+    DB_COMMAND_TIMEOUT: float = 30.0  # 초 (쿼리 1개 최대 실행 시간)
+    DB_MAX_QUERIES: int = 50_000  # 이 횟수만큼 쿼리를 실행한 연결은 새 연결로 교체
+    # 요청마다 실행되는 조회(블랙리스트, 사용자, 일기 단건, 랜덤 명언)를 asyncpg로 직접 실행
+    # (app/repositories/fast_path_repo.py, False거나 Postgres가 아니면 ORM 사용)
+    DB_FAST_PATH_ENABLED: bool = True
+
+    # 읽기 전용 복제본 (비어 있으면 모든 쿼리를 default 연결로)
+    DB_REPLICA_URL: str = ""
+    # 쓰기 직후 해당 사용자의 읽기를 primary로 보내는 시간 (초)
+    REPLICA_STICKY_SECONDS: float = 5.0
+
+    # 목록 API(일기/명언/북마크)에서 response_model 검증을 건너뛰는 빠른 JSON 직렬화 사용
+    FAST_JSON_RESPONSES: bool = False
+
+    # 워커 간 캐시 무효화 (Postgres는 LISTEN/NOTIFY, 그 외 DB는 테이블 폴링)
+    CACHE_BUS_ENABLED: bool = True
+    CACHE_BUS_POLL_INTERVAL_SECONDS: float = 2.0
+    CACHE_BUS_RECONNECT_SECONDS: float = 5.0
+    CACHE_BUS_EVENT_RETENTION_SECONDS: int = 3600  # 폴링 테이블의 이벤트 보관 시간
+    # 인증 캐시 (토큰 블랙리스트 조회 결과, 사용자 행). 0이면 캐시 사용 안 함
+    AUTH_CACHE_TTL_SECONDS: float = 30.0
+    AUTH_CACHE_MAX_ENTRIES: int = 10_000
+
+    # 홈 화면 API (/api/v1/home): 최신 일기 개수, 섹션별 timeout (초)
+    HOME_DIARY_LIMIT: int = 5
+    HOME_SECTION_TIMEOUTS: dict[str, float] = {"diaries": 1.0, "quote": 0.5, "question": 0.5}
+
+    # 요청 제한 (토큰 버킷, 분당 허용 횟수 + 순간 허용량)
+    # 로그인/가입은 IP 기준, 나머지는 사용자 id(JWT sub) 또는 IP 기준
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_AUTH_PER_MINUTE: float = 10
+    RATE_LIMIT_AUTH_BURST: int = 5
+    RATE_LIMIT_SCRAPE_PER_MINUTE: float = 2
+    RATE_LIMIT_SCRAPE_BURST: int = 1
+    RATE_LIMIT_DEFAULT_PER_MINUTE: float = 600
+    RATE_LIMIT_DEFAULT_BURST: int = 60
+    RATE_LIMIT_MAX_KEYS: int = 100_000
+    # 프록시 뒤에서 실행할 때만 True (X-Forwarded-For 첫 번째 IP 사용)
+    RATE_LIMIT_TRUST_FORWARDED_FOR: bool = False
+
+    # 부하 차단 (503): 동시 처리 요청 수 (0이면 제한 없음), 자리 대기 시간,
+    # DB 풀 대기자 수 기준 (0이면 사용 안 함)
+    MAX_CONCURRENT_REQUESTS: int = 64
+    LOAD_SHED_QUEUE_TIMEOUT_SECONDS: float = 0.5
+    LOAD_SHED_POOL_WAITERS: int = 20
+    LOAD_SHED_RETRY_AFTER_SECONDS: int = 1
+
+    # gzip 응답 압축 (최소 크기 바이트, 압축 레벨 1~9, 대상 Content-Type 접두사)
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MIN_SIZE: int = 1024
+    COMPRESSION_LEVEL: int = 6
+    COMPRESSION_CONTENT_TYPES: list[str] = ["application/json", "text/"]
+    # 이 크기 이상인 본문은 스레드 풀에서 압축
+    COMPRESSION_THREADPOOL_MIN_SIZE: int = 64 * 1024
+    # 같은 본문의 압축 결과 재사용 (LRU, 0이면 비활성화)
+    COMPRESSION_CACHE_MAX_ENTRIES: int = 64
+    COMPRESSION_CACHE_MAX_BYTES: int = 16 * 1024 * 1024
+
+    # 쿼리 1개 최대 실행 시간 (초, 0이면 DB_COMMAND_TIMEOUT만 적용, Postgres)
+    # 라우트별 값("<METHOD> <경로 템플릿>")이 있으면 그 값을 우선 사용
+    # - 키는 app.routes의 경로 템플릿과 정확히 일치해야 함 (접두사 매칭 없음, tests/test_route_timeouts.py)
+    STATEMENT_TIMEOUT_SECONDS: float = 0
+    ROUTE_STATEMENT_TIMEOUTS: dict[str, float] = {
+        "GET /api/v1/diaries/": 5.0,
+        "GET /quotes": 5.0,            # 전체 명언 목록
+        "GET /quotes/random": 2.0,
+        "GET /quotes/top": 2.0,
+        "GET /quotes/bookmarks": 5.0,
+    }
+    # 클라이언트가 연결을 끊으면 처리 중인 요청(핸들러 + 쿼리) 취소
+    CANCEL_ON_DISCONNECT: bool = True
+    CANCEL_ON_DISCONNECT_METHODS: list[str] = ["GET", "HEAD"]
+
+    # 샘플링 프로파일러
+    # - X-Profile: 1 + X-Internal-Token 헤더를 보낸 요청은 항상 프로파일링 (응답 헤더 X-Profile-Id)
+    # - PROFILER_SAMPLE_RATE 비율의 요청은 백그라운드로 프로파일링해서 라우트별로 누적
+    PROFILER_ENABLED: bool = True
+    PROFILER_SAMPLE_RATE: float = 0.0
+    PROFILER_INTERVAL_MS: float = 5.0
+    PROFILER_MAX_STACK_DEPTH: int = 64
+    PROFILER_KEEP_PROFILES: int = 50  # 최근 헤더 요청 프로파일 보관 개수
+    PROFILER_MAX_STACKS_PER_ROUTE: int = 5000  # 라우트별 누적 스택 종류 상한
+
+    # 기동 워밍업 (startup 마지막 단계, 끝나야 GET /ready 가 200)
+    # - DB 풀 연결을 WARMUP_POOL_CONNECTIONS개까지 미리 열고
+    # - WARMUP_PATHS를 앱 내부에서 한 번씩 호출해서 캐시 / 라우트 첫 실행 비용을 미리 치름
+    WARMUP_ENABLED: bool = True
+    WARMUP_POOL_CONNECTIONS: int = 4
+    WARMUP_PATHS: list[str] = ["/quotes/top", "/quotes/random", "/random", "/questions/categories"]
+    WARMUP_TIMEOUT_SECONDS: float = 10.0
+
+    # 요청별 DB 계측 (Server-Timing 헤더, /metrics)
+    DB_METRICS_ENABLED: bool = True
+    # 한 요청에서 같은 모양의 쿼리가 이 횟수보다 많이 실행되면 N+1 경고 (0이면 비활성화)
+    DB_N_PLUS_ONE_THRESHOLD: int = 0
+
+    # 느린 쿼리 로그 (ms, 0이면 비활성화) + EXPLAIN (FORMAT JSON) 자동 수집 (Postgres)
+    SLOW_QUERY_THRESHOLD_MS: float = 200.0
+    SLOW_QUERY_EXPLAIN: bool = True
+    SLOW_QUERY_EXPLAIN_PER_MINUTE: int = 6  # 전체 EXPLAIN 수집 한도
+    SLOW_QUERY_EXPLAIN_COOLDOWN_SECONDS: float = 300.0  # 같은 모양의 쿼리는 이 시간 동안 1번만
+
+    # 내부용 API(/internal/...) 접근 토큰 (비어 있으면 DEBUG 모드에서만 허용)
+    INTERNAL_API_TOKEN: str = ""
+
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7  # 7 days
 
@@ -19,6 +131,24 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     SECRET_KEY: str = ""
 
+    # 인기 명언(/quotes/top) 캐시 TTL (초, 0이면 캐시 사용 안 함)
+    TOP_QUOTES_CACHE_TTL_SECONDS: float = 30.0
+    # 랜덤 명언: 삭제된 id에 걸렸을 때 다시 뽑는 횟수 (모두 빗나가면 id 범위 조회로 대체)
+    RANDOM_QUOTE_ATTEMPTS: int = 3
+    # bookmark_count 재계산 작업 주기 (초, 0이면 비활성화)
+    BOOKMARK_RECONCILE_INTERVAL_SECONDS: int = 0
+
+    # 사용자별 질문 배정 비트맵 캐시 (False면 매번 DB 안티 조인 사용)
+    QUESTION_ASSIGNMENT_BITMAP_ENABLED: bool = True
+    QUESTION_ASSIGNMENT_BITMAP_MAX_USERS: int = 10_000
+
+    # "오늘의 질문" 기준 시간대 및 사전 배정 스케줄러
+    # (스케줄러는 워커 1개에서만 켜거나, CLI를 cron으로 실행)
+    QUESTION_TIMEZONE: str = "Asia/Seoul"
+    QUESTION_SCHEDULER_ENABLED: bool = False
+    QUESTION_SCHEDULER_RUN_AT: str = "23:00"  # 매일 이 시각에 다음 날 질문 배정
+    QUESTION_SCHEDULER_BATCH_SIZE: int = 1000
+
     @property
     def db_url(self) -> str:
         if self.DATABASE_URL:
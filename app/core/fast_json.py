@@ -0,0 +1,26 @@
+from typing import Any, Mapping, Optional
+
+from fastapi.responses import Response
+from pydantic import TypeAdapter
+
+
+class FastJSONResponse(Response):
+    """
+    이미 JSON bytes로 직렬화된 본문을 그대로 보내는 응답
+    - 라우터에서 이 응답을 반환하면 FastAPI는 response_model 검증과
+      jsonable_encoder 단계를 건너뜀 (response_model은 문서용으로만 사용)
+    """
+
+    media_type = "application/json"
+
+    def __init__(self, content: bytes, status_code: int = 200, headers: Optional[Mapping[str, str]] = None):
+        super().__init__(content=content, status_code=status_code, headers=headers)
+
+
+def render_rows(adapter: TypeAdapter, rows: Any) -> FastJSONResponse:
+    """
+    신뢰할 수 있는 DB 조회 결과(dict 목록)를 pydantic-core 직렬화기로 바로 bytes로 변환
+    - TypeAdapter.dump_json()은 검증 없이 직렬화만 하므로 모델 객체 생성 비용이 없음
+    - 출력 형식(datetime 등)은 response_model 경로와 동일
+    """
+    return FastJSONResponse(adapter.dump_json(rows))
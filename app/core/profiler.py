@@ -0,0 +1,193 @@
+import itertools
+import sys
+import threading
+import time
+from collections import Counter, OrderedDict
+from typing import Optional
+
+from app.core.config import settings
+
+# 실행 중이 아닌(await 중인) 태스크의 스택 끝에 붙는 표시
+AWAIT_FRAME = "[await]"
+# 라우트별 스택 종류가 상한을 넘으면 여기로 합산
+OTHER_STACK = "[other]"
+
+# 샘플링 스레드와 이벤트 루프 스레드가 함께 쓰는 상태(_active, RequestProfile.stacks / samples) 보호
+# 스택을 읽는 부분은 잠금 밖에서 하고 결과를 반영할 때만 잡음
+_lock = threading.Lock()
+
+
+def _frame_label(code) -> str:
+    module = code.co_filename.rsplit("/", 1)[-1]
+    return f"{code.co_qualname} ({module}:{code.co_firstlineno})"
+
+
+class RequestProfile:
+    """요청 1개의 샘플 (스택 → 누적 시간, 마이크로초)"""
+
+    __slots__ = ("id", "method", "route", "task", "root_frame", "thread_id", "stacks", "samples", "started", "duration")
+
+    def __init__(self, profile_id: int, method: str, task, thread_id: int):
+        self.id = profile_id
+        self.method = method
+        self.route = "unmatched"
+        self.task = task
+        # 태스크가 실행 중이면 스레드 스택에 이 프레임(태스크의 최상위 코루틴)이 들어 있음
+        self.root_frame = task.get_coro().cr_frame
+        self.thread_id = thread_id
+        self.stacks: Counter[str] = Counter()
+        self.samples = 0
+        self.started = time.perf_counter()
+        self.duration = 0.0
+
+    def summary(self) -> dict:
+        return {
+            "id": self.id,
+            "method": self.method,
+            "route": self.route,
+            "duration_ms": round(self.duration * 1000, 3),
+            "samples": self.samples,
+        }
+
+    def collapsed(self) -> str:
+        # flamegraph.pl / speedscope 에서 읽을 수 있는 collapsed stack 형식
+        with _lock:
+            stacks = self.stacks.most_common()
+        return "".join(f"{stack} {count}\n" for stack, count in stacks)
+
+
+def _running_stack(leaf, root) -> Optional[list[str]]:
+    # leaf에서 f_back을 따라 root까지 올라가며 라벨 수집 (root가 없으면 이 태스크가 실행 중이 아님)
+    labels = []
+    frame = leaf
+    while frame is not None:
+        labels.append(_frame_label(frame.f_code))
+        if frame is root:
+            labels.reverse()
+            return labels
+        frame = frame.f_back
+    return None
+
+
+def _awaiting_stack(task) -> list[str]:
+    # 대기 중인 코루틴 체인 (cr_await를 따라 내려감)
+    labels = []
+    coro = task.get_coro()
+    while coro is not None:
+        frame = getattr(coro, "cr_frame", None) or getattr(coro, "gi_frame", None)
+        if frame is None:
+            break
+        labels.append(_frame_label(frame.f_code))
+        coro = getattr(coro, "cr_await", None) or getattr(coro, "gi_yieldfrom", None)
+    labels.append(AWAIT_FRAME)
+    return labels
+
+
+class SamplingProfiler:
+    """
+    요청 단위 샘플링 프로파일러
+    - 별도 스레드가 PROFILER_INTERVAL_MS마다 이벤트 루프 스레드의 스택을 읽음 (프로파일 중인 요청이 있을 때만)
+    - 요청 태스크가 실행 중이면 CPU 스택, await 중이면 대기 중인 코루틴 체인 + [await]로 기록
+      (DB / HTTP 대기 시간이 어디서 생기는지도 함께 보임)
+    - gather 등으로 만든 하위 태스크 안의 실행 시간은 상위 태스크의 [await]로 보임
+    """
+
+    def __init__(self):
+        self._ids = itertools.count(1)
+        self._active: dict[int, RequestProfile] = {}
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        # 헤더로 요청한 프로파일 (id → RequestProfile)
+        self.recent: OrderedDict[int, RequestProfile] = OrderedDict()
+        # 백그라운드 샘플링 누적 ("METHOD route" → stack → 누적 시간 us)
+        self.aggregate: dict[str, Counter[str]] = {}
+        self.aggregate_requests: Counter[str] = Counter()
+
+    def start(self, task, method: str) -> RequestProfile:
+        profile = RequestProfile(next(self._ids), method, task, threading.get_ident())
+        with _lock:
+            self._active[profile.id] = profile
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+            self._thread.start()
+        self._wakeup.set()
+        return profile
+
+    def stop(self, profile: RequestProfile, route: str, keep: bool) -> None:
+        # _active에서 빠진 뒤에는 샘플링 스레드가 이 프로파일을 더 이상 바꾸지 않음
+        with _lock:
+            self._active.pop(profile.id, None)
+        profile.route = route
+        profile.duration = time.perf_counter() - profile.started
+        if keep:
+            self.recent[profile.id] = profile
+            while len(self.recent) > settings.PROFILER_KEEP_PROFILES:
+                self.recent.popitem(last=False)
+        else:
+            self._merge(profile)
+
+    def _merge(self, profile: RequestProfile) -> None:
+        key = f"{profile.method} {profile.route}"
+        stacks = self.aggregate.setdefault(key, Counter())
+        with _lock:
+            profile_stacks = list(profile.stacks.items())
+        for stack, count in profile_stacks:
+            if stack in stacks or len(stacks) < settings.PROFILER_MAX_STACKS_PER_ROUTE:
+                stacks[stack] += count
+            else:
+                stacks[OTHER_STACK] += count
+        self.aggregate_requests[key] += 1
+
+    def collapsed_aggregate(self, route: Optional[str] = None) -> str:
+        # 라우트를 최상위 프레임으로 붙여서 여러 라우트를 한 flame graph로 볼 수 있게 함
+        lines = []
+        for key, stacks in self.aggregate.items():
+            if route is not None and key != route:
+                continue
+            for stack, count in stacks.most_common():
+                lines.append(f"{key};{stack} {count}\n")
+        return "".join(lines)
+
+    def reset_aggregate(self) -> None:
+        self.aggregate = {}
+        self.aggregate_requests = Counter()
+
+    def _run(self) -> None:
+        last = time.perf_counter()
+        while True:
+            if not self._active:
+                self._wakeup.clear()
+                self._wakeup.wait()
+                last = time.perf_counter()
+            time.sleep(settings.PROFILER_INTERVAL_MS / 1000)
+            now = time.perf_counter()
+            # CPU를 쓰는 동안은 GIL 때문에 샘플 간격이 벌어지므로 횟수 대신 경과 시간(us)으로 가중
+            weight = max(1, int((now - last) * 1_000_000))
+            last = now
+            try:
+                self._sample(weight)
+            except Exception:
+                # 루프 스레드가 스택을 바꾸는 중에 읽으면 실패할 수 있음 → 이번 샘플만 버림
+                continue
+
+    def _sample(self, weight: int) -> None:
+        frames = sys._current_frames()
+        max_depth = settings.PROFILER_MAX_STACK_DEPTH
+        with _lock:
+            active = list(self._active.values())
+        for profile in active:
+            leaf = frames.get(profile.thread_id)
+            stack = _running_stack(leaf, profile.root_frame) if leaf is not None else None
+            if stack is None:
+                stack = _awaiting_stack(profile.task)
+            if len(stack) > max_depth:
+                stack = stack[:1] + ["..."] + stack[-(max_depth - 2):]
+            with _lock:
+                # 스택을 읽는 사이에 끝난 요청은 반영하지 않음 (이미 stop()에서 합산/보관됨)
+                if profile.id not in self._active:
+                    continue
+                profile.stacks[";".join(stack)] += weight
+                profile.samples += 1
+
+
+profiler = SamplingProfiler()
@@ -1,13 +1,17 @@
+import hashlib
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 from jose import jwt, JWTError
 from passlib.context import CryptContext
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, Header, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
+from app.core.cache import TTLCache
+from app.core.cache_bus import TOPIC_TOKEN_BLACKLIST, cache_bus
 from app.core.config import settings
-from app.models.user import User, TokenBlacklist
+from app.db.routing import bind_request_user
+from app.repositories.fast_path_repo import FastPathRepository
 
 pwd_context = CryptContext(
     schemes=["pbkdf2_sha256"],
@@ -15,6 +19,14 @@ pwd_context = CryptContext(
 
 oauth2_scheme = HTTPBearer()
 
+# 요청마다 반복되는 인증 조회 캐시
+# 토큰 digest → 블랙리스트 여부 (로그아웃하면 cache_bus로 모든 워커에서 무효화)
+_blacklist_cache = TTLCache(ttl=settings.AUTH_CACHE_TTL_SECONDS, maxsize=settings.AUTH_CACHE_MAX_ENTRIES)
+# JWT sub → User (사용자 정보를 수정/삭제하는 API가 없으므로 TTL로만 만료)
+_user_cache = TTLCache(ttl=settings.AUTH_CACHE_TTL_SECONDS, maxsize=settings.AUTH_CACHE_MAX_ENTRIES)
+# 요청 scope["state"]에 저장하는 디코딩 결과 키 ((토큰, payload))
+_DECODED_TOKEN_STATE = "decoded_token"
+
 def hash_password(password: str) -> str:
     return pwd_context.hash(password)
 
@@ -33,11 +45,55 @@ def create_refresh_token(subject: str, expires_delta: Optional[timedelta] = None
     to_encode = {"sub": str(subject), "exp": datetime.now(timezone.utc) + expires_delta, "typ": "refresh"}
     return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
 
+def decode_token(token: str, scope: Optional[dict] = None) -> dict:
+    """
+    JWT 서명 / 만료 확인 후 payload 반환 (실패하면 JWTError)
+    - scope를 넘기면 같은 요청 안에서는 1번만 디코딩
+      (rate_limit 미들웨어에서 디코딩한 결과를 get_current_user에서 재사용)
+    """
+    state = scope.setdefault("state", {}) if scope is not None else None
+    if state is not None:
+        cached = state.get(_DECODED_TOKEN_STATE)
+        if cached is not None and cached[0] == token:
+            return cached[1]
+    payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    if state is not None:
+        state[_DECODED_TOKEN_STATE] = (token, payload)
+    return payload
+
+def token_digest(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
 async def is_token_blacklisted(token: str) -> bool:
-    t = await TokenBlacklist.get_or_none(token=token)
-    return t is not None
+    digest = token_digest(token)
+    cached = _blacklist_cache.get(digest)
+    if cached is not None:
+        return cached
+    blacklisted = await FastPathRepository.is_token_blacklisted(token)
+    _blacklist_cache.set(digest, blacklisted)
+    return blacklisted
+
+async def get_user_by_subject(subject: str):
+    user = _user_cache.get(subject)
+    if user is None:
+        try:
+            user_id = int(subject)
+        except ValueError:
+            return None
+        user = await FastPathRepository.get_user(user_id)
+        if user is not None:
+            _user_cache.set(subject, user)
+    return user
+
+def _invalidate_blacklist(digest: str) -> None:
+    if digest:
+        _blacklist_cache.pop(digest)
+    else:
+        _blacklist_cache.clear()
 
-async def get_current_user(token: HTTPAuthorizationCredentials = Depends(oauth2_scheme)):
+cache_bus.subscribe(TOPIC_TOKEN_BLACKLIST, _invalidate_blacklist)
+
+async def get_current_user(request: Request, token: HTTPAuthorizationCredentials = Depends(oauth2_scheme)):
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -50,15 +106,34 @@ async def get_current_user(token: HTTPAuthorizationCredentials = Depends(oauth2_
         if await is_token_blacklisted(token_value):
             raise credentials_exception
 
-        payload = jwt.decode(token_value, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = decode_token(token_value, request.scope)
         user_id: str = payload.get("sub")
         if user_id is None:
             raise credentials_exception
     except JWTError:
         raise credentials_exception
 
-    user = await User.get_or_none(id=user_id)
+    user = await get_user_by_subject(user_id)
     if not user:
         raise credentials_exception
 
+    # 이 요청의 쓰기/읽기 라우팅(read-your-writes)에 사용
+    bind_request_user(user.id)
     return user
+
+
+def is_internal_token_valid(token: Optional[str]) -> bool:
+    """
+    내부용 기능 접근 확인
+    - INTERNAL_API_TOKEN이 설정되어 있으면 X-Internal-Token 헤더가 일치해야 함
+    - 설정되어 있지 않으면 DEBUG 모드에서만 허용
+    """
+    if settings.INTERNAL_API_TOKEN:
+        return token == settings.INTERNAL_API_TOKEN
+    return settings.DEBUG
+
+
+async def require_internal_access(x_internal_token: Optional[str] = Header(default=None)):
+    # 내부용 API(/internal/..., /metrics) 접근 확인
+    if not is_internal_token_valid(x_internal_token):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
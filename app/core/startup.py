@@ -0,0 +1,128 @@
+"""
+워커 기동 시간 측정 (import / DB 초기화 / 워밍업 단계별)
+
+app/main.py 맨 앞에서 import 되므로 app 설정이나 다른 무거운 모듈을 import 하지 않습니다.
+"""
+import sys
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+
+class ImportTimer:
+    """
+    import 시간 측정용 meta path finder
+    - 다른 finder가 찾은 spec의 loader.exec_module을 감싸서 모듈별 누적 / 자체 실행 시간을 기록
+    - 클래스 자체가 loader인 내장(builtin/frozen) 모듈은 측정하지 않음
+    """
+
+    def __init__(self):
+        # 모듈 이름 → [누적 시간, 자체 시간]
+        self.modules: dict[str, list[float]] = {}
+        # 실행 중인 모듈별 하위 모듈 import 시간 합계
+        self._children: list[float] = []
+
+    def find_spec(self, fullname, path=None, target=None):
+        spec = None
+        for finder in sys.meta_path:
+            find_spec = getattr(finder, "find_spec", None)
+            if finder is self or find_spec is None:
+                continue
+            spec = find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        if spec is None:
+            return None
+
+        loader = spec.loader
+        if loader is not None and not isinstance(loader, type) and hasattr(loader, "exec_module"):
+            self._wrap(fullname, loader)
+        return spec
+
+    def _wrap(self, fullname: str, loader) -> None:
+        original = loader.exec_module
+
+        def exec_module(module):
+            self._children.append(0.0)
+            started = time.perf_counter()
+            try:
+                original(module)
+            finally:
+                elapsed = time.perf_counter() - started
+                children = self._children.pop()
+                if self._children:
+                    self._children[-1] += elapsed
+                self.modules[fullname] = [elapsed, elapsed - children]
+                loader.exec_module = original
+
+        loader.exec_module = exec_module
+
+    def top(self, limit: int = 25) -> list[dict]:
+        ranked = sorted(self.modules.items(), key=lambda item: item[1][0], reverse=True)[:limit]
+        return [
+            {"module": name, "cumulative_ms": round(total * 1000, 2), "self_ms": round(own * 1000, 2)}
+            for name, (total, own) in ranked
+        ]
+
+
+class StartupReport:
+    """
+    단계별 기동 시간
+    - imports: app.main import 전체 (모듈별 상위 목록 포함)
+    - db_init / pool_connect / search_index / question_catalog / warmup: startup 핸들러 단계
+    - ready가 True가 되기 전까지 GET /ready 는 503
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases: dict[str, float] = {}
+        self.ready = False
+        self.ready_after: Optional[float] = None
+        # 워밍업 요청 결과 (경로 → 상태 코드 / 소요 시간)
+        self.warmup_requests: dict[str, dict] = {}
+        self._import_timer: Optional[ImportTimer] = None
+        self._phase_started: dict[str, float] = {}
+
+    def begin_imports(self) -> None:
+        self.started = time.perf_counter()
+        self._import_timer = ImportTimer()
+        sys.meta_path.insert(0, self._import_timer)
+
+    def end_imports(self) -> None:
+        if self._import_timer in sys.meta_path:
+            sys.meta_path.remove(self._import_timer)
+        self.phases["imports"] = time.perf_counter() - self.started
+
+    def begin(self, phase: str) -> None:
+        self._phase_started[phase] = time.perf_counter()
+
+    def end(self, phase: str) -> None:
+        started = self._phase_started.pop(phase, None)
+        if started is not None:
+            self.phases[phase] = time.perf_counter() - started
+
+    @contextmanager
+    def phase(self, name: str):
+        self.begin(name)
+        try:
+            yield
+        finally:
+            self.end(name)
+
+    def mark_ready(self) -> None:
+        self.ready = True
+        self.ready_after = time.perf_counter() - self.started
+
+    def summary(self, include_modules: bool = False) -> dict:
+        result = {
+            "ready": self.ready,
+            "ready_after_ms": round(self.ready_after * 1000, 2) if self.ready_after is not None else None,
+            "phases_ms": {phase: round(seconds * 1000, 2) for phase, seconds in self.phases.items()},
+            "warmup_requests": self.warmup_requests,
+        }
+        if include_modules and self._import_timer is not None:
+            result["slowest_imports"] = self._import_timer.top()
+        return result
+
+
+startup_report = StartupReport()
@@ -1,5 +1,6 @@
 from app.core.config import settings
 from typing import List
+from tortoise.backends.base.config_generator import expand_db_url
 
 # 💡 모델 파일 경로 정의: 프로젝트의 모든 모델을 여기에 명시합니다.
 TORTOISE_MODELS: List[str] = [
@@ -7,15 +8,50 @@ TORTOISE_MODELS: List[str] = [
     "app.models.diary",  # 다이어리(Diary) 모델 경로
     "app.models.quote",  # 명언(Quote) 모델 경로
     "app.models.question",  # 질문(Question) 모델 경로
+    "app.models.cache_event",  # 캐시 무효화 이벤트(폴링용) 모델 경로
     "aerich.models",  # Aerich 마이그레이션 도구 사용 시 필요한 모델
 ]
 
+
+def build_connection_config(db_url: str) -> dict:
+    """
+    DB URL을 Tortoise 연결 설정(engine + credentials)으로 펼치고,
+    Settings의 커넥션 풀 / 타임아웃 설정을 드라이버에 맞게 추가합니다.
+    """
+    config = expand_db_url(db_url)
+    credentials = config["credentials"]
+    engine = config["engine"]
+
+    if engine == "tortoise.backends.asyncpg":
+        # 나머지 키는 asyncpg.create_pool() / connect()로 그대로 전달됨
+        credentials.update({
+            "minsize": settings.DB_POOL_MIN_SIZE,
+            "maxsize": settings.DB_POOL_MAX_SIZE,
+            "max_queries": settings.DB_MAX_QUERIES,
+            "max_inactive_connection_lifetime": settings.DB_MAX_INACTIVE_CONNECTION_LIFETIME,
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "command_timeout": settings.DB_COMMAND_TIMEOUT,
+            "timeout": settings.DB_CONNECT_TIMEOUT,
+        })
+    elif engine == "tortoise.backends.mysql":
+        # 나머지 키는 aiomysql.create_pool()로 그대로 전달됨
+        credentials.update({
+            "minsize": settings.DB_POOL_MIN_SIZE,
+            "maxsize": settings.DB_POOL_MAX_SIZE,
+            "pool_recycle": int(settings.DB_MAX_INACTIVE_CONNECTION_LIFETIME),
+            "connect_timeout": settings.DB_CONNECT_TIMEOUT,
+        })
+
+    return config
+
+
 # Tortoise ORM 설정 딕셔너리
 # settings.DATABASE_URL을 사용하여 PostgreSQL 연결 정보를 설정합니다.
 TORTOISE_ORM = {
     "connections": {
         # 'default' 연결은 FastAPI에서 주로 사용되는 주 연결입니다.
-        "default": settings.db_url,  # config.py에서 로드된 DB 접속 URL
+        # config.py에서 로드된 DB 접속 URL + 커넥션 풀 설정
+        "default": build_connection_config(settings.db_url),
     },
     "apps": {
         "models": {
@@ -24,3 +60,8 @@ TORTOISE_ORM = {
         }
     }
 }
+
+# 'replica' 연결: 설정된 경우 @read_only 서비스 메서드의 조회를 복제본으로 보냄
+if settings.DB_REPLICA_URL:
+    TORTOISE_ORM["connections"]["replica"] = build_connection_config(settings.DB_REPLICA_URL)
+    TORTOISE_ORM["routers"] = ["app.db.routing.ReadReplicaRouter"]
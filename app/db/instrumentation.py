@@ -0,0 +1,174 @@
+import asyncio
+import functools
+import logging
+import re
+import sys
+import time
+from contextvars import ContextVar
+from typing import Any, Callable
+
+from tortoise import connections
+from tortoise.backends.base.client import BaseDBAsyncClient
+
+from app.db.timeouts import QueryTimeoutError, statement_timeout
+
+logger = logging.getLogger(__name__)
+
+# 계측할 DB 클라이언트 메서드 (Tortoise의 모든 쿼리가 이 메서드들을 거쳐 실행됨)
+_QUERY_METHODS = (
+    "execute_query",
+    "execute_query_dict",
+    "execute_insert",
+    "execute_many",
+    "execute_script",
+)
+
+
+class QueryEvent:
+    """실행이 끝난 쿼리 1개에 대한 정보 (리스너에게 전달)"""
+
+    __slots__ = ("connection_name", "method", "sql", "values", "elapsed", "rows", "error")
+
+    def __init__(self, connection_name, method, sql, values, elapsed, rows, error):
+        self.connection_name = connection_name
+        self.method = method
+        self.sql = sql
+        self.values = values
+        self.elapsed = elapsed
+        self.rows = rows
+        self.error = error
+
+
+QueryListener = Callable[[QueryEvent], None]
+_listeners: list[QueryListener] = []
+
+# 감싼 메서드를 실행 중인지 (MySQL의 execute_query_dict → execute_query 처럼
+# 감싼 메서드가 다른 감싼 메서드를 부르면 가장 바깥 호출만 계측 / timeout 적용)
+_in_hooked_call: ContextVar[bool] = ContextVar("in_hooked_call", default=False)
+
+
+def add_query_listener(listener: QueryListener) -> None:
+    if listener not in _listeners:
+        _listeners.append(listener)
+
+
+def remove_query_listener(listener: QueryListener) -> None:
+    if listener in _listeners:
+        _listeners.remove(listener)
+
+
+def _count_rows(method: str, values: Any, result: Any) -> int:
+    if method == "execute_query":
+        return result[0]
+    if method == "execute_query_dict":
+        return len(result)
+    if method == "execute_insert":
+        return 1
+    if method == "execute_many":
+        return len(values or ())
+    return 0
+
+
+def observe_query(connection_name, method, sql, values, elapsed, rows, error=None) -> None:
+    # Tortoise를 거치지 않는 쿼리(직접 asyncpg 호출 등)도 같은 리스너로 보고할 때 사용
+    event = QueryEvent(connection_name, method, sql, values, elapsed, rows, error)
+    for listener in _listeners:
+        try:
+            listener(event)
+        except Exception:
+            logger.exception("Query listener failed")
+
+
+async def _execute(func, client, query, args, kwargs):
+    # asyncpg는 대기 중인 쿼리가 취소되면 서버에도 취소 요청을 보내고 연결을 풀에 돌려줌
+    # (aiomysql은 취소 후 연결 상태를 보장하지 않으므로 Postgres에만 적용)
+    timeout = statement_timeout() if client.capabilities.dialect == "postgres" else None
+    if timeout is None:
+        return await func(client, query, *args, **kwargs)
+    try:
+        async with asyncio.timeout(timeout):
+            return await func(client, query, *args, **kwargs)
+    except QueryTimeoutError:
+        raise
+    except TimeoutError as e:
+        raise QueryTimeoutError(timeout, query) from e
+
+
+def _wrap(method: str, func):
+    @functools.wraps(func)
+    async def wrapper(self, query, *args, **kwargs):
+        if _in_hooked_call.get():
+            return await func(self, query, *args, **kwargs)
+        token = _in_hooked_call.set(True)
+        try:
+            if not _listeners:
+                return await _execute(func, self, query, args, kwargs)
+
+            values = args[0] if args else kwargs.get("values")
+            started = time.perf_counter()
+            try:
+                result = await _execute(func, self, query, args, kwargs)
+            except BaseException as e:
+                observe_query(self.connection_name, method, query, values, time.perf_counter() - started, 0, e)
+                raise
+        finally:
+            _in_hooked_call.reset(token)
+        observe_query(
+            self.connection_name,
+            method,
+            query,
+            values,
+            time.perf_counter() - started,
+            _count_rows(method, values, result),
+        )
+        return result
+
+    wrapper.__query_hooked__ = True
+    return wrapper
+
+
+def _client_classes(client: BaseDBAsyncClient) -> set[type]:
+    # 연결 클래스의 MRO + 같은 모듈의 트랜잭션 클래스(TransactionWrapper 등)
+    classes = {cls for cls in type(client).__mro__ if issubclass(cls, BaseDBAsyncClient)}
+    module = sys.modules.get(type(client).__module__)
+    for value in vars(module).values() if module else ():
+        if isinstance(value, type) and issubclass(value, BaseDBAsyncClient):
+            classes.add(value)
+    return classes
+
+
+def install_query_hooks() -> None:
+    """
+    Tortoise DB 클라이언트 클래스의 쿼리 메서드를 감싸서 리스너를 호출하고
+    statement timeout(app/db/timeouts.py)을 적용하도록 합니다.
+    (main.py startup에서 Tortoise 초기화 이후 1번 호출, 여러 번 호출해도 안전)
+    - 각 클래스가 직접 정의한 메서드만 감싸므로 상속 관계에서 중복 계측되지 않음
+    - 감싼 메서드 안에서 다시 감싼 메서드를 부르면 바깥 호출 1번만 계측
+    """
+    for client in connections.all():
+        for cls in _client_classes(client):
+            for method in _QUERY_METHODS:
+                func = cls.__dict__.get(method)
+                if func is None or getattr(func, "__query_hooked__", False):
+                    continue
+                setattr(cls, method, _wrap(method, func))
+
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"\$\d+|%s|\?")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_sql(sql: str) -> str:
+    """
+    쿼리 모양(shape)만 남기도록 값과 파라미터를 ? 로 치환
+    예) SELECT ... WHERE "id"=5 AND "user_id" IN ($1,$2) → SELECT ... WHERE "id"=? AND "user_id" IN (...)
+    """
+    shape = _STRING_LITERAL.sub("?", sql)
+    shape = _PLACEHOLDER.sub("?", shape)
+    shape = _NUMBER_LITERAL.sub("?", shape)
+    shape = _IN_LIST.sub("(...)", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
@@ -0,0 +1,129 @@
+import statistics
+import time
+from collections import deque
+from typing import Optional
+
+from tortoise import connections
+
+from app.core.metrics import registry
+
+
+class PoolMonitor:
+    """
+    커넥션 풀 1개의 acquire 계측
+    - 풀의 _acquire()를 감싸서 대기 중인 요청 수와 acquire 대기 시간을 기록
+    - asyncpg.Pool / aiomysql.Pool 모두 acquire()가 내부적으로 _acquire()를 호출함
+    """
+
+    def __init__(self, pool, sample_size: int = 1024):
+        self.pool = pool
+        self.waiting = 0
+        self.acquired_total = 0
+        self.failed_total = 0
+        self.max_wait_seconds = 0.0
+        self._recent_waits: deque[float] = deque(maxlen=sample_size)
+
+        original_acquire = pool._acquire
+
+        async def timed_acquire(*args, **kwargs):
+            started = time.perf_counter()
+            self.waiting += 1
+            try:
+                connection = await original_acquire(*args, **kwargs)
+            except BaseException:
+                self.failed_total += 1
+                raise
+            finally:
+                self.waiting -= 1
+            elapsed = time.perf_counter() - started
+            self.acquired_total += 1
+            self.max_wait_seconds = max(self.max_wait_seconds, elapsed)
+            self._recent_waits.append(elapsed)
+            return connection
+
+        pool._acquire = timed_acquire
+
+    def _sizes(self) -> dict:
+        pool = self.pool
+        if hasattr(pool, "get_size"):
+            # asyncpg.Pool
+            size, idle = pool.get_size(), pool.get_idle_size()
+            min_size, max_size = pool.get_min_size(), pool.get_max_size()
+        else:
+            # aiomysql.Pool
+            size, idle = pool.size, pool.freesize
+            min_size, max_size = pool.minsize, pool.maxsize
+        return {
+            "size": size,
+            "idle": idle,
+            "in_use": size - idle,
+            "min_size": min_size,
+            "max_size": max_size,
+        }
+
+    def snapshot(self) -> dict:
+        waits = sorted(self._recent_waits)
+        if waits:
+            latency = {
+                "p50_ms": round(statistics.median(waits) * 1000, 3),
+                "p95_ms": round(waits[min(len(waits) - 1, int(len(waits) * 0.95))] * 1000, 3),
+                "max_ms": round(self.max_wait_seconds * 1000, 3),
+            }
+        else:
+            latency = {"p50_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0}
+        return {
+            **self._sizes(),
+            "waiters": self.waiting,
+            "acquired_total": self.acquired_total,
+            "failed_total": self.failed_total,
+            "acquire_latency": latency,
+        }
+
+
+# 연결 이름 → PoolMonitor
+pool_monitors: dict[str, PoolMonitor] = {}
+
+
+def _get_pool(client) -> Optional[object]:
+    pool = getattr(client, "_pool", None)
+    return pool if hasattr(pool, "_acquire") else None
+
+
+async def instrument_pools() -> None:
+    """
+    Tortoise의 모든 연결에 대해 커넥션 풀을 미리 만들고 계측을 붙입니다.
+    (main.py startup에서 Tortoise 초기화 이후 호출)
+    """
+    for client in connections.all():
+        name = client.connection_name
+        if name in pool_monitors:
+            continue
+        if _get_pool(client) is None:
+            # 풀은 첫 쿼리 때 생성되므로 여기서 한 번 열어 둠
+            async with client.acquire_connection():
+                pass
+        pool = _get_pool(client)
+        if pool is not None:
+            pool_monitors[name] = PoolMonitor(pool)
+
+
+def get_pool_stats() -> dict:
+    return {name: monitor.snapshot() for name, monitor in pool_monitors.items()}
+
+
+def _collect_pool_metrics():
+    stats = get_pool_stats()
+    for key, documentation in (
+        ("size", "Open connections in the DB pool"),
+        ("in_use", "DB pool connections currently checked out"),
+        ("waiters", "Tasks waiting to acquire a DB pool connection"),
+    ):
+        yield (
+            f"db_pool_{key}",
+            documentation,
+            "gauge",
+            [({"connection": name}, snapshot[key]) for name, snapshot in stats.items()],
+        )
+
+
+registry.register_collector(_collect_pool_metrics)
@@ -0,0 +1,70 @@
+import functools
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+from app.core.config import settings
+
+# 읽기 전용 복제본 연결 이름 (app/db/base.py의 TORTOISE_ORM["connections"])
+REPLICA_CONNECTION = "replica"
+
+# 현재 실행 중인 코드가 @read_only 서비스 메서드 안인지
+_read_only: ContextVar[bool] = ContextVar("db_read_only", default=False)
+# 현재 요청의 사용자 id (get_current_user에서 설정)
+_request_user_id: ContextVar[Optional[int]] = ContextVar("db_request_user_id", default=None)
+# user_id → 이 시각까지는 primary에서 읽기 (read-your-writes)
+_sticky_until: dict[int, float] = {}
+
+
+def read_only(func):
+    """
+    읽기 전용 서비스 메서드 표시
+    - 이 메서드 안에서 실행되는 조회 쿼리는 replica 연결로 보냄
+    - 단, 방금 쓰기를 한 사용자의 요청은 REPLICA_STICKY_SECONDS 동안 primary에서 읽음
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        token = _read_only.set(True)
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            _read_only.reset(token)
+
+    return wrapper
+
+
+def bind_request_user(user_id: int) -> None:
+    _request_user_id.set(user_id)
+
+
+def _mark_sticky(user_id: int) -> None:
+    now = time.monotonic()
+    if len(_sticky_until) > 10_000:
+        # 만료된 항목 정리
+        for key in [key for key, until in _sticky_until.items() if until <= now]:
+            del _sticky_until[key]
+    _sticky_until[user_id] = now + settings.REPLICA_STICKY_SECONDS
+
+
+class ReadReplicaRouter:
+    """
+    Tortoise DB 라우터 (TORTOISE_ORM["routers"]에 등록)
+    - None을 반환하면 모델의 기본 연결(default = primary)을 사용
+    - 고정(sticky) 정보는 워커 프로세스 단위로 관리됨
+    """
+
+    def db_for_read(self, model) -> Optional[str]:
+        if not _read_only.get():
+            return None
+        user_id = _request_user_id.get()
+        if user_id is not None and _sticky_until.get(user_id, 0.0) > time.monotonic():
+            return None
+        return REPLICA_CONNECTION
+
+    def db_for_write(self, model) -> Optional[str]:
+        # 쓰기는 항상 primary, 쓰기를 한 사용자는 잠시 primary에서 읽도록 고정
+        user_id = _request_user_id.get()
+        if user_id is not None:
+            _mark_sticky(user_id)
+        return None
@@ -1,4 +1,7 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from tortoise import Tortoise
 from tortoise.contrib.fastapi import register_tortoise
 from app.db.base import TORTOISE_ORM
 
@@ -12,3 +15,15 @@ def init_tortoise(app: FastAPI) -> None:
         generate_schemas=False,       # 💡 False로 설정하여 마이그레이션 도구(Aerich)를 통해 스키마 관리
         add_exception_handlers=True,  # DB 관련 예외 핸들러(404 등) 자동 등록
     )
+
+
+@asynccontextmanager
+async def tortoise_context():
+    """
+    FastAPI 밖(CLI 스크립트 등)에서 Tortoise ORM을 초기화하고, 끝나면 연결을 닫습니다.
+    """
+    await Tortoise.init(config=TORTOISE_ORM)
+    try:
+        yield
+    finally:
+        await Tortoise.close_connections()
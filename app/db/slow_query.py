@@ -0,0 +1,134 @@
+import asyncio
+import contextvars
+import json
+import logging
+import sys
+import time
+from typing import Any
+
+from tortoise import connections
+
+from app.core.config import settings
+from app.db.instrumentation import QueryEvent, add_query_listener, normalize_sql
+
+logger = logging.getLogger(__name__)
+
+# 호출한 서비스 메서드를 찾을 때 보는 모듈
+_CALLER_PREFIXES = ("app.services.", "app.repositories.", "app.scraping.", "app.core.security")
+
+# 실행 중인 EXPLAIN 태스크 (GC 방지용 참조 보관)
+_explain_tasks: set[asyncio.Task] = set()
+
+
+class _ExplainLimiter:
+    """
+    EXPLAIN 수집 제한
+    - 전체: 1분당 SLOW_QUERY_EXPLAIN_PER_MINUTE 회 (토큰 버킷)
+    - 쿼리 모양별: SLOW_QUERY_EXPLAIN_COOLDOWN_SECONDS 동안 1회
+    """
+
+    def __init__(self):
+        self._tokens = float(settings.SLOW_QUERY_EXPLAIN_PER_MINUTE)
+        self._updated_at = time.monotonic()
+        self._last_by_shape: dict[str, float] = {}
+
+    def allow(self, shape: str) -> bool:
+        now = time.monotonic()
+        capacity = settings.SLOW_QUERY_EXPLAIN_PER_MINUTE
+        self._tokens = min(capacity, self._tokens + (now - self._updated_at) * capacity / 60)
+        self._updated_at = now
+
+        last = self._last_by_shape.get(shape)
+        if last is not None and now - last < settings.SLOW_QUERY_EXPLAIN_COOLDOWN_SECONDS:
+            return False
+        if self._tokens < 1:
+            return False
+
+        self._tokens -= 1
+        if len(self._last_by_shape) > 1000:
+            self._last_by_shape.clear()
+        self._last_by_shape[shape] = now
+        return True
+
+
+_limiter = _ExplainLimiter()
+
+
+def _params_shape(values: Any) -> str:
+    # 실제 값은 남기지 않고 타입/개수만 기록
+    if not values:
+        return "[]"
+    if isinstance(values[0], (list, tuple)):
+        return f"{len(values)} x [{', '.join(type(v).__name__ for v in values[0])}]"
+    return f"[{', '.join(type(v).__name__ for v in values)}]"
+
+
+def _find_caller() -> str:
+    frame = sys._getframe(1)
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module.startswith(_CALLER_PREFIXES):
+            return f"{module}.{frame.f_code.co_qualname}:{frame.f_lineno}"
+        frame = frame.f_back
+    return "unknown"
+
+
+async def _capture_plan(event: QueryEvent, shape: str, caller: str) -> None:
+    try:
+        client = connections.get(event.connection_name)
+        rows = await client.execute_query_dict(f"EXPLAIN (FORMAT JSON) {event.sql}", event.values)
+        plan = rows[0]["QUERY PLAN"]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        logger.warning(
+            "EXPLAIN for slow query from %s: %s\n%s",
+            caller,
+            shape,
+            json.dumps(plan, ensure_ascii=False),
+        )
+    except Exception as e:
+        logger.info("Could not capture EXPLAIN for %s: %s", shape, e)
+
+
+def _on_query(event: QueryEvent) -> None:
+    if event.elapsed * 1000 < settings.SLOW_QUERY_THRESHOLD_MS:
+        return
+    # EXPLAIN 태스크가 실행한 쿼리는 다시 기록하지 않음
+    if event.sql.startswith("EXPLAIN "):
+        return
+
+    shape = normalize_sql(event.sql)
+    caller = _find_caller()
+    logger.warning(
+        "Slow query %.1fms (%s, rows=%d, params=%s) from %s: %s",
+        event.elapsed * 1000,
+        event.connection_name,
+        event.rows,
+        _params_shape(event.values),
+        caller,
+        shape,
+    )
+
+    if not settings.SLOW_QUERY_EXPLAIN or event.error is not None:
+        return
+    if event.method not in ("execute_query", "execute_query_dict", "fetchrow"):
+        return
+    if not event.sql.lstrip().upper().startswith(("SELECT", "WITH")):
+        return
+    if connections.get(event.connection_name).capabilities.dialect != "postgres":
+        return
+    if not _limiter.allow(shape):
+        return
+
+    # 빈 컨텍스트에서 실행: 끝난 트랜잭션 연결이나 요청별 계측 정보를 물려받지 않음
+    task = asyncio.get_running_loop().create_task(
+        _capture_plan(event, shape, caller), context=contextvars.Context()
+    )
+    _explain_tasks.add(task)
+    task.add_done_callback(_explain_tasks.discard)
+
+
+def install_slow_query_log() -> None:
+    """SLOW_QUERY_THRESHOLD_MS > 0 이면 느린 쿼리 로그를 켭니다. (main.py startup)"""
+    if settings.SLOW_QUERY_THRESHOLD_MS > 0:
+        add_query_listener(_on_query)
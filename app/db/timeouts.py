@@ -0,0 +1,35 @@
+from contextvars import ContextVar
+from typing import Optional
+
+from app.core.config import settings
+
+# 현재 요청의 ASGI scope (라우팅 후 scope["route"]로 라우트별 timeout 결정)
+_request_scope: ContextVar[Optional[dict]] = ContextVar("db_request_scope", default=None)
+
+
+class QueryTimeoutError(TimeoutError):
+    """쿼리가 statement timeout을 넘겨 취소됨 (main.py에서 503으로 변환)"""
+
+    def __init__(self, timeout: float, sql: str):
+        super().__init__(f"Query exceeded {timeout}s statement timeout")
+        self.timeout = timeout
+        self.sql = sql
+
+
+def bind_request_scope(scope: dict) -> None:
+    _request_scope.set(scope)
+
+
+def statement_timeout() -> Optional[float]:
+    """
+    지금 실행할 쿼리에 적용할 timeout (초, None이면 제한 없음)
+    - 요청 안: ROUTE_STATEMENT_TIMEOUTS["<METHOD> <경로 템플릿>"] → 없으면 STATEMENT_TIMEOUT_SECONDS
+    - 요청 밖 (startup, 백그라운드 작업, CLI): STATEMENT_TIMEOUT_SECONDS
+    """
+    timeout = settings.STATEMENT_TIMEOUT_SECONDS
+    scope = _request_scope.get()
+    if scope is not None:
+        path = getattr(scope.get("route"), "path", None)
+        if path is not None:
+            timeout = settings.ROUTE_STATEMENT_TIMEOUTS.get(f"{scope['method']} {path}", timeout)
+    return timeout if timeout and timeout > 0 else None
@@ -1,4 +1,12 @@
-from fastapi import FastAPI
+# 기동 시간 측정 (다른 import보다 먼저 시작해야 모듈별 import 시간이 잡힘)
+from app.core.startup import startup_report
+
+startup_report.begin_imports()
+
+import asyncio
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.db.session import init_tortoise
@@ -7,12 +15,38 @@ from app.api.v1 import auth as auth_router
 from app.api.v1 import diary as diary_router
 from app.api.v1 import quote as quote_router
 from app.api.v1 import question as question_router
+from app.api.v1 import home as home_router
+from app.api.v1 import internal as internal_router
+from app.core.cache_bus import cache_bus
+from app.db.instrumentation import install_query_hooks
+from app.db.pool_stats import instrument_pools
+from app.db.slow_query import install_slow_query_log
+from app.db.timeouts import QueryTimeoutError
+from app.middleware.cancellation import CancellationMiddleware
+from app.middleware.compression import CompressionMiddleware
+from app.middleware.db_metrics import DBMetricsMiddleware
+from app.middleware.profiling import ProfilingMiddleware
+from app.middleware.rate_limit import RateLimitMiddleware
+from app.services.question_scheduler import QuestionAssignmentScheduler
+from app.services.question_service import QuestionService
+from app.services.quote_search_service import QuoteSearchService
+from app.services.quote_service import QuoteService
+from app.services.warmup_service import WarmupService
+
+startup_report.end_imports()
 
 app = FastAPI(
     title=settings.APP_NAME,
     debug=settings.DEBUG,
 )
 
+# 요청 취소 미들웨어 (라우트별 statement timeout, 클라이언트 연결 끊김 시 핸들러 취소)
+# 핸들러 바로 바깥에 있어야 하므로 가장 먼저 등록
+app.add_middleware(CancellationMiddleware)
+
+# 요청 제한 / 부하 차단 미들웨어 (CORS 안쪽에 두어 429/503 응답에도 CORS 헤더가 붙도록 먼저 등록)
+app.add_middleware(RateLimitMiddleware)
+
 # CORS 미들웨어 등록
 origins = ["*"]
 app.add_middleware(
@@ -23,6 +57,24 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 요청별 DB 쿼리 계측 미들웨어 (Server-Timing 헤더 + /metrics)
+if settings.DB_METRICS_ENABLED:
+    app.add_middleware(DBMetricsMiddleware)
+
+# gzip 응답 압축 (가장 바깥에서 최종 본문을 압축)
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(CompressionMiddleware)
+
+# 샘플링 프로파일러 (요청 전체를 측정하도록 가장 바깥에 등록)
+if settings.PROFILER_ENABLED:
+    app.add_middleware(ProfilingMiddleware)
+
+@app.on_event("startup")
+async def begin_db_init():
+    # startup 핸들러는 등록 순서대로 실행되므로 init_tortoise 앞에 두어 DB 초기화 시간을 측정
+    startup_report.begin("db_init")
+
+
 # Tortoise ORM 초기화 호출 (미들웨어 후, 라우터 등록 전에 위치)
 # 이 호출은 @app.on_event("startup")에 DB 연결 로직을 등록함
 init_tortoise(app)
@@ -32,7 +84,77 @@ app.include_router(auth_router.router)
 app.include_router(diary_router.router)
 app.include_router(quote_router.router)
 app.include_router(question_router.router)
+app.include_router(home_router.router)
+app.include_router(internal_router.router)
+
+# 백그라운드 작업 태스크 보관 (shutdown 시 취소)
+background_tasks: list[asyncio.Task] = []
+
+
+@app.on_event("startup")
+async def open_db_pools():
+    startup_report.end("db_init")
+    # 커넥션 풀을 미리 열고 acquire 계측 연결 (/internal/db/pool)
+    with startup_report.phase("pool_connect"):
+        await instrument_pools()
+    # 쿼리 실행 계측 연결 (요청별 쿼리 수 / DB 시간, 느린 쿼리 로그)
+    install_query_hooks()
+    install_slow_query_log()
+
 
+@app.on_event("startup")
+async def build_search_index():
+    # 명언 검색 인덱스 빌드 (DB 초기화 이후 실행됨)
+    with startup_report.phase("search_index"):
+        await QuoteSearchService.rebuild()
+
+
+@app.on_event("startup")
+async def load_question_catalog():
+    # 질문 카탈로그 로드 (/random 등은 이후 DB 조회 없이 처리)
+    with startup_report.phase("question_catalog"):
+        await QuestionService.reload_catalog()
+
+
+@app.on_event("startup")
+async def start_background_jobs():
+    # bookmark_count 재계산 작업 (설정된 경우에만)
+    if settings.BOOKMARK_RECONCILE_INTERVAL_SECONDS > 0:
+        background_tasks.append(asyncio.create_task(
+            QuoteService.run_reconcile_loop(settings.BOOKMARK_RECONCILE_INTERVAL_SECONDS)
+        ))
+    # 다음 날 질문 사전 배정 스케줄러 (설정된 경우에만)
+    if settings.QUESTION_SCHEDULER_ENABLED:
+        background_tasks.append(asyncio.create_task(QuestionAssignmentScheduler.run_forever()))
+    # 다른 워커가 발행한 캐시 무효화 이벤트 수신 (LISTEN 또는 폴링)
+    cache_bus.start()
+
+
+@app.on_event("startup")
+async def warmup():
+    # 마지막 startup 단계: 풀 연결 / 캐시 / 라우트를 미리 데우고 준비 완료로 표시 (GET /ready)
+    if settings.WARMUP_ENABLED:
+        with startup_report.phase("warmup"):
+            await WarmupService.run(app)
+    startup_report.mark_ready()
+
+
+@app.on_event("shutdown")
+async def stop_background_jobs():
+    await cache_bus.stop()
+    for task in background_tasks:
+        task.cancel()
+    background_tasks.clear()
+
+
+@app.exception_handler(QueryTimeoutError)
+async def query_timeout_handler(request: Request, exc: QueryTimeoutError):
+    # statement timeout으로 취소된 쿼리 → 503 (잠시 후 재시도)
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Query timed out"},
+        headers={"Retry-After": "1"},
+    )
 
 
 @app.get("/", summary="DB 연결 헬스 체크")
@@ -41,3 +163,14 @@ async def health_check():
     서버 상태 확인용 루트 엔드포인트
     """
     return {"status": "healthy", "message": "OK"}
+
+
+@app.get("/ready", summary="워커 준비 상태")
+async def readiness_check():
+    """
+    워밍업까지 끝났으면 200, 아직이면 503 (단계별 기동 시간 포함)
+    """
+    return JSONResponse(
+        status_code=200 if startup_report.ready else 503,
+        content=startup_report.summary(),
+    )
@@ -0,0 +1,73 @@
+import asyncio
+import logging
+
+from app.core.config import settings
+from app.core.metrics import registry
+from app.db.timeouts import bind_request_scope
+from app.middleware.db_metrics import route_template
+
+logger = logging.getLogger(__name__)
+
+client_disconnects = registry.counter(
+    "http_client_disconnects_total", "Requests whose handler was cancelled because the client disconnected"
+)
+
+
+class CancellationMiddleware:
+    """
+    요청 처리 취소
+    - 요청 scope를 바인딩해서 쿼리마다 라우트별 statement timeout이 적용되도록 함 (app/db/timeouts.py)
+    - CANCEL_ON_DISCONNECT_METHODS 요청은 클라이언트가 연결을 끊으면 핸들러 태스크를 취소
+      → 실행 중인 쿼리도 취소되고 DB 연결이 바로 풀로 돌아감
+    - 쓰기 요청(POST 등)은 중간에 끊기면 일부만 반영될 수 있으므로 기본값에서 제외
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.methods = frozenset(method.upper() for method in settings.CANCEL_ON_DISCONNECT_METHODS)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        bind_request_scope(scope)
+        if not settings.CANCEL_ON_DISCONNECT or scope["method"] not in self.methods:
+            await self.app(scope, receive, send)
+            return
+
+        # 요청 메시지는 감시 태스크가 대신 읽어서 앱에 넘겨줌 (receive를 두 곳에서 동시에 기다리지 않도록)
+        messages: asyncio.Queue = asyncio.Queue()
+        handler = asyncio.current_task()
+        disconnected = False
+        response_complete = False
+
+        async def watch_disconnect():
+            nonlocal disconnected
+            while True:
+                message = await receive()
+                await messages.put(message)
+                if message["type"] == "http.disconnect":
+                    if not response_complete:
+                        disconnected = True
+                        handler.cancel()
+                    return
+
+        async def send_and_track(message):
+            nonlocal response_complete
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                response_complete = True
+            await send(message)
+
+        watcher = asyncio.create_task(watch_disconnect())
+        try:
+            await self.app(scope, messages.get, send_and_track)
+        except asyncio.CancelledError:
+            if not disconnected:
+                raise
+            # 클라이언트가 이미 떠났으므로 응답을 보내지 않고 종료
+            handler.uncancel()
+            client_disconnects.inc(method=scope["method"], route=route_template(scope))
+            logger.info("Client disconnected, cancelled %s %s", scope["method"], scope["path"])
+        finally:
+            watcher.cancel()
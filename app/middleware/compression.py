@@ -0,0 +1,160 @@
+import gzip
+import hashlib
+from collections import OrderedDict
+from typing import Optional
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+
+from app.core.config import settings
+from app.core.metrics import registry
+
+compression_responses = registry.counter(
+    "http_response_compression_total", "Responses by compression result (compressed, cached, skipped)"
+)
+compression_bytes = registry.counter(
+    "http_response_compression_bytes_total", "Response body bytes before (in) and after (out) compression"
+)
+
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    # "gzip, deflate, br" / "gzip;q=0" 등을 해석 (q=0이면 거부)
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        if coding.strip().lower() not in ("gzip", "*"):
+            continue
+        params = params.strip().replace(" ", "")
+        if params.startswith("q="):
+            try:
+                return float(params[2:]) > 0
+            except ValueError:
+                return False
+        return True
+    return False
+
+
+class CompressedBodyCache:
+    """
+    본문 digest → gzip 결과 LRU
+    - 같은 목록 응답(예: 전체 명언 GET /quotes)이 반복될 때 다시 압축하지 않고 재사용
+    - 항목 수와 압축 결과 총 바이트 둘 다로 제한
+    """
+
+    __slots__ = ("max_entries", "max_bytes", "_data", "_bytes")
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._data: OrderedDict[bytes, bytes] = OrderedDict()
+        self._bytes = 0
+
+    def get(self, digest: bytes) -> Optional[bytes]:
+        compressed = self._data.get(digest)
+        if compressed is not None:
+            self._data.move_to_end(digest)
+        return compressed
+
+    def put(self, digest: bytes, compressed: bytes) -> None:
+        if self.max_entries <= 0 or len(compressed) > self.max_bytes or digest in self._data:
+            return
+        self._data[digest] = compressed
+        self._bytes += len(compressed)
+        while len(self._data) > self.max_entries or self._bytes > self.max_bytes:
+            _, evicted = self._data.popitem(last=False)
+            self._bytes -= len(evicted)
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+compressed_bodies = CompressedBodyCache(
+    settings.COMPRESSION_CACHE_MAX_ENTRIES, settings.COMPRESSION_CACHE_MAX_BYTES
+)
+
+
+class CompressionMiddleware:
+    """
+    gzip 응답 압축
+    - COMPRESSION_MIN_SIZE 이상이고 Content-Type이 허용 목록에 있는 응답만 압축
+    - 한 번에 끝나는 응답만 대상 (StreamingResponse 등 여러 조각 응답은 그대로 전달)
+    - 같은 본문은 digest로 캐시된 압축 결과를 그대로 사용
+    - COMPRESSION_THREADPOOL_MIN_SIZE 이상인 본문은 스레드 풀에서 압축 (이벤트 루프 블로킹 방지)
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.min_size = settings.COMPRESSION_MIN_SIZE
+        self.level = settings.COMPRESSION_LEVEL
+        self.threadpool_min_size = settings.COMPRESSION_THREADPOOL_MIN_SIZE
+        self.content_types = tuple(t.lower() for t in settings.COMPRESSION_CONTENT_TYPES)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not accepts_gzip(Headers(scope=scope).get("accept-encoding", "")):
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        passthrough = False
+
+        async def send_compressed(message):
+            nonlocal start_message, passthrough
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                # 본문을 보기 전까지 헤더 전송을 미룸 (Content-Length/Encoding 변경 필요)
+                start_message = message
+                if not self._compressible(Headers(raw=message["headers"])):
+                    passthrough = True
+                    compression_responses.inc(result="skipped")
+                    await send(message)
+                return
+
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            passthrough = True
+            if message.get("more_body", False) or len(body) < self.min_size:
+                compression_responses.inc(result="skipped")
+                await send(start_message)
+                await send(message)
+                return
+
+            compressed, cached = await self._compress(body)
+            compression_responses.inc(result="cached" if cached else "compressed")
+            compression_bytes.inc(len(body), direction="in")
+            compression_bytes.inc(len(compressed), direction="out")
+
+            headers = MutableHeaders(scope=start_message)
+            headers["Content-Encoding"] = "gzip"
+            headers["Content-Length"] = str(len(compressed))
+            headers.add_vary_header("Accept-Encoding")
+            await send(start_message)
+            await send({"type": "http.response.body", "body": compressed, "more_body": False})
+
+        await self.app(scope, receive, send_compressed)
+
+    def _compressible(self, headers: Headers) -> bool:
+        if "content-encoding" in headers or "content-range" in headers:
+            return False
+        content_type = headers.get("content-type", "").lower()
+        return content_type.startswith(self.content_types)
+
+    async def _compress(self, body: bytes) -> tuple[bytes, bool]:
+        digest = hashlib.blake2b(body, digest_size=16).digest()
+        compressed = compressed_bodies.get(digest)
+        if compressed is not None:
+            return compressed, True
+        if len(body) >= self.threadpool_min_size:
+            compressed = await run_in_threadpool(gzip.compress, body, self.level, mtime=0)
+        else:
+            compressed = gzip.compress(body, self.level, mtime=0)
+        compressed_bodies.put(digest, compressed)
+        return compressed, False
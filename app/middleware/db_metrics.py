@@ -0,0 +1,123 @@
+import logging
+import time
+from collections import Counter as ShapeCounter
+from contextvars import ContextVar
+from typing import Optional
+
+from starlette.datastructures import MutableHeaders
+
+from app.core.config import settings
+from app.core.metrics import QUERY_COUNT_BUCKETS, registry
+from app.db.instrumentation import QueryEvent, add_query_listener, normalize_sql
+
+logger = logging.getLogger(__name__)
+
+request_duration = registry.histogram(
+    "http_request_duration_seconds", "HTTP request duration until the response starts"
+)
+request_db_duration = registry.histogram(
+    "http_request_db_duration_seconds", "Total DB time spent per HTTP request"
+)
+request_db_queries = registry.histogram(
+    "http_request_db_queries", "Number of DB queries per HTTP request", QUERY_COUNT_BUCKETS
+)
+request_db_rows = registry.counter(
+    "http_request_db_rows_total", "Rows returned or affected by DB queries"
+)
+
+
+class RequestDBStats:
+    """요청 1개 동안 실행된 쿼리 통계"""
+
+    __slots__ = ("queries", "db_seconds", "rows", "shapes")
+
+    def __init__(self):
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.rows = 0
+        self.shapes: Optional[ShapeCounter] = ShapeCounter() if settings.DB_N_PLUS_ONE_THRESHOLD else None
+
+
+_request_stats: ContextVar[Optional[RequestDBStats]] = ContextVar("request_db_stats", default=None)
+
+
+def get_request_stats() -> Optional[RequestDBStats]:
+    return _request_stats.get()
+
+
+def _on_query(event: QueryEvent) -> None:
+    stats = _request_stats.get()
+    if stats is None:
+        return
+    stats.queries += 1
+    stats.db_seconds += event.elapsed
+    stats.rows += event.rows
+    if stats.shapes is not None:
+        stats.shapes[normalize_sql(event.sql)] += 1
+
+
+add_query_listener(_on_query)
+
+
+def route_template(scope: dict) -> str:
+    # FastAPI가 라우팅 후 scope["route"]에 APIRoute를 넣어 줌 → 경로 템플릿(/api/v1/diaries/{diary_id}) 사용
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+class DBMetricsMiddleware:
+    """
+    요청별 DB 쿼리 수 / DB 시간 / 행 수 계측
+    - 응답 헤더: Server-Timing: db;dur=<ms>;desc="<n> queries", app;dur=<ms>
+    - 라우트별 히스토그램은 GET /metrics 로 노출
+    - DB_N_PLUS_ONE_THRESHOLD > 0 이면 같은 모양의 쿼리가 그보다 많이 실행된 요청을 경고
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestDBStats()
+        token = _request_stats.set(stats)
+        started = time.perf_counter()
+        response_started_at = None
+
+        async def send_with_timing(message):
+            nonlocal response_started_at
+            if message["type"] == "http.response.start":
+                response_started_at = time.perf_counter()
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Server-Timing",
+                    f'db;dur={stats.db_seconds * 1000:.2f};desc="{stats.queries} queries", '
+                    f"app;dur={(response_started_at - started) * 1000:.2f}",
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _request_stats.reset(token)
+            route = route_template(scope)
+            method = scope["method"]
+            elapsed = (response_started_at or time.perf_counter()) - started
+            request_duration.observe(elapsed, method=method, route=route)
+            request_db_duration.observe(stats.db_seconds, method=method, route=route)
+            request_db_queries.observe(stats.queries, method=method, route=route)
+            if stats.rows:
+                request_db_rows.inc(stats.rows, method=method, route=route)
+            if stats.shapes:
+                self._warn_n_plus_one(method, route, stats.shapes)
+
+    @staticmethod
+    def _warn_n_plus_one(method: str, route: str, shapes: ShapeCounter) -> None:
+        threshold = settings.DB_N_PLUS_ONE_THRESHOLD
+        for shape, count in shapes.items():
+            if count > threshold:
+                logger.warning(
+                    "Possible N+1 query on %s %s: %d executions of %s", method, route, count, shape
+                )
@@ -0,0 +1,45 @@
+import asyncio
+import random
+
+from starlette.datastructures import Headers, MutableHeaders
+
+from app.core.config import settings
+from app.core.profiler import profiler
+from app.core.security import is_internal_token_valid
+from app.middleware.db_metrics import route_template
+
+
+class ProfilingMiddleware:
+    """
+    요청 샘플링 프로파일링
+    - X-Profile: 1 헤더 + 유효한 X-Internal-Token → 이 요청을 프로파일링하고 응답 헤더 X-Profile-Id 반환
+      (결과: GET /internal/profiles/{id})
+    - PROFILER_SAMPLE_RATE 비율의 요청 → 라우트별로 누적 (결과: GET /internal/profiles/aggregate)
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        requested = headers.get("x-profile") == "1" and is_internal_token_valid(headers.get("x-internal-token"))
+        sampled = not requested and settings.PROFILER_SAMPLE_RATE > 0 and random.random() < settings.PROFILER_SAMPLE_RATE
+        if not requested and not sampled:
+            await self.app(scope, receive, send)
+            return
+
+        profile = profiler.start(asyncio.current_task(), scope["method"])
+
+        async def send_with_profile_id(message):
+            if requested and message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append("X-Profile-Id", str(profile.id))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            profiler.stop(profile, route_template(scope), keep=requested)
@@ -0,0 +1,235 @@
+import asyncio
+import math
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from jose import JWTError
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+
+from app.core.config import settings
+from app.core.metrics import registry
+from app.core.security import decode_token
+from app.db.pool_stats import pool_monitors
+
+rate_limited_requests = registry.counter(
+    "http_rate_limited_total", "Requests rejected by the per-client token bucket (429)"
+)
+shed_requests = registry.counter(
+    "http_load_shed_total", "Requests rejected by the global concurrency limiter (503)"
+)
+
+# 라우트 분류 (경로 → 라우트 클래스). 나머지는 모두 "default"
+ROUTE_CLASSES = {
+    "/auth/login": "auth",
+    "/auth/register": "auth",
+    "/quotes/scrape": "scrape",
+    "/scrape": "scrape",
+}
+# 제한하지 않는 경로 (헬스 체크 / 준비 상태 "/", "/ready" 외에 메트릭, 내부 API, 문서)
+EXEMPT_PATHS = ("/metrics", "/internal/", "/docs", "/redoc", "/openapi.json")
+
+
+class TokenBucketLimiter:
+    """
+    키(사용자 id / IP)별 토큰 버킷
+    - 초당 rate개씩 토큰이 차고 최대 burst개까지 쌓임
+    - 추적하는 키가 max_keys를 넘으면 가장 오래 쓰이지 않은 키부터 제거
+    """
+
+    __slots__ = ("rate", "burst", "max_keys", "_buckets")
+
+    def __init__(self, per_minute: float, burst: int, max_keys: int):
+        self.rate = per_minute / 60
+        self.burst = burst
+        self.max_keys = max_keys
+        # 키 → [남은 토큰, 마지막 갱신 시각]
+        self._buckets: OrderedDict[str, list[float]] = OrderedDict()
+
+    def acquire(self, key: str) -> float:
+        """토큰 1개 사용. 허용되면 0, 거부되면 다음 토큰까지 남은 시간(초)을 반환"""
+        now = time.monotonic()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = [float(self.burst), now]
+            if len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+            bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+
+        if bucket[0] >= 1:
+            bucket[0] -= 1
+            return 0.0
+        return (1 - bucket[0]) / self.rate
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+limiters = {
+    "auth": TokenBucketLimiter(
+        settings.RATE_LIMIT_AUTH_PER_MINUTE, settings.RATE_LIMIT_AUTH_BURST, settings.RATE_LIMIT_MAX_KEYS
+    ),
+    "scrape": TokenBucketLimiter(
+        settings.RATE_LIMIT_SCRAPE_PER_MINUTE, settings.RATE_LIMIT_SCRAPE_BURST, settings.RATE_LIMIT_MAX_KEYS
+    ),
+    "default": TokenBucketLimiter(
+        settings.RATE_LIMIT_DEFAULT_PER_MINUTE, settings.RATE_LIMIT_DEFAULT_BURST, settings.RATE_LIMIT_MAX_KEYS
+    ),
+}
+
+
+class ConcurrencyLimiter:
+    """
+    프로세스 전체 동시 처리 요청 수 제한
+    - max_in_flight개가 처리 중이면 queue_timeout초까지 자리를 기다리고, 그래도 없으면 거부
+    - DB 풀 대기자가 pool_waiters 이상이면 바로 거부 (풀이 포화되기 전에 부하를 덜어냄)
+    """
+
+    def __init__(self, max_in_flight: int, queue_timeout: float, pool_waiters: int):
+        self.max_in_flight = max_in_flight
+        self.queue_timeout = queue_timeout
+        self.pool_waiters = pool_waiters
+        self.in_flight = 0
+        self.queued = 0
+        self._semaphore = asyncio.Semaphore(max_in_flight) if max_in_flight > 0 else None
+
+    def pool_saturated(self) -> bool:
+        if self.pool_waiters <= 0:
+            return False
+        return any(monitor.waiting >= self.pool_waiters for monitor in pool_monitors.values())
+
+    async def acquire(self) -> Optional[str]:
+        """자리를 얻으면 None, 거부되면 거부 사유를 반환"""
+        if self.pool_saturated():
+            return "db_pool"
+        if self._semaphore is not None:
+            if not self._semaphore.locked():
+                await self._semaphore.acquire()
+            elif self.queue_timeout <= 0:
+                return "concurrency"
+            else:
+                self.queued += 1
+                try:
+                    await asyncio.wait_for(self._semaphore.acquire(), self.queue_timeout)
+                except TimeoutError:
+                    return "concurrency"
+                finally:
+                    self.queued -= 1
+        self.in_flight += 1
+        return None
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        if self._semaphore is not None:
+            self._semaphore.release()
+
+
+concurrency = ConcurrencyLimiter(
+    settings.MAX_CONCURRENT_REQUESTS,
+    settings.LOAD_SHED_QUEUE_TIMEOUT_SECONDS,
+    settings.LOAD_SHED_POOL_WAITERS,
+)
+
+
+def route_class(path: str) -> str:
+    return ROUTE_CLASSES.get(path.rstrip("/") or "/", "default")
+
+
+def client_key(scope: dict, headers: Headers, use_user: bool) -> str:
+    # 인증된 요청은 JWT sub(사용자 id), 그 외에는 클라이언트 IP 기준
+    # (디코딩 결과는 scope["state"]에 남겨 get_current_user에서 다시 디코딩하지 않음)
+    if use_user:
+        authorization = headers.get("authorization", "")
+        if authorization[:7].lower() == "bearer ":
+            try:
+                payload = decode_token(authorization[7:], scope)
+            except JWTError:
+                payload = None
+            if payload and payload.get("sub"):
+                return f"user:{payload['sub']}"
+
+    if settings.RATE_LIMIT_TRUST_FORWARDED_FOR:
+        forwarded = headers.get("x-forwarded-for")
+        if forwarded:
+            return f"ip:{forwarded.split(',')[0].strip()}"
+    client = scope.get("client")
+    return f"ip:{client[0] if client else 'unknown'}"
+
+
+def get_limiter_stats() -> dict:
+    return {
+        "in_flight": concurrency.in_flight,
+        "queued": concurrency.queued,
+        "max_in_flight": concurrency.max_in_flight,
+        "tracked_keys": {name: len(limiter) for name, limiter in limiters.items()},
+    }
+
+
+def _collect_limiter_metrics():
+    yield ("http_requests_in_flight", "Requests currently being handled", "gauge", [({}, concurrency.in_flight)])
+    yield ("http_requests_queued", "Requests waiting for a concurrency slot", "gauge", [({}, concurrency.queued)])
+    yield (
+        "rate_limit_tracked_keys",
+        "Client keys tracked by each token bucket",
+        "gauge",
+        [({"route_class": name}, len(limiter)) for name, limiter in limiters.items()],
+    )
+
+
+registry.register_collector(_collect_limiter_metrics)
+
+
+class RateLimitMiddleware:
+    """
+    요청 제한 + 부하 차단
+    - 라우트 클래스(auth / scrape / default)별 토큰 버킷을 사용자 id 또는 IP 기준으로 적용 → 429
+    - 전체 동시 요청 수 / DB 풀 대기자 기준으로 부하 차단 → 503
+    - 두 응답 모두 Retry-After 헤더 포함
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] == "OPTIONS":
+            await self.app(scope, receive, send)
+            return
+        path = scope["path"]
+        if path in ("/", "/ready") or path.startswith(EXEMPT_PATHS):
+            await self.app(scope, receive, send)
+            return
+
+        if settings.RATE_LIMIT_ENABLED:
+            name = route_class(path)
+            # 로그인/가입은 아직 사용자가 없으므로 항상 IP 기준
+            key = client_key(scope, Headers(scope=scope), use_user=name != "auth")
+            retry_after = limiters[name].acquire(key)
+            if retry_after:
+                rate_limited_requests.inc(route_class=name)
+                await self._reject(429, "Too Many Requests", retry_after, scope, receive, send)
+                return
+
+        reason = await concurrency.acquire()
+        if reason is not None:
+            shed_requests.inc(reason=reason)
+            await self._reject(
+                503, "Service Unavailable", settings.LOAD_SHED_RETRY_AFTER_SECONDS, scope, receive, send
+            )
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            concurrency.release()
+
+    @staticmethod
+    async def _reject(status_code: int, detail: str, retry_after: float, scope, receive, send) -> None:
+        response = JSONResponse(
+            {"detail": detail},
+            status_code=status_code,
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+        )
+        await response(scope, receive, send)
@@ -0,0 +1,12 @@
+from tortoise import fields, models
+
+
+class CacheInvalidation(models.Model):
+    # CACHE_INVALIDATION 테이블
+    # LISTEN/NOTIFY를 쓸 수 없는 DB(MySQL 등)에서 워커 간 캐시 무효화 이벤트 전달용
+    id = fields.BigIntField(pk=True)
+    topic = fields.CharField(max_length=50)
+    payload = fields.CharField(max_length=255, default="")
+    # 이벤트를 발행한 프로세스 (자기 이벤트는 다시 처리하지 않음)
+    origin = fields.CharField(max_length=32)
+    created_at = fields.DatetimeField(auto_now_add=True, index=True)
@@ -11,3 +11,7 @@ class Diary(models.Model):
     # 💡 관계 정의: user_id FK (USERS ||--o{ DIARIES)
     # related_name='diary'는 User 모델에서 이미 사용됨
     user = fields.ForeignKeyField('models.User', related_name='diaries')
+
+    class Meta:
+        # 사용자별 일기 목록 (WHERE user_id = ? ORDER BY created_at DESC) 인덱스
+        indexes = (("user", "created_at"),)
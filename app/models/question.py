@@ -31,8 +31,8 @@ class Question(models.Model):                                             # [2]
     - 길이 제한 없음
     """
 
-    # category 추가
-    category = fields.CharField(max_length=50, null=True)
+    # category 추가 (카테고리별 조회 인덱스)
+    category = fields.CharField(max_length=50, null=True, index=True)
 
     # ---------------------------------------------------------
     # [5] 역참조: 이 질문을 받은 사용자 목록
@@ -113,6 +113,10 @@ class UserQuestion(models.Model):                                         # [7]
     # category 추가
     category = fields.CharField(max_length=50, null=True)
 
+    # 배정 날짜 ("오늘의 질문"이 어느 날짜의 질문인지)
+    # - 스케줄러가 전날 미리 배정하고, 요청 시에는 (user_id, assigned_date)로 1번만 조회
+    assigned_date = fields.DateField(null=True)
+
     # ---------------------------------------------------------
     # [11] 사용자의 답변 내용 (옵션)
     # ---------------------------------------------------------
@@ -137,11 +141,13 @@ class UserQuestion(models.Model):                                         # [7]
     # [13] 유니크 제약: User + Question 중복 할당 금지
     # ---------------------------------------------------------
     class Meta:
-        unique_together = ("user", "content")
+        unique_together = (("user", "content"), ("user", "assigned_date"))
         """
         동작 원리:
         - 하나의 User가 같은 Question을 중복으로 배정받지 못하도록 하는 제약
+        - 하루에 질문 1개만 배정되도록 (user, assigned_date)도 UNIQUE
         - 중복 삽입 시 IntegrityError 발생 → 중복 방지 확실
         - 실제 DB에는 복합 UNIQUE INDEX 생성:
-              UNIQUE(user_id, question_id)
+              UNIQUE(user_id, content_id)
+              UNIQUE(user_id, assigned_date)  ← "오늘의 질문" 조회 인덱스
         """
\ No newline at end of file
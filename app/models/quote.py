@@ -7,7 +7,15 @@ class Quote(models.Model):
     content = fields.TextField()
     author = fields.CharField(max_length=100, null=True)
 
+    # 💡 비정규화 카운터: 이 명언을 북마크한 사용자 수
+    # Bookmark 추가/삭제와 같은 트랜잭션에서 F() 표현식으로 갱신됨
+    bookmark_count = fields.IntField(default=0)
+
     # 💡 관계 정의: 역참조 (이 명언을 북마크한 사용자들)
     users_bookmarking: fields.ReverseRelation["Bookmark"]
 
+    class Meta:
+        # /quotes/top (bookmark_count DESC, id DESC) 정렬을 인덱스 역방향 스캔으로 처리
+        indexes = (("bookmark_count", "id"),)
+
 
@@ -0,0 +1,164 @@
+#app\repositories\fast_path_repo.py
+import asyncio
+import functools
+import time
+from datetime import datetime
+from typing import Optional
+
+from tortoise.router import router
+
+from app.core.config import settings
+from app.db.instrumentation import observe_query
+from app.db.timeouts import QueryTimeoutError, statement_timeout
+from app.models.diary import Diary
+from app.models.quote import Quote
+from app.models.user import TokenBlacklist, User
+
+
+class DiaryRecord:
+    """일기 1행 (GET /api/v1/diaries/{id} 응답용, 모델 객체 대신 사용)"""
+
+    __slots__ = ("id", "title", "content", "created_at", "user_id")
+
+    def __init__(self, id: int, title: str, content: str, created_at: datetime, user_id: int):
+        self.id = id
+        self.title = title
+        self.content = content
+        self.created_at = created_at
+        self.user_id = user_id
+
+
+class QuoteRecord:
+    """명언 1행 (랜덤 명언 응답용)"""
+
+    __slots__ = ("id", "content", "author")
+
+    def __init__(self, id: int, content: str, author: Optional[str]):
+        self.id = id
+        self.content = content
+        self.author = author
+
+
+@functools.cache
+def _statements() -> dict[str, str]:
+    """
+    요청마다 실행되는 쿼리의 SQL (Postgres 전용)
+    - 문자열이 고정이므로 asyncpg가 연결마다 1번만 prepare 하고 이후에는 재사용 (DB_STATEMENT_CACHE_SIZE > 0)
+    - 테이블 이름은 Tortoise 초기화 때 정해지므로 처음 사용할 때 만듦
+    - "user"는 Postgres 예약어이므로 테이블 이름은 항상 따옴표로 감쌈
+    """
+    blacklist = f'"{TokenBlacklist._meta.db_table}"'
+    user = f'"{User._meta.db_table}"'
+    diary = f'"{Diary._meta.db_table}"'
+    quote = f'"{Quote._meta.db_table}"'
+    return {
+        "blacklist": f"SELECT 1 FROM {blacklist} WHERE token = $1 LIMIT 1",
+        "user": f"SELECT id, username, password_hash, email FROM {user} WHERE id = $1",
+        "diary": f"SELECT id, title, content, created_at, user_id FROM {diary} WHERE id = $1",
+        "max_quote_id": f"SELECT MAX(id) FROM {quote}",
+        "quote": f"SELECT id, content, author FROM {quote} WHERE id = $1",
+        "quote_from": f"SELECT id, content, author FROM {quote} WHERE id >= $1 ORDER BY id LIMIT 1",
+    }
+
+
+def _read_client(model):
+    # Tortoise 쿼리와 같은 연결 선택 (@read_only면 replica, 트랜잭션 안이면 그 트랜잭션 연결)
+    return router.db_for_read(model) or model._meta.db
+
+
+def _uses_asyncpg(client) -> bool:
+    # asyncpg 연결(AsyncpgDBClient / 그 TransactionWrapper)에서만 직접 실행, 나머지는 ORM 경로
+    return settings.DB_FAST_PATH_ENABLED and type(client).__module__.startswith("tortoise.backends.asyncpg")
+
+
+async def _fetchrow(client, sql: str, *values):
+    """
+    asyncpg 연결에서 쿼리 1개 실행 (1행 또는 None)
+    - Tortoise 쿼리와 같은 방식으로 계측(observe_query)하고 statement timeout을 적용
+    """
+    timeout = statement_timeout()
+    started = time.perf_counter()
+    try:
+        async with asyncio.timeout(timeout):
+            async with client.acquire_connection() as connection:
+                row = await connection.fetchrow(sql, *values)
+    except QueryTimeoutError as e:
+        observe_query(client.connection_name, "fetchrow", sql, values, time.perf_counter() - started, 0, e)
+        raise
+    except TimeoutError as e:
+        error = QueryTimeoutError(timeout, sql)
+        observe_query(client.connection_name, "fetchrow", sql, values, time.perf_counter() - started, 0, error)
+        raise error from e
+    except BaseException as e:
+        observe_query(client.connection_name, "fetchrow", sql, values, time.perf_counter() - started, 0, e)
+        raise
+    observe_query(
+        client.connection_name, "fetchrow", sql, values, time.perf_counter() - started, 0 if row is None else 1
+    )
+    return row
+
+
+class FastPathRepository:
+    """
+    📌 요청마다 실행되는 조회 쿼리의 빠른 경로
+    ---------------------------------------------------------------
+    - asyncpg 연결이면 고정 SQL을 직접 실행 (쿼리 빌더 / 모델 객체 생성 없음)
+      → 결과는 튜플 값, __slots__ 레코드(DiaryRecord, QuoteRecord)로 반환
+    - 그 외 백엔드(MySQL, SQLite)나 DB_FAST_PATH_ENABLED=False면 기존 ORM 쿼리로 같은 값을 반환
+    """
+
+    @staticmethod
+    async def is_token_blacklisted(token: str) -> bool:
+        client = _read_client(TokenBlacklist)
+        if not _uses_asyncpg(client):
+            return await TokenBlacklist.filter(token=token).exists()
+        return await _fetchrow(client, _statements()["blacklist"], token) is not None
+
+    @staticmethod
+    async def get_user(user_id: int) -> Optional[User]:
+        # 사용자는 이후 ORM 쿼리의 필터 / FK 값으로 쓰이므로 모델 객체로 반환 (쿼리 빌더만 생략)
+        client = _read_client(User)
+        if not _uses_asyncpg(client):
+            return await User.get_or_none(id=user_id)
+        row = await _fetchrow(client, _statements()["user"], user_id)
+        return User._init_from_db(**row) if row is not None else None
+
+    @staticmethod
+    async def get_diary(diary_id: int) -> Optional[DiaryRecord]:
+        client = _read_client(Diary)
+        if not _uses_asyncpg(client):
+            row = await Diary.filter(id=diary_id).first().values_list(
+                "id", "title", "content", "created_at", "user_id"
+            )
+        else:
+            row = await _fetchrow(client, _statements()["diary"], diary_id)
+        return DiaryRecord(*row) if row is not None else None
+
+    @staticmethod
+    async def get_max_quote_id() -> Optional[int]:
+        client = _read_client(Quote)
+        if not _uses_asyncpg(client):
+            return await Quote.all().order_by("-id").first().values_list("id", flat=True)
+        row = await _fetchrow(client, _statements()["max_quote_id"])
+        return row[0]
+
+    @staticmethod
+    async def get_quote(quote_id: int) -> Optional[QuoteRecord]:
+        client = _read_client(Quote)
+        if not _uses_asyncpg(client):
+            row = await Quote.filter(id=quote_id).first().values_list("id", "content", "author")
+        else:
+            row = await _fetchrow(client, _statements()["quote"], quote_id)
+        return QuoteRecord(*row) if row is not None else None
+
+    @staticmethod
+    async def get_quote_from(start_id: int) -> Optional[QuoteRecord]:
+        # start_id 이상인 첫 명언 (PK 인덱스로 1행만 읽음)
+        client = _read_client(Quote)
+        if not _uses_asyncpg(client):
+            row = await Quote.filter(id__gte=start_id).order_by("id").first().values_list(
+                "id", "content", "author"
+            )
+        else:
+            row = await _fetchrow(client, _statements()["quote_from"], start_id)
+        return QuoteRecord(*row) if row is not None else None
@@ -1,7 +1,78 @@
 #app\repositories\question_repo.py
+from collections import OrderedDict
+from datetime import date
 from typing import Optional
 from app.models.question import Question, UserQuestion
-import random
+
+
+class AssignmentBitmap:
+    """
+    📌 사용자 1명이 지금까지 받은 질문 id 집합 (비트맵)
+    ---------------------------------------------------------------
+    - question id 하나당 1bit → 질문 100만 개여도 사용자당 약 125KB
+    - set(int) 보다 훨씬 작고, 포함 여부 확인은 O(1)
+    """
+
+    __slots__ = ("_bits",)
+
+    def __init__(self, question_ids=()):
+        self._bits = bytearray()
+        for question_id in question_ids:
+            self.add(question_id)
+
+    def add(self, question_id: int) -> None:
+        byte_index = question_id >> 3
+        if byte_index >= len(self._bits):
+            self._bits.extend(bytes(byte_index - len(self._bits) + 1))
+        self._bits[byte_index] |= 1 << (question_id & 7)
+
+    def __contains__(self, question_id: int) -> bool:
+        byte_index = question_id >> 3
+        return byte_index < len(self._bits) and bool(self._bits[byte_index] & (1 << (question_id & 7)))
+
+
+class AssignmentBitmapCache:
+    """
+    📌 user_id → AssignmentBitmap LRU 캐시
+    ---------------------------------------------------------------
+    - 처음 조회할 때만 UserQuestion에서 question id 목록을 읽고,
+      이후에는 배정할 때마다 mark_assigned()로 비트만 갱신
+    - max_users를 넘으면 가장 오래 사용하지 않은 사용자부터 제거
+    """
+
+    def __init__(self, max_users: int):
+        self.max_users = max_users
+        self._bitmaps: OrderedDict[int, AssignmentBitmap] = OrderedDict()
+
+    async def get(self, user_id: int) -> AssignmentBitmap:
+        bitmap = self._bitmaps.get(user_id)
+        if bitmap is not None:
+            self._bitmaps.move_to_end(user_id)
+            return bitmap
+
+        assigned_ids = await UserQuestion.filter(user_id=user_id).values_list("content_id", flat=True)
+        bitmap = AssignmentBitmap(assigned_ids)
+        self.put(user_id, bitmap)
+        return bitmap
+
+    def put(self, user_id: int, bitmap: AssignmentBitmap) -> None:
+        self._bitmaps[user_id] = bitmap
+        self._bitmaps.move_to_end(user_id)
+        while len(self._bitmaps) > self.max_users:
+            self._bitmaps.popitem(last=False)
+
+    def mark_assigned(self, user_id: int, question_id: int) -> None:
+        # 캐시에 없는 사용자는 다음 조회 때 DB에서 다시 읽으므로 무시
+        bitmap = self._bitmaps.get(user_id)
+        if bitmap is not None:
+            bitmap.add(question_id)
+
+    def invalidate(self, user_id: int) -> None:
+        # 다른 워커 / 스케줄러가 배정해서 DB와 어긋난 비트맵 제거 (다음 조회 때 DB에서 다시 읽음)
+        self._bitmaps.pop(user_id, None)
+
+    def clear(self) -> None:
+        self._bitmaps.clear()
 
 
 class QuestionRepository:
@@ -15,69 +86,94 @@ class QuestionRepository:
     """
 
     @staticmethod
-    async def get_random_unassigned_question(user_id: int) -> Optional[Question]:
+    async def get_unassigned_among(user_id: int, question_ids) -> list[Question]:
+        """
+        📌 후보 질문 id 중 사용자가 아직 받지 않은 질문 목록 (쿼리 1번)
+
+        - 호출하는 쪽에서 후보를 균등하게 뽑고 결과 중 하나를 다시 균등하게 고르면
+          받지 않은 질문 전체에서 균등하게 고른 것과 같음 (id 사이 빈 구간의 영향 없음)
+        - PK 조회 + (user_id, content_id) UNIQUE 인덱스만 사용
+        """
+        question_ids = list(question_ids)
+        if not question_ids:
+            return []
+        conn = Question._meta.db
+        question_table = Question._meta.db_table
+        user_question_table = UserQuestion._meta.db_table
+        # 파라미터 순서: 후보 id들, user_id
+        if conn.capabilities.dialect == "postgres":
+            id_params = ", ".join(f"${index}" for index in range(1, len(question_ids) + 1))
+            user_param = f"${len(question_ids) + 1}"
+        else:
+            id_params = ", ".join(["%s"] * len(question_ids))
+            user_param = "%s"
+
+        sql = (
+            f"SELECT q.id, q.content, q.category FROM {question_table} q "
+            f"WHERE q.id IN ({id_params}) AND NOT EXISTS ("
+            f"SELECT 1 FROM {user_question_table} uq "
+            f"WHERE uq.user_id = {user_param} AND uq.content_id = q.id)"
+        )
+        rows = await conn.execute_query_dict(sql, [*question_ids, user_id])
+        return [Question._init_from_db(**row) for row in rows]
+
+    @staticmethod
+    async def get_random_unassigned_question(user_id: int, start_id: int) -> Optional[Question]:
         """
-        📌 특정 사용자에게 아직 주어지지 않은 랜덤 질문 1개 반환
+        📌 특정 사용자에게 아직 주어지지 않은 질문 1개 반환 (NOT EXISTS 안티 조인)
 
         동작 순서:
         ---------------------------------------------------------------
-        1) UserQuestion 테이블에서 user_id가 이미 받은 질문(question_id) 목록 조회
-        2) Question 테이블에서 "이미 받은 질문을 제외한" 질문 목록 조회
-        3) Python random.choice() 로 하나 뽑기 (랜덤)
-        4) 존재하면 Question 객체 1개 반환, 없으면 None 반환
+        1) start_id(호출하는 쪽에서 랜덤으로 고른 id) 이상인 질문 중
+           UserQuestion에 (user_id, question_id) 행이 없는 첫 질문을 PK 순서로 1개 조회
+        2) 없으면 start_id 미만 구간에서 한 번 더 조회 (처음으로 돌아가기)
+        3) 둘 다 없으면 모든 질문을 이미 받은 것 → None
+
+        - 이전 방식처럼 받은 질문 id 목록 전체와 남은 Question 객체 전체를
+          메모리로 가져오지 않고, PK 인덱스 + (user_id, content_id) UNIQUE 인덱스만 사용
+        - LIMIT 1 이므로 읽는 행 수가 사용자 이력/질문 수와 거의 무관
+        - ⚠️ 균등하지 않음: "start_id 이상 첫 번째 받지 않은 질문"을 고르므로 바로 앞에 이미 받은 질문이
+          길게 이어진 질문일수록 더 자주 선택됨 → get_unassigned_among 으로 후보를 찾지 못했을 때만 사용
         """
+        conn = Question._meta.db
+        question_table = Question._meta.db_table
+        user_question_table = UserQuestion._meta.db_table
+        if conn.capabilities.dialect == "postgres":
+            user_param, start_param = "$1", "$2"
+        else:
+            user_param, start_param = "%s", "%s"
 
-        # ---------------------------------------------------------------
-        # [1] 유저가 지금까지 받았던 질문 목록 가져오기
-        #     (N:M 관계 UserQuestion에서 user_id가 받은 question_id 리스트)
-        #
-        # 예시 결과:
-        #     answered_question_ids = [3, 10, 22, 50]
-        #
-        # values_list(... flat=True) → 단순 정수 리스트 형태로 반환.
-        # ---------------------------------------------------------------
-        answered_question_ids = await UserQuestion.filter(
-            user_id=user_id
-        ).values_list("question_id", flat=True)
-
-        # ---------------------------------------------------------------
-        # [2] 아직 받지 않은 질문 목록 가져오기
-        #
-        # id__not_in=answered_question_ids → "이 리스트에 없는 id만 가져와!"
-        #
-        # 예:
-        # Question 테이블에 총 200개가 있다면
-        # 받은 질문 4개 제외하고 → 196개 남음
-        #
-        # 결과는 객체 리스트 형태:
-        #   [Question(id=1), Question(id=5), Question(id=7), ...]
-        # ---------------------------------------------------------------
-        unassigned_questions = await Question.filter(
-            id__not_in=answered_question_ids
-        )
+        for operator in (">=", "<"):
+            sql = (
+                f"SELECT q.id, q.content, q.category FROM {question_table} q "
+                f"WHERE NOT EXISTS ("
+                f"SELECT 1 FROM {user_question_table} uq "
+                f"WHERE uq.user_id = {user_param} AND uq.content_id = q.id"
+                f") AND q.id {operator} {start_param} "
+                f"ORDER BY q.id LIMIT 1"
+            )
+            rows = await conn.execute_query_dict(sql, [user_id, start_id])
+            if rows:
+                # DB에서 읽은 행으로 모델 객체 생성 (Question.raw()와 같은 방식)
+                return Question._init_from_db(**rows[0])
 
-        # ---------------------------------------------------------------
-        # [3] 랜덤 선택
-        # ---------------------------------------------------------------
-        # Python random.choice() 특징:
-        #   - 리스트에서 하나를 무작위로 빠르게 선택
-        #   - DB에서 랜덤 정렬(Order By Random())을 수행하는 것보다 가벼움
-        #
-        # 조건:
-        #   - 리스트가 비어있지 않아야 choice() 사용 가능
-        #
-        # 결과:
-        #   → Question 객체 1개
-        #
-        # 예:
-        #   unassigned_questions → [Q1, Q2, Q3]
-        #   random.choice → Q2 선택
-        # ---------------------------------------------------------------
-        if unassigned_questions:
-            return random.choice(unassigned_questions)
-
-        # ---------------------------------------------------------------
-        # [4] 모든 질문을 다 받았거나 질문 테이블이 비어 있으면 None 반환
-        #     → 서비스에서 이를 catch해서 404 처리 가능
-        # ---------------------------------------------------------------
         return None
+
+    @staticmethod
+    async def get_by_id(question_id: int) -> Optional[Question]:
+        return await Question.get_or_none(id=question_id)
+
+    @staticmethod
+    async def assign(user_id: int, question: Question, assigned_date: Optional[date] = None) -> UserQuestion:
+        # (user, content), (user, assigned_date) UNIQUE 제약으로 중복 배정은 IntegrityError 발생
+        return await UserQuestion.create(
+            user_id=user_id,
+            content_id=question.id,
+            category=question.category,
+            assigned_date=assigned_date,
+        )
+
+    @staticmethod
+    async def get_assigned_on(user_id: int, assigned_date: date) -> Optional[UserQuestion]:
+        # (user_id, assigned_date) UNIQUE 인덱스로 1행 조회
+        return await UserQuestion.get_or_none(user_id=user_id, assigned_date=assigned_date)
@@ -1,4 +1,6 @@
-from pydantic import BaseModel, Field
+from typing import TypedDict
+
+from pydantic import BaseModel, Field, TypeAdapter
 from datetime import datetime
 
 
@@ -19,3 +21,13 @@ class DiaryResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+# 빠른 응답 경로용 행 타입 (DB에서 .values()로 읽은 dict를 검증 없이 직렬화)
+class DiaryRow(TypedDict):
+    id: int
+    title: str
+    content: str
+    created_at: datetime
+    user_id: int
+
+DiaryRowListAdapter = TypeAdapter(list[DiaryRow])
@@ -0,0 +1,16 @@
+from pydantic import BaseModel
+
+from app.schemas.diary import DiaryResponse
+from app.schemas.question import QuestionResponse
+from app.schemas.quote import QuoteResponse
+from app.schemas.user import UserResponse
+
+
+# 홈 화면 (GET /api/v1/home 응답) 스키마
+# 섹션을 불러오지 못하면 해당 값은 null이고, errors에 섹션 이름과 사유("timeout" / "unavailable")가 담김
+class HomeResponse(BaseModel):
+    user: UserResponse
+    diaries: list[DiaryResponse] | None = None
+    quote: QuoteResponse | None = None
+    question: QuestionResponse | None = None
+    errors: dict[str, str] = {}
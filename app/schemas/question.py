@@ -1,14 +1,48 @@
 # app/schemas/question.py
 
-from tortoise.contrib.pydantic import pydantic_model_creator
-# Question 모델을 가져오기 위해 상대 경로 사용
-from app.models.question import Question, UserQuestion
+from datetime import date
 
+from pydantic import BaseModel
 
-# 💡 Question_Pydantic 스키마를 생성합니다. (필수)
-# 이 이름이 app/api/v1/question.py에서 참조되고 있습니다.
-Question_Pydantic = pydantic_model_creator(Question)
 
-# UserQuestion 스키마 (나중에 답변 API에 필요)
-UserQuestion_Pydantic = pydantic_model_creator(UserQuestion)
+# 💡 Question_Pydantic / UserQuestion_Pydantic 스키마는 처음 참조될 때 생성합니다.
+# (pydantic_model_creator는 모델 메타데이터를 읽어 스키마를 만드므로 import 시점에 실행하면 기동이 느려짐)
+_LAZY_SCHEMAS = {
+    "Question_Pydantic": "Question",
+    "UserQuestion_Pydantic": "UserQuestion",  # 나중에 답변 API에 필요
+}
 
+
+def __getattr__(name: str):
+    model_name = _LAZY_SCHEMAS.get(name)
+    if model_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from tortoise.contrib.pydantic import pydantic_model_creator
+    from app.models import question as question_models
+
+    schema = pydantic_model_creator(getattr(question_models, model_name))
+    # 한 번 만든 스키마는 모듈 속성으로 저장 (이후에는 __getattr__을 거치지 않음)
+    globals()[name] = schema
+    return schema
+
+
+# 질문 조회 응답 스키마 (인메모리 카탈로그의 QuestionRecord에서 속성으로 읽음)
+class QuestionResponse(BaseModel):
+    id: int
+    content: str
+    category: str | None
+
+    class Config:
+        from_attributes = True
+
+
+# 카테고리 목록 응답 스키마
+class QuestionCategoryResponse(BaseModel):
+    category: str
+    count: int
+
+
+# 오늘의 질문 응답 스키마
+class TodayQuestionResponse(QuestionResponse):
+    assigned_date: date
@@ -1,4 +1,6 @@
-from pydantic import BaseModel
+from typing import TypedDict
+
+from pydantic import BaseModel, TypeAdapter
 
 # 명언 생성 (POST 요청 본문) 시 사용되는 스키마
 # 사용자가 명언을 DB에 추가할 때 필요한 데이터를 정의
@@ -27,4 +29,30 @@ class QuoteBookmarkResponse(BaseModel):
     quote: QuoteResponse
 
     class Config: # Pydantic 설정 클래스
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+# 인기 명언 (GET /quotes/top 응답) 시 사용되는 스키마
+# 북마크 수(bookmark_count)를 함께 반환
+class QuoteRankResponse(QuoteResponse):
+    bookmark_count: int
+
+# 명언 검색 (GET /quotes/search 응답) 시 사용되는 스키마
+# content 부분 일치 결과와 작가명 자동완성 결과를 함께 반환
+class QuoteSearchResponse(BaseModel):
+    query: str
+    quotes: list[QuoteResponse]
+    authors: list[str]
+    took_us: float
+
+# 빠른 응답 경로용 행 타입 (DB에서 .values()로 읽은 dict를 검증 없이 직렬화)
+class QuoteRow(TypedDict):
+    id: int
+    content: str
+    author: str | None
+
+class QuoteBookmarkRow(TypedDict):
+    id: int
+    quote: QuoteRow
+
+QuoteRowListAdapter = TypeAdapter(list[QuoteRow])
+QuoteBookmarkRowListAdapter = TypeAdapter(list[QuoteBookmarkRow])
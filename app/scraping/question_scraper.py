@@ -1,5 +1,22 @@
+import argparse
+import asyncio
+import csv
+import hashlib
+import json
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from tortoise.transactions import in_transaction
+
+from app.core.cache_bus import TOPIC_QUESTIONS, cache_bus
+from app.db.session import tortoise_context
 from app.models.question import Question
 
+# bulk_create 한 번에 넣을 행 수
+SEED_BATCH_SIZE = 1000
+# .json 팩은 파일 전체를 한 번에 읽으므로 크기 제한 (큰 팩은 .jsonl / .csv 사용)
+JSON_PACK_MAX_BYTES = 10 * 1024 * 1024
+
 QUESTIONS_DATA = [
     {"content": "오늘 하루를 한 단어로 표현한다면 무엇이고, 그 이유는 무엇인가?", "category": "하루 돌아보기"},
     {"content": "오늘 가장 기억에 남는 순간은 언제였나? 왜 특별했나?", "category": "하루 돌아보기"},
@@ -84,16 +101,124 @@ QUESTIONS_DATA = [
 ]
 
 
-async def scrape_and_save_questions():
+def _content_hash(content: str) -> bytes:
+    # 내용 비교는 원문 대신 고정 길이(16바이트) 해시로 (DB의 MD5()와 같은 값)
+    return hashlib.md5(content.encode("utf-8")).digest()
+
+
+async def _existing_content_hashes(conn) -> set[bytes]:
+    """
+    저장된 질문들의 content 해시 (쿼리 1번)
+    - Postgres / MySQL: DB에서 MD5를 계산해서 해시만 읽음 (질문 본문은 가져오지 않음)
+    - 그 외(SQLite 등): content를 읽어서 파이썬에서 계산
+    """
+    table = Question._meta.db_table
+    dialect = conn.capabilities.dialect
+    if dialect == "postgres":
+        sql = f'SELECT decode(md5("content"), \'hex\') AS content_hash FROM "{table}"'
+    elif dialect == "mysql":
+        sql = f"SELECT UNHEX(MD5(`content`)) AS content_hash FROM `{table}`"
+    else:
+        contents = await Question.all().using_db(conn).values_list("content", flat=True)
+        return {_content_hash(content) for content in contents}
+    return {bytes(row["content_hash"]) for row in await conn.execute_query_dict(sql)}
+
+
+def iter_question_pack(path: str | Path) -> Iterator[dict]:
+    """
+    외부 질문 팩 파일을 한 줄(한 행)씩 읽어 {"content", "category"} 로 반환
+    - .jsonl / .ndjson : 한 줄에 JSON 객체 1개 (스트리밍)
+    - .csv             : content, category 헤더를 가진 CSV (스트리밍)
+    - .json            : JSON 배열 (파일 전체를 한 번에 읽으므로 JSON_PACK_MAX_BYTES 이하만 허용)
+    - 큰 질문 팩은 .jsonl 또는 .csv 로 만들어야 메모리 사용량이 파일 크기와 무관함
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+    with path.open(encoding="utf-8", newline="") as f:
+        if suffix in (".jsonl", ".ndjson"):
+            rows = (json.loads(line) for line in f if line.strip())
+        elif suffix == ".csv":
+            rows = csv.DictReader(f)
+        elif suffix == ".json":
+            if path.stat().st_size > JSON_PACK_MAX_BYTES:
+                raise ValueError(f"{path.name} is too large for a .json pack; use .jsonl or .csv")
+            rows = iter(json.load(f))
+        else:
+            raise ValueError(f"Unsupported question pack format: {path.name}")
+
+        for row in rows:
+            content = (row.get("content") or "").strip()
+            if content:
+                yield {"content": content, "category": row.get("category") or None}
+
+
+async def seed_questions(rows: Iterable[dict], batch_size: int = SEED_BATCH_SIZE) -> int:
+    """
+    질문들을 한 트랜잭션 안에서 저장하고, 새로 저장된 개수를 반환
+    1) 기존 질문 content 해시를 쿼리 1번으로 읽음 (Postgres / MySQL은 DB에서 해시 계산)
+    2) 없는 질문만 모아서 batch_size 단위로 bulk_create
+    - 같은 데이터로 여러 번 실행해도 중복 저장되지 않음 (멱등)
+    - Postgres에서는 테이블 잠금으로 동시에 실행된 시딩끼리도 중복 저장 방지
+    """
     saved_count = 0
+    async with in_transaction() as conn:
+        if conn.capabilities.dialect == "postgres":
+            await conn.execute_script(
+                f"LOCK TABLE {Question._meta.db_table} IN SHARE ROW EXCLUSIVE MODE"
+            )
+
+        existing = await _existing_content_hashes(conn)
 
-    for data in QUESTIONS_DATA:
-        exists = await Question.filter(content=data["content"]).exists()
-        if not exists:
-            await Question.create(**data)
-            saved_count += 1
+        batch: list[Question] = []
+        for data in rows:
+            content_hash = _content_hash(data["content"])
+            if content_hash in existing:
+                continue
+            # 같은 팩 안의 중복도 한 번만 저장
+            existing.add(content_hash)
+            batch.append(Question(content=data["content"], category=data.get("category")))
+
+            if len(batch) >= batch_size:
+                await Question.bulk_create(batch, using_db=conn)
+                saved_count += len(batch)
+                batch = []
+
+        if batch:
+            await Question.bulk_create(batch, using_db=conn)
+            saved_count += len(batch)
+
+    return saved_count
+
+
+async def scrape_and_save_questions():
+    saved_count = await seed_questions(QUESTIONS_DATA)
+
+    # 질문 목록이 바뀌었으면 모든 워커의 인메모리 질문 카탈로그 교체
+    if saved_count:
+        await cache_bus.publish(TOPIC_QUESTIONS)
 
     total_count = await Question.all().count()
     return {
         "message": f"Seed completed. Saved {saved_count} new questions. Total: {total_count}"
-    }
\ No newline at end of file
+    }
+
+
+async def seed_question_packs(paths: list[str], batch_size: int = SEED_BATCH_SIZE) -> None:
+    async with tortoise_context():
+        for path in paths:
+            saved_count = await seed_questions(iter_question_pack(path), batch_size)
+            print(f"{path}: saved {saved_count} new questions")
+            if saved_count:
+                # 실행 중인 서버 워커들의 질문 카탈로그 갱신
+                await cache_bus.publish(TOPIC_QUESTIONS)
+        total_count = await Question.all().count()
+        print(f"Total: {total_count}")
+
+
+# 사용법: python -m app.scraping.question_scraper packs/questions.jsonl packs/extra.csv
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="외부 질문 팩(JSONL/CSV, 작은 팩은 JSON)을 DB에 시딩")
+    parser.add_argument("paths", nargs="+", help="질문 팩 파일 경로")
+    parser.add_argument("--batch-size", type=int, default=SEED_BATCH_SIZE)
+    args = parser.parse_args()
+    asyncio.run(seed_question_packs(args.paths, args.batch_size))
@@ -1,9 +1,12 @@
-import httpx
-from bs4 import BeautifulSoup
+from app.core.cache_bus import TOPIC_QUOTES, cache_bus
 from app.models.quote import Quote
 
 #명언 스크래핑 후 database에 저장
 async def scrape_and_save_quotes(pages: int = 5):
+    # httpx / BeautifulSoup은 스크래핑할 때만 필요하므로 여기서 import (워커 기동 시간 단축)
+    import httpx
+    from bs4 import BeautifulSoup
+
     base_url = "https://saramro.com/quotes"
     saved_count = 0
 
@@ -38,6 +41,10 @@ async def scrape_and_save_quotes(pages: int = 5):
                 print(f"Error scraping page {page}: {e}")
                 continue
 
+    # 새 명언이 저장되었으면 모든 워커의 검색 인덱스 / 인기 명언 캐시 갱신
+    if saved_count:
+        await cache_bus.publish(TOPIC_QUOTES)
+
     total_count = await Quote.all().count()
     return {
         "message": f"Scraping completed. Saved {saved_count} new quotes.",
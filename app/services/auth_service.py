@@ -1,9 +1,10 @@
 from fastapi import HTTPException, status
 from tortoise.exceptions import IntegrityError
 
+from app.core.cache_bus import TOPIC_TOKEN_BLACKLIST, cache_bus
 from app.core.config import settings
 from app.models.user import User, TokenBlacklist
-from app.core.security import hash_password, verify_password, create_access_token, create_refresh_token
+from app.core.security import hash_password, verify_password, create_access_token, create_refresh_token, token_digest
 from datetime import datetime, timezone
 
 class AuthService:
@@ -45,3 +46,5 @@ class AuthService:
             expired_at = None
 
         await TokenBlacklist.create(token=token, user=user, expired_at=expired_at)
+        # 모든 워커의 블랙리스트 캐시에서 이 토큰 제거 (다음 요청부터 DB에서 다시 확인)
+        await cache_bus.publish(TOPIC_TOKEN_BLACKLIST, token_digest(token))
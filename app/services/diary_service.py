@@ -1,4 +1,6 @@
+from app.db.routing import read_only
 from app.models.diary import Diary
+from app.repositories.fast_path_repo import FastPathRepository
 from fastapi import HTTPException
 
 
@@ -8,8 +10,24 @@ class DiaryService:
         return await Diary.create(user=user, title=title, content=content)
 
     @staticmethod
+    @read_only
     async def list_for_user(user):
-        return await Diary.filter(user=user).all()
+        # (user_id, created_at) 인덱스를 타도록 최신순 정렬
+        return await Diary.filter(user=user).order_by("-created_at")
+
+    @staticmethod
+    @read_only
+    async def list_recent_for_user(user, limit: int):
+        # 홈 화면용 최신 일기 몇 개
+        return await Diary.filter(user=user).order_by("-created_at").limit(limit)
+
+    @staticmethod
+    @read_only
+    async def list_rows_for_user(user) -> list[dict]:
+        # 빠른 응답 경로용: 모델 객체 없이 응답에 필요한 컬럼만 dict로 조회
+        return await Diary.filter(user=user).order_by("-created_at").values(
+            "id", "title", "content", "created_at", "user_id"
+        )
 
     @staticmethod
     async def get_or_404(diary_id: int):
@@ -18,6 +36,14 @@ class DiaryService:
             raise HTTPException(status_code=404, detail="Diary not found")
         return diary
 
+    @staticmethod
+    async def get_record_or_404(diary_id: int):
+        # 조회 전용: 모델 객체 대신 DiaryRecord (수정/삭제는 get_or_404 사용)
+        diary = await FastPathRepository.get_diary(diary_id)
+        if not diary:
+            raise HTTPException(status_code=404, detail="Diary not found")
+        return diary
+
     @staticmethod
     async def update(diary, data):
         diary.title = data.title or diary.title
@@ -0,0 +1,47 @@
+import asyncio
+import logging
+from typing import Any, Awaitable
+
+from app.core.config import settings
+from app.services.diary_service import DiaryService
+from app.services.question_service import QuestionService
+from app.services.quote_service import QuoteService
+
+logger = logging.getLogger(__name__)
+
+# 섹션별 timeout 설정이 없을 때 사용
+DEFAULT_SECTION_TIMEOUT = 1.0
+
+
+async def _load_section(name: str, awaitable: Awaitable[Any]) -> tuple[Any, str | None]:
+    # 섹션 1개 로드: (값, 에러 사유) 반환. 실패해도 다른 섹션에는 영향 없음
+    timeout = settings.HOME_SECTION_TIMEOUTS.get(name, DEFAULT_SECTION_TIMEOUT)
+    try:
+        return await asyncio.wait_for(awaitable, timeout), None
+    except TimeoutError:
+        logger.warning("Home section %s timed out after %.2fs", name, timeout)
+        return None, "timeout"
+    except Exception:
+        logger.exception("Home section %s failed", name)
+        return None, "unavailable"
+
+
+class HomeService:
+    @staticmethod
+    async def get_home(user) -> dict:
+        # 인증은 라우터에서 1번만 하고, 서로 독립적인 조회를 동시에 실행
+        sections = {
+            "diaries": DiaryService.list_recent_for_user(user, settings.HOME_DIARY_LIMIT),
+            "quote": QuoteService.get_random(),
+            "question": QuestionService.get_random(),
+        }
+        results = await asyncio.gather(
+            *(_load_section(name, awaitable) for name, awaitable in sections.items())
+        )
+
+        home = {"user": user, "errors": {}}
+        for name, (value, error) in zip(sections, results):
+            home[name] = value
+            if error:
+                home["errors"][name] = error
+        return home
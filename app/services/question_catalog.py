@@ -0,0 +1,71 @@
+# app/services/question_catalog.py
+
+import random
+from array import array
+from typing import Iterable, Optional
+
+
+class QuestionRecord:
+    """
+    질문 1개 (DB의 Question 행을 읽기 전용으로 복사한 객체)
+    - __slots__ 로 인스턴스 dict 없이 보관 → 메모리 절약
+    """
+
+    __slots__ = ("id", "content", "category")
+
+    def __init__(self, id: int, content: str, category: Optional[str]):
+        self.id = id
+        self.content = content
+        self.category = category
+
+    def __setattr__(self, name, value):
+        if hasattr(self, name):
+            raise AttributeError(f"QuestionRecord is immutable: {name}")
+        super().__setattr__(name, value)
+
+
+class QuestionCatalog:
+    """
+    인메모리 질문 카탈로그 (불변)
+    - by_id      : id → QuestionRecord
+    - ids        : 전체 id 배열 (랜덤 선택용)
+    - by_category: 카테고리 → id 배열
+    - 시딩 후에는 새 카탈로그를 만들어 참조만 교체 (읽는 쪽은 락 불필요)
+    """
+
+    __slots__ = ("by_id", "ids", "by_category")
+
+    def __init__(self, records: Iterable[QuestionRecord]):
+        by_id: dict[int, QuestionRecord] = {}
+        ids = array("i")
+        by_category: dict[str, array] = {}
+        for record in sorted(records, key=lambda r: r.id):
+            by_id[record.id] = record
+            ids.append(record.id)
+            if record.category:
+                by_category.setdefault(record.category, array("i")).append(record.id)
+        self.by_id = by_id
+        self.ids = ids
+        self.by_category = by_category
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def get(self, question_id: int) -> Optional[QuestionRecord]:
+        return self.by_id.get(question_id)
+
+    def pick_id(self, category: Optional[str] = None) -> Optional[int]:
+        ids = self.ids if category is None else self.by_category.get(category)
+        if not ids:
+            return None
+        return random.choice(ids)
+
+    def pick(self, category: Optional[str] = None) -> Optional[QuestionRecord]:
+        question_id = self.pick_id(category)
+        return None if question_id is None else self.by_id[question_id]
+
+    def categories(self) -> list[dict]:
+        return [
+            {"category": category, "count": len(ids)}
+            for category, ids in self.by_category.items()
+        ]
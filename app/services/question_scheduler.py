@@ -0,0 +1,129 @@
+# app/services/question_scheduler.py
+
+import argparse
+import asyncio
+import logging
+from datetime import date, datetime, time, timedelta
+from typing import Optional
+from zoneinfo import ZoneInfo
+
+from app.core.config import settings
+from app.db.session import tortoise_context
+from app.models.question import UserQuestion
+from app.models.user import User
+from app.repositories.question_repo import AssignmentBitmap
+from app.services.question_service import QuestionService, assignment_bitmaps
+
+logger = logging.getLogger(__name__)
+
+
+class QuestionAssignmentScheduler:
+    # ============================================================
+    # 다음 날 "오늘의 질문" 사전 배정
+    # ------------------------------------------------------------
+    # [동작 방식]
+    #   1) User id 순서로 batch_size명씩 끊어서 처리 (id > 마지막 id, LIMIT)
+    #   2) 해당 날짜에 이미 배정된 사용자는 제외 (쿼리 1번)
+    #   3) 남은 사용자들의 배정 이력을 쿼리 1번으로 읽어 비트맵 구성
+    #   4) 카탈로그에서 받지 않은 질문을 골라 bulk_create 1번으로 저장
+    #      - (user, content), (user, assigned_date) UNIQUE 제약과 충돌하는 행은
+    #        ignore_conflicts로 건너뜀 → 여러 번 실행해도 안전 (멱등)
+    #   5) 저장 후 해당 날짜의 배정을 다시 읽어서 실제로 저장된 행만 세고 비트맵에 반영
+    # ============================================================
+    @staticmethod
+    async def assign_for_date(target_date: date, batch_size: Optional[int] = None) -> dict:
+        batch_size = batch_size or settings.QUESTION_SCHEDULER_BATCH_SIZE
+        catalog = await QuestionService.get_catalog()
+        if not len(catalog):
+            return {"date": target_date.isoformat(), "users": 0, "assigned": 0}
+
+        last_user_id = 0
+        user_count = 0
+        assigned_count = 0
+        while True:
+            user_ids = await User.filter(id__gt=last_user_id).order_by("id").limit(
+                batch_size
+            ).values_list("id", flat=True)
+            if not user_ids:
+                break
+            last_user_id = user_ids[-1]
+            user_count += len(user_ids)
+
+            already_assigned = set(
+                await UserQuestion.filter(
+                    user_id__in=user_ids, assigned_date=target_date
+                ).values_list("user_id", flat=True)
+            )
+            pending = [user_id for user_id in user_ids if user_id not in already_assigned]
+            if not pending:
+                continue
+
+            bitmaps = {user_id: AssignmentBitmap() for user_id in pending}
+            history = await UserQuestion.filter(user_id__in=pending).values_list("user_id", "content_id")
+            for user_id, question_id in history:
+                bitmaps[user_id].add(question_id)
+
+            rows = []
+            for user_id in pending:
+                question = QuestionService.pick_unassigned(catalog, bitmaps[user_id])
+                if question is None:
+                    # 모든 질문을 이미 받은 사용자
+                    continue
+                rows.append(UserQuestion(
+                    user_id=user_id,
+                    content_id=question.id,
+                    category=question.category,
+                    assigned_date=target_date,
+                ))
+
+            if rows:
+                await UserQuestion.bulk_create(rows, ignore_conflicts=True)
+                # 충돌로 건너뛴 행(그 사이 get_today에서 배정된 사용자 등)이 있으므로 실제 저장된 배정을 다시 읽음
+                assigned = await UserQuestion.filter(
+                    user_id__in=[row.user_id for row in rows], assigned_date=target_date
+                ).values_list("user_id", "content_id")
+                created = {(row.user_id, row.content_id) for row in rows}
+                assigned_count += sum(1 for pair in assigned if tuple(pair) in created)
+                for user_id, question_id in assigned:
+                    assignment_bitmaps.mark_assigned(user_id, question_id)
+
+        return {"date": target_date.isoformat(), "users": user_count, "assigned": assigned_count}
+
+    @staticmethod
+    def _seconds_until_next_run(now: datetime) -> float:
+        hour, minute = (int(part) for part in settings.QUESTION_SCHEDULER_RUN_AT.split(":"))
+        next_run = datetime.combine(now.date(), time(hour, minute), tzinfo=now.tzinfo)
+        if next_run <= now:
+            next_run += timedelta(days=1)
+        return (next_run - now).total_seconds()
+
+    @staticmethod
+    async def run_forever() -> None:
+        # main.py startup에서 백그라운드 태스크로 실행
+        # 시작 직후 1번 실행해서 놓친 배정을 채우고, 이후 매일 RUN_AT 시각에 실행
+        tz = ZoneInfo(settings.QUESTION_TIMEZONE)
+        while True:
+            tomorrow = datetime.now(tz).date() + timedelta(days=1)
+            try:
+                result = await QuestionAssignmentScheduler.assign_for_date(tomorrow)
+                logger.info("Pre-assigned questions for %s: %s", tomorrow, result)
+            except Exception:
+                logger.exception("Error pre-assigning questions for %s", tomorrow)
+            await asyncio.sleep(QuestionAssignmentScheduler._seconds_until_next_run(datetime.now(tz)))
+
+
+async def _run_cli(target_date: date, batch_size: int) -> None:
+    async with tortoise_context():
+        result = await QuestionAssignmentScheduler.assign_for_date(target_date, batch_size)
+        print(result)
+
+
+# 사용법: python -m app.services.question_scheduler --date 2026-10-20
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="사용자별 질문을 지정한 날짜로 미리 배정")
+    parser.add_argument("--date", type=date.fromisoformat, default=None, help="배정 날짜 (기본: 내일)")
+    parser.add_argument("--batch-size", type=int, default=settings.QUESTION_SCHEDULER_BATCH_SIZE)
+    args = parser.parse_args()
+
+    target = args.date or datetime.now(ZoneInfo(settings.QUESTION_TIMEZONE)).date() + timedelta(days=1)
+    asyncio.run(_run_cli(target, args.batch_size))
@@ -1,70 +1,190 @@
 # app/services/question_service.py
 
-from app.repositories.question_repo import QuestionRepository
-from app.models.question import Question
+import random
+from datetime import date, datetime
 from typing import Optional
-from tortoise.expressions import RawSQL
+from zoneinfo import ZoneInfo
+
+from tortoise.exceptions import IntegrityError
+
+from app.core.cache_bus import TOPIC_QUESTIONS, cache_bus
+from app.core.config import settings
+from app.repositories.question_repo import AssignmentBitmap, AssignmentBitmapCache, QuestionRepository
+from app.models.question import Question, UserQuestion
+from app.services.question_catalog import QuestionCatalog, QuestionRecord
+
+# 한 번에 랜덤으로 찍어볼 횟수 (모두 이미 받은 질문이면 전체 스캔으로 전환)
+_UNASSIGNED_PROBES = 8
+
+
+# 현재 사용 중인 질문 카탈로그 (startup / 시딩 후 교체)
+_catalog: Optional[QuestionCatalog] = None
+
+# 사용자별 배정 비트맵 캐시
+assignment_bitmaps = AssignmentBitmapCache(settings.QUESTION_ASSIGNMENT_BITMAP_MAX_USERS)
+
 
 class QuestionService:
     # ============================================================
-    # get_random_question()
+    # get_random()
     # ------------------------------------------------------------
     # [역할]
     #   - 데이터베이스에 저장된 자기성찰 질문(questions 테이블) 중
     #     "임의(Random)"로 1개 레코드를 선택하여 반환하는 서비스 로직.
+    #   - category를 넘기면 해당 카테고리 안에서만 고른다.
     #
     # [구조적 위치]
     #   - Controller(API) → Service(여기) → Repository(optional) → Model(DB)
     #   - 즉, 서비스 계층은 "비즈니스 로직"만 담당하며,
     #     가능한 한 API(Route)와 DB Model을 분리하는 것이 목적.
     #
-    # [사용 DB 함수]
-    #   - PostgreSQL의 RANDOM() : 0~1 사이 난수를 생성하는 내장 함수
-    #   - ORDER BY RANDOM()     : 각 레코드마다 난수를 부여한 뒤 정렬
-    #   - LIMIT 1               : 정렬된 결과 중 첫 번째 한 개만 선택
-    #
-    # [Tortoise ORM .raw() 동작 방식]
-    #   - ORM이 아니라 SQL을 직접 실행하는 Raw SQL Query 기능
-    #   - Question.raw("SQL문") 은 모델 Question 객체 리스트로 결과 반환
+    # [동작 방식]
+    #   - 이전 방식: SELECT * FROM question ORDER BY RANDOM() LIMIT 1
+    #       → 모든 행에 난수를 만들고 전체 정렬 (테이블 크기에 비례)
+    #   - 현재 방식: startup 때 읽어둔 인메모리 카탈로그의 id 배열에서
+    #       random.choice()로 고름 → DB I/O 없음, 테이블 크기와 무관
+    #   - id 배열에서 균등하게 고르므로 id 사이에 빈 값이 있어도 분포는 균등
     #
     # [반환 형태]
-    #   - 레코드가 존재하면 Question 객체 반환
+    #   - 질문이 존재하면 QuestionRecord 반환 (id, content, category)
     #   - 비어 있으면 None 반환 (API에서는 404 처리 가능)
     # ============================================================
     @staticmethod
-    async def get_random() -> Optional[Question]:
-        # ------------------------------------------------------------
-        # 1) SQL 직접 실행(RawSQL 사용)
-        #    - ORM 방식이 아닌 직접 SQL 문장을 실행하여 데이터를 가져온다.
-        #    - PostgreSQL RANDOM()을 사용하여, 모든 질문에 난수를 부여한 뒤,
-        #      난수 기준으로 섞어서 맨 위의 한 개만 가져온다.
-        #
-        #    SQL:
-        #       SELECT *
-        #       FROM questions
-        #       ORDER BY RANDOM()
-        #       LIMIT 1;
-        #
-        # 2) Question.raw() 의 반환 타입
-        #    - List[Question] 형태 (0개 또는 1개 이상의 Question 객체)
-        #
-        # 3) result[0] 으로 꺼내는 이유
-        #    - LIMIT 1이므로 최대 1개만 존재
-        # ------------------------------------------------------------
-        result = await Question.raw(
-            "SELECT * FROM question ORDER BY RANDOM() LIMIT 1;"
-        )
-
-        # ------------------------------------------------------------
-        # 4) 만약 데이터가 존재하면 첫 번째 객체 반환
-        #    - RawSQL Query 결과는 리스트 형태로 전달된다.
-        # ------------------------------------------------------------
-        if result:
-            return result[0]
-
-        # ------------------------------------------------------------
-        # 5) 데이터가 없으면 None 반환
-        #    - 서비스 계층에서는 None을 반환하도록 두고,
-        #      API 계층에서 이를 보고 404 응답 등 처리 가능
-        # ------------------------------------------------------------
-        return None
+    async def get_random(category: Optional[str] = None) -> Optional[QuestionRecord]:
+        catalog = await QuestionService.get_catalog()
+        return catalog.pick(category)
+
+    @staticmethod
+    async def get_categories() -> list[dict]:
+        catalog = await QuestionService.get_catalog()
+        return catalog.categories()
+
+    # ============================================================
+    # get_random_unassigned()
+    # ------------------------------------------------------------
+    # [역할]
+    #   - 사용자가 아직 받지 않은 질문 1개를 균등하게 골라 반환
+    #
+    # [동작 방식]
+    #   - 비트맵 사용 시: 카탈로그 id 배열에서 랜덤 id를 찍고 비트맵으로 확인
+    #       → 질문 본문도 카탈로그에 있으므로 Question 행은 읽지 않음
+    #       → 몇 번 찍어도 모두 받은 질문이면 메모리에서 남은 id를 모아 선택
+    #   - 비트맵 미사용 시 (use_bitmap=False 포함):
+    #       → 카탈로그에서 랜덤 id를 몇 개 찍고 그중 받지 않은 질문을 쿼리 1번으로 확인해서 1개 선택 (균등)
+    #       → 모두 받은 질문이면 NOT EXISTS 안티 조인 (LIMIT 1)
+    #         (랜덤 시작 id 이상 첫 질문이라 균등하지 않지만, 대부분의 질문을 받은 사용자에게만 사용됨)
+    # ============================================================
+    @staticmethod
+    async def get_random_unassigned(user_id: int, use_bitmap: bool = True) -> Optional[QuestionRecord | Question]:
+        catalog = await QuestionService.get_catalog()
+        start_id = catalog.pick_id()
+        if start_id is None:
+            return None
+
+        if not use_bitmap or not settings.QUESTION_ASSIGNMENT_BITMAP_ENABLED:
+            candidates = {start_id, *(catalog.pick_id() for _ in range(_UNASSIGNED_PROBES - 1))}
+            unassigned = await QuestionRepository.get_unassigned_among(user_id, candidates)
+            if unassigned:
+                return random.choice(unassigned)
+            return await QuestionRepository.get_random_unassigned_question(user_id, start_id)
+
+        bitmap = await assignment_bitmaps.get(user_id)
+        return QuestionService.pick_unassigned(catalog, bitmap)
+
+    @staticmethod
+    def pick_unassigned(catalog: QuestionCatalog, bitmap: AssignmentBitmap) -> Optional[QuestionRecord]:
+        # 랜덤으로 몇 번 찍어보고, 모두 받은 질문이면 남은 id를 모아서 선택
+        for _ in range(_UNASSIGNED_PROBES):
+            candidate = catalog.pick_id()
+            if candidate is None:
+                return None
+            if candidate not in bitmap:
+                return catalog.get(candidate)
+
+        remaining = [candidate for candidate in catalog.ids if candidate not in bitmap]
+        if not remaining:
+            return None
+        return catalog.get(random.choice(remaining))
+
+    @staticmethod
+    async def assign_random(
+        user_id: int, assigned_date: Optional[date] = None, use_bitmap: bool = True
+    ) -> Optional[UserQuestion]:
+        # 받지 않은 질문을 골라 배정하고 비트맵도 함께 갱신
+        question = await QuestionService.get_random_unassigned(user_id, use_bitmap)
+        if question is None:
+            return None
+        user_question = await QuestionRepository.assign(user_id, question, assigned_date)
+        assignment_bitmaps.mark_assigned(user_id, question.id)
+        return user_question
+
+    # ============================================================
+    # get_today()
+    # ------------------------------------------------------------
+    # [역할]
+    #   - 사용자의 "오늘의 질문" 반환
+    #
+    # [동작 방식]
+    #   - 스케줄러가 미리 배정해 둔 UserQuestion을 (user_id, assigned_date)
+    #     인덱스로 1번 조회 → 질문 본문은 카탈로그에서 꺼냄
+    #   - 아직 배정되지 않았으면 (신규 가입자 등) 그 자리에서 배정
+    # ============================================================
+    @staticmethod
+    async def get_today(user_id: int) -> Optional[dict]:
+        today = datetime.now(ZoneInfo(settings.QUESTION_TIMEZONE)).date()
+        user_question = await QuestionRepository.get_assigned_on(user_id, today)
+        if user_question is None:
+            try:
+                user_question = await QuestionService.assign_random(user_id, today)
+            except IntegrityError:
+                # 1) 동시에 들어온 다른 요청이 먼저 오늘 질문을 배정한 경우 → 그 배정을 사용
+                # 2) 이 워커의 비트맵이 오래돼서 (다른 워커 / 스케줄러가 배정한 질문이 빠져 있어서)
+                #    이미 받은 질문을 고른 경우 → 비트맵을 버리고 DB 안티 조인으로 1번 더 배정
+                user_question = await QuestionRepository.get_assigned_on(user_id, today)
+                if user_question is None:
+                    assignment_bitmaps.invalidate(user_id)
+                    try:
+                        user_question = await QuestionService.assign_random(user_id, today, use_bitmap=False)
+                    except IntegrityError:
+                        user_question = await QuestionRepository.get_assigned_on(user_id, today)
+            if user_question is None:
+                return None
+
+        catalog = await QuestionService.get_catalog()
+        question = catalog.get(user_question.content_id)
+        if question is None:
+            question = await QuestionRepository.get_by_id(user_question.content_id)
+        return {
+            "id": question.id,
+            "content": question.content,
+            "category": question.category,
+            "assigned_date": user_question.assigned_date,
+        }
+
+    # ============================================================
+    # 질문 카탈로그 로드 / 교체
+    # ------------------------------------------------------------
+    #   - startup 때 1번, 질문 시딩 후 1번 reload_catalog() 호출
+    #   - 새 카탈로그를 다 만든 뒤 참조만 바꾸므로 요청 처리 중에도 안전
+    # ============================================================
+    @staticmethod
+    async def get_catalog() -> QuestionCatalog:
+        if _catalog is None:
+            return await QuestionService.reload_catalog()
+        return _catalog
+
+    @staticmethod
+    async def reload_catalog() -> QuestionCatalog:
+        global _catalog
+        rows = await Question.all().values_list("id", "content", "category")
+        _catalog = QuestionCatalog(QuestionRecord(*row) for row in rows)
+        return _catalog
+
+
+async def _on_questions_changed(_payload: str) -> None:
+    # 질문이 추가되면 (다른 워커 / 시딩 CLI에서 추가한 경우 포함) 카탈로그 교체, 비트맵 캐시 비우기
+    await QuestionService.reload_catalog()
+    assignment_bitmaps.clear()
+
+
+cache_bus.subscribe(TOPIC_QUESTIONS, _on_questions_changed)
@@ -0,0 +1,175 @@
+import bisect
+import sys
+import time
+from array import array
+from typing import Iterable, Optional
+
+from app.core.cache_bus import TOPIC_QUOTES, cache_bus
+from app.models.quote import Quote
+
+
+def _normalize(text: str) -> str:
+    # 대소문자와 공백 차이를 무시하고 검색하기 위해 소문자 + 공백 제거
+    return "".join(text.lower().split())
+
+
+def _grams(text: str) -> set[str]:
+    # 1-gram(한 글자 검색용) + 2-gram(두 글자 이상 검색용)
+    grams = set(text)
+    grams.update(text[i:i + 2] for i in range(len(text) - 1))
+    return grams
+
+
+def _contains(ids: array, quote_id: int) -> bool:
+    # 정렬된 id 배열에서 이진 탐색
+    i = bisect.bisect_left(ids, quote_id)
+    return i < len(ids) and ids[i] == quote_id
+
+
+class QuoteSearchIndex:
+    """
+    명언 검색용 불변 인메모리 인덱스
+    - content: n-gram 역색인 (gram → 정렬된 quote id 배열)
+    - author: 정규화된 작가명 정렬 배열 → bisect로 접두사 자동완성
+    - 재빌드 시 새 인스턴스를 만들고 참조만 교체하므로 읽는 쪽은 락이 필요 없음
+    """
+
+    __slots__ = (
+        "_quotes",
+        "_postings",
+        "_author_keys",
+        "_author_names",
+        "build_seconds",
+    )
+
+    def __init__(self, rows: Iterable[tuple[int, str, Optional[str]]]):
+        started = time.perf_counter()
+
+        # id 순으로 넣어야 posting 배열이 별도 정렬 없이 정렬된 상태가 됨
+        quotes: dict[int, tuple[str, Optional[str], str]] = {}
+        postings: dict[str, list[int]] = {}
+        authors: dict[str, str] = {}
+        for quote_id, content, author in sorted(rows, key=lambda row: row[0]):
+            normalized = _normalize(content)
+            quotes[quote_id] = (content, author, normalized)
+            for gram in _grams(normalized):
+                postings.setdefault(gram, []).append(quote_id)
+            if author:
+                authors.setdefault(_normalize(author), author)
+
+        self._quotes = quotes
+        self._postings = {gram: array("i", ids) for gram, ids in postings.items()}
+        self._author_keys = sorted(authors)
+        self._author_names = [authors[key] for key in self._author_keys]
+        self.build_seconds = time.perf_counter() - started
+
+    def search(self, query: str, limit: int = 20) -> list[dict]:
+        normalized = _normalize(query)
+        if not normalized:
+            return []
+
+        if len(normalized) == 1:
+            grams = {normalized}
+        else:
+            grams = {normalized[i:i + 2] for i in range(len(normalized) - 1)}
+
+        lists = []
+        for gram in grams:
+            ids = self._postings.get(gram)
+            if ids is None:
+                return []
+            lists.append(ids)
+        lists.sort(key=len)
+        shortest, others = lists[0], lists[1:]
+
+        results = []
+        for quote_id in shortest:
+            if not all(_contains(ids, quote_id) for ids in others):
+                continue
+            content, author, searchable = self._quotes[quote_id]
+            # 2-gram 교집합은 순서를 보장하지 않으므로 실제 부분 문자열인지 한 번 더 확인
+            if normalized not in searchable:
+                continue
+            results.append({"id": quote_id, "content": content, "author": author})
+            if len(results) >= limit:
+                break
+        return results
+
+    def autocomplete_authors(self, prefix: str, limit: int = 10) -> list[str]:
+        normalized = _normalize(prefix)
+        if not normalized:
+            return []
+        keys = self._author_keys
+        start = bisect.bisect_left(keys, normalized)
+        names = []
+        for i in range(start, min(start + limit, len(keys))):
+            if not keys[i].startswith(normalized):
+                break
+            names.append(self._author_names[i])
+        return names
+
+    def stats(self) -> dict:
+        # 인덱스가 차지하는 메모리 (컨테이너 + 키/값 객체, 대략적인 값)
+        quotes_bytes = sys.getsizeof(self._quotes) + sum(
+            sys.getsizeof(entry)
+            + sys.getsizeof(entry[0])
+            + sys.getsizeof(entry[1])
+            + sys.getsizeof(entry[2])
+            for entry in self._quotes.values()
+        )
+        postings_bytes = sys.getsizeof(self._postings) + sum(
+            sys.getsizeof(gram) + sys.getsizeof(ids) for gram, ids in self._postings.items()
+        )
+        authors_bytes = (
+            sys.getsizeof(self._author_keys)
+            + sys.getsizeof(self._author_names)
+            + sum(sys.getsizeof(name) for name in self._author_keys)
+            + sum(sys.getsizeof(name) for name in self._author_names)
+        )
+        return {
+            "quotes": len(self._quotes),
+            "grams": len(self._postings),
+            "authors": len(self._author_keys),
+            "build_ms": round(self.build_seconds * 1000, 3),
+            "memory_bytes": {
+                "quotes": quotes_bytes,
+                "postings": postings_bytes,
+                "authors": authors_bytes,
+                "total": quotes_bytes + postings_bytes + authors_bytes,
+            },
+        }
+
+
+# 현재 사용 중인 인덱스 (startup / 스크래핑 후 교체)
+_index = QuoteSearchIndex(())
+
+
+class QuoteSearchService:
+    @staticmethod
+    async def rebuild() -> QuoteSearchIndex:
+        # DB에서 한 번에 읽어 새 인덱스를 만든 뒤 참조를 교체
+        global _index
+        rows = await Quote.all().values_list("id", "content", "author")
+        _index = QuoteSearchIndex(rows)
+        return _index
+
+    @staticmethod
+    def search(query: str, limit: int = 20) -> dict:
+        started = time.perf_counter()
+        index = _index
+        quotes = index.search(query, limit)
+        authors = index.autocomplete_authors(query)
+        return {
+            "query": query,
+            "quotes": quotes,
+            "authors": authors,
+            "took_us": round((time.perf_counter() - started) * 1_000_000, 1),
+        }
+
+    @staticmethod
+    def stats() -> dict:
+        return _index.stats()
+
+
+# 명언이 추가되면 (다른 워커에서 스크래핑한 경우 포함) 인덱스 재빌드
+cache_bus.subscribe(TOPIC_QUOTES, lambda _payload: QuoteSearchService.rebuild())
@@ -1,14 +1,29 @@
+import asyncio
+import logging
 import random
 from typing import List
 from fastapi import HTTPException, status
+from tortoise.expressions import F
+from tortoise.transactions import in_transaction
 
+from app.core.cache import TTLCache
+from app.core.cache_bus import TOPIC_BOOKMARKS, TOPIC_QUOTES, cache_bus
+from app.core.config import settings
+from app.db.routing import read_only
 from app.models.quote import Quote
 from app.models.user import User
 from app.models.bookmark import Bookmark
+from app.repositories.fast_path_repo import FastPathRepository, QuoteRecord
+
+logger = logging.getLogger(__name__)
+
+# 인기 명언 조회 결과 캐시 (key: limit)
+_top_quotes_cache = TTLCache(ttl=settings.TOP_QUOTES_CACHE_TTL_SECONDS)
 
 
 class QuoteService:
     @staticmethod
+    @read_only
     async def get_all() -> List[Quote]:
         # skip(offset)과 limit을 사용하여 페이징 처리
         quote = await Quote.all()
@@ -17,16 +32,73 @@ class QuoteService:
         return quote
 
     @staticmethod
-    async def get_random() -> Quote | None:
-        # 전체 명언 개수 확인
-        count = await Quote.all().count()
-        if count == 0:
+    @read_only
+    async def get_all_rows() -> List[dict]:
+        # 빠른 응답 경로용: 모델 객체 없이 dict로 조회
+        return await Quote.all().values("id", "content", "author")
+
+    @staticmethod
+    @read_only
+    async def get_random() -> QuoteRecord | None:
+        # COUNT(*) + OFFSET(전체 스캔) 대신 PK 인덱스로 조회
+        # 1) 가장 큰 id 확인 2) 1 ~ 최대 id 중 랜덤 id와 정확히 일치하는 명언
+        max_id = await FastPathRepository.get_max_quote_id()
+        if not max_id:
             return None
 
-        # 파이썬 random을 사용하여 랜덤 인덱스 생성
-        random_index = random.randint(0, count - 1)
+        # 삭제된 id에 걸리면 다시 뽑음 → 남아 있는 명언 중에서 균등하게 선택
+        for _ in range(settings.RANDOM_QUOTE_ATTEMPTS):
+            quote = await FastPathRepository.get_quote(random.randint(1, max_id))
+            if quote is not None:
+                return quote
+
+        # 빈 id가 많아 계속 빗나간 경우에만 랜덤 id 이상인 첫 명언 (빈 구간 바로 뒤 명언이 조금 더 자주 선택됨)
+        return await FastPathRepository.get_quote_from(random.randint(1, max_id))
+
+    @staticmethod
+    @read_only
+    async def get_top(limit: int = 10) -> List[Quote]:
+        # bookmark_count 인덱스를 타고 상위 N개만 읽음 (Bookmark GROUP BY 없음)
+        cached = _top_quotes_cache.get(limit)
+        if cached is not None:
+            return cached
+
+        quotes = await Quote.filter(bookmark_count__gt=0).order_by(
+            "-bookmark_count", "-id"
+        ).limit(limit)
+        _top_quotes_cache.set(limit, quotes)
+        return quotes
+
+    @staticmethod
+    async def reconcile_bookmark_counts() -> int:
+        # Bookmark 테이블 기준으로 bookmark_count를 다시 계산
+        # 값이 어긋난 행만 갱신하고, 갱신된 행 수를 반환
+        quote_table = Quote._meta.db_table
+        bookmark_table = Bookmark._meta.db_table
+        counted = (
+            f"(SELECT COUNT(*) FROM {bookmark_table} b WHERE b.quote_id = {quote_table}.id)"
+        )
+        async with in_transaction() as conn:
+            updated, _ = await conn.execute_query(
+                f"UPDATE {quote_table} SET bookmark_count = {counted} "
+                f"WHERE bookmark_count <> {counted}"
+            )
 
-        return await Quote.all().offset(random_index).first()
+        if updated:
+            await cache_bus.publish(TOPIC_BOOKMARKS)
+        return updated
+
+    @staticmethod
+    async def run_reconcile_loop(interval_seconds: int) -> None:
+        # 주기적으로 bookmark_count를 보정하는 백그라운드 작업 (main.py startup에서 실행)
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                fixed = await QuoteService.reconcile_bookmark_counts()
+                if fixed:
+                    logger.info("Reconciled bookmark_count for %d quotes", fixed)
+            except Exception:
+                logger.exception("Error reconciling bookmark counts")
 
 
 class QuoteBookmarkService:
@@ -46,8 +118,13 @@ class QuoteBookmarkService:
                 status_code=status.HTTP_409_CONFLICT, detail="Bookmark already exists"
             )
 
-        # 북마크 생성
-        bookmark = await Bookmark.create(user=current_user, quote=quote)
+        # 북마크 생성 + 카운터 증가를 같은 트랜잭션에서 처리
+        async with in_transaction():
+            bookmark = await Bookmark.create(user=current_user, quote=quote)
+            await Quote.filter(id=quote.id).update(
+                bookmark_count=F("bookmark_count") + 1
+            )
+        await cache_bus.publish(TOPIC_BOOKMARKS)
         return bookmark
 
     @staticmethod
@@ -55,12 +132,44 @@ class QuoteBookmarkService:
         # select_related("quote")를 사용하여 연관된 명언 정보를 한 번에 가져옴 (N+1 문제 방지)
         return await Bookmark.filter(user=current_user).select_related("quote")
 
+    @staticmethod
+    async def get_bookmark_rows(current_user: User) -> List[dict]:
+        # 빠른 응답 경로용: JOIN 결과를 dict로 읽어 응답 모양({id, quote: {...}})으로 변환
+        rows = await Bookmark.filter(user=current_user).values(
+            "id",
+            quote_pk="quote__id",
+            quote_content="quote__content",
+            quote_author="quote__author",
+        )
+        return [
+            {
+                "id": row["id"],
+                "quote": {
+                    "id": row["quote_pk"],
+                    "content": row["quote_content"],
+                    "author": row["quote_author"],
+                },
+            }
+            for row in rows
+        ]
+
     @staticmethod
     async def remove_bookmark(current_user: User, quote_id: int) -> None:
-        # 해당 사용자의 해당 명언 북마크 삭제
-        deleted_count = await Bookmark.filter(user=current_user, quote_id=quote_id).delete()
+        # 해당 사용자의 해당 명언 북마크 삭제 + 카운터 감소 (같은 트랜잭션)
+        async with in_transaction():
+            deleted_count = await Bookmark.filter(user=current_user, quote_id=quote_id).delete()
+            if deleted_count:
+                await Quote.filter(id=quote_id).update(
+                    bookmark_count=F("bookmark_count") - deleted_count
+                )
 
         if deleted_count == 0:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Bookmark not found"
             )
+        await cache_bus.publish(TOPIC_BOOKMARKS)
+
+
+# 명언 / 북마크 수가 바뀌면 (다른 워커에서 바뀐 경우 포함) 인기 명언 캐시 비우기
+cache_bus.subscribe(TOPIC_QUOTES, lambda _payload: _top_quotes_cache.clear())
+cache_bus.subscribe(TOPIC_BOOKMARKS, lambda _payload: _top_quotes_cache.clear())
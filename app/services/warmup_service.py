@@ -0,0 +1,69 @@
+import asyncio
+import logging
+import time
+
+from tortoise import connections
+
+from app.core.config import settings
+from app.core.startup import startup_report
+from app.db.pool_stats import pool_monitors
+
+logger = logging.getLogger(__name__)
+
+
+class WarmupService:
+    """
+    워커 기동 마지막 단계의 워밍업 (main.py startup에서 호출)
+    - 첫 사용자 요청이 커넥션 생성 / 캐시 채우기 / 라우트 첫 실행 비용을 떠안지 않도록 미리 실행
+    """
+
+    @staticmethod
+    async def open_pool_connections(count: int) -> None:
+        # 연결마다 count개를 동시에 잡고 있다가 함께 반납 → 풀에 count개의 연결이 열려 있게 됨
+        # (순서대로 잡았다 놓으면 같은 연결 1개만 재사용됨)
+        # 커넥션 풀이 있는 연결만 대상 (SQLite 등 단일 연결은 동시에 여러 번 잡을 수 없음)
+        for name, monitor in pool_monitors.items():
+            held = min(count, monitor.snapshot()["max_size"])
+            if held <= 0:
+                continue
+            client = connections.get(name)
+            barrier = asyncio.Barrier(held)
+
+            async def hold(client=client, barrier=barrier):
+                async with client.acquire_connection():
+                    await barrier.wait()
+
+            await asyncio.gather(*(hold() for _ in range(held)))
+
+    @staticmethod
+    async def request_paths(app, paths: list[str]) -> None:
+        # 앱 내부로 요청을 보내서 미들웨어 / 라우트 / 응답 직렬화 / 서비스 캐시를 한 번씩 실행
+        # (httpx는 워밍업에서만 쓰므로 여기서 import)
+        import httpx
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://warmup") as client:
+            for path in paths:
+                started = time.perf_counter()
+                try:
+                    response = await client.get(path)
+                    status = response.status_code
+                except Exception:
+                    logger.exception("Warmup request %s failed", path)
+                    status = None
+                startup_report.warmup_requests[path] = {
+                    "status": status,
+                    "ms": round((time.perf_counter() - started) * 1000, 2),
+                }
+
+    @staticmethod
+    async def run(app) -> None:
+        try:
+            async with asyncio.timeout(settings.WARMUP_TIMEOUT_SECONDS):
+                with startup_report.phase("warmup_pool"):
+                    await WarmupService.open_pool_connections(settings.WARMUP_POOL_CONNECTIONS)
+                with startup_report.phase("warmup_requests"):
+                    await WarmupService.request_paths(app, settings.WARMUP_PATHS)
+        except TimeoutError:
+            # 워밍업이 늦어져도 요청은 받을 수 있어야 하므로 준비 상태로 전환 (남은 비용은 첫 요청이 부담)
+            logger.warning("Warmup did not finish within %.1fs", settings.WARMUP_TIMEOUT_SECONDS)
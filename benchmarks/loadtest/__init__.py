@@ -0,0 +1,23 @@
+"""
+API 부하 테스트 / 벤치마크
+
+합성 데이터셋을 만들고, 앱을 같은 프로세스(ASGI) 또는 uvicorn으로 띄운 뒤
+여러 가상 사용자가 섞인 트래픽(로그인, 일기 CRUD, 랜덤 명언/질문, 북마크 등)을 보내
+라우트별 처리량과 p50/p95/p99 지연 시간을 JSON으로 기록한다.
+
+사용법:
+    # 같은 프로세스에서 실행 (네트워크 / 서버 오버헤드 제외)
+    python -m benchmarks.loadtest --users 20 --duration 30 --output bench.json
+
+    # uvicorn 워커 2개로 띄워서 실행
+    python -m benchmarks.loadtest --mode uvicorn --workers 2 --output bench.json
+
+    # 이미 떠 있는 서버에 실행
+    python -m benchmarks.loadtest --mode url --base-url http://localhost:8000
+
+    # 저장해 둔 기준 결과와 비교 (p95가 --tolerance 이상 느려진 라우트가 있으면 종료 코드 1)
+    python -m benchmarks.loadtest --baseline baseline.json --tolerance 0.15
+
+.env의 DB를 사용하므로 전용 벤치마크 DB에서 실행할 것.
+같은 --seed 이면 같은 데이터셋과 같은 요청 순서가 만들어진다.
+"""
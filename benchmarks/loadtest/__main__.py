@@ -0,0 +1,124 @@
+import os
+
+# 부하 테스트는 한 IP에서 많은 요청을 보내므로 요청 제한은 끔 (부하 차단은 측정 대상이라 유지)
+# 앱 설정을 읽기 전에 적용해야 하므로 app 모듈 import보다 먼저 둠
+os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+
+import argparse  # noqa: E402
+import asyncio  # noqa: E402
+import json  # noqa: E402
+import platform  # noqa: E402
+import subprocess  # noqa: E402
+import sys  # noqa: E402
+from datetime import datetime, timezone  # noqa: E402
+
+from app.db.session import tortoise_context  # noqa: E402
+from app.models.quote import Quote  # noqa: E402
+from benchmarks.loadtest.dataset import seed_dataset  # noqa: E402
+from benchmarks.loadtest.scenario import run_traffic  # noqa: E402
+from benchmarks.loadtest.server import http_client, in_process_client, uvicorn_server  # noqa: E402
+from benchmarks.loadtest.stats import compare  # noqa: E402
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+async def prepare(args) -> int:
+    async with tortoise_context():
+        if not args.skip_seed:
+            result = await seed_dataset(
+                users=args.users,
+                diaries_per_user=args.diaries_per_user,
+                quotes=args.quotes,
+                questions=args.questions,
+                bookmarks_per_user=args.bookmarks_per_user,
+                seed=args.seed,
+            )
+            print(f"dataset: {result}", file=sys.stderr)
+        return await Quote.all().count()
+
+
+async def run(args, quote_count: int):
+    # 본 측정 전에 짧게 실행해 캐시 / 커넥션 풀 / 인덱스를 데워 둠 (기록하지 않음)
+    async def drive(client):
+        if args.warmup:
+            await run_traffic(client, args.users, args.warmup, args.seed + 1_000_000, quote_count, args.think_time)
+        return await run_traffic(client, args.users, args.duration, args.seed, quote_count, args.think_time)
+
+    if args.mode == "inprocess":
+        async with in_process_client() as client:
+            return await drive(client)
+    if args.mode == "uvicorn":
+        async with uvicorn_server(args.port, args.workers) as base_url:
+            async with http_client(base_url, args.users) as client:
+                return await drive(client)
+    async with http_client(args.base_url, args.users) as client:
+        return await drive(client)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="API 부하 테스트 / 벤치마크")
+    parser.add_argument("--mode", choices=("inprocess", "uvicorn", "url"), default="inprocess")
+    parser.add_argument("--base-url", default="http://localhost:8000", help="--mode url 일 때 대상 서버")
+    parser.add_argument("--port", type=int, default=8765, help="--mode uvicorn 일 때 포트")
+    parser.add_argument("--workers", type=int, default=1, help="--mode uvicorn 일 때 워커 수")
+    parser.add_argument("--users", type=int, default=20, help="동시 가상 사용자 수")
+    parser.add_argument("--duration", type=float, default=30.0, help="측정 시간 (초)")
+    parser.add_argument("--warmup", type=float, default=5.0, help="측정 전 워밍업 시간 (초, 0이면 생략)")
+    parser.add_argument("--think-time", type=float, default=0.0, help="요청 사이 평균 대기 시간 (초)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--diaries-per-user", type=int, default=50)
+    parser.add_argument("--quotes", type=int, default=2000)
+    parser.add_argument("--questions", type=int, default=500)
+    parser.add_argument("--bookmarks-per-user", type=int, default=10)
+    parser.add_argument("--skip-seed", action="store_true", help="데이터셋 생성을 건너뜀")
+    parser.add_argument("--output", help="결과 JSON 파일 경로 (없으면 stdout)")
+    parser.add_argument("--baseline", help="비교할 기준 결과 JSON 파일")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="p95 허용 증가 비율")
+    args = parser.parse_args()
+
+    quote_count = asyncio.run(prepare(args))
+    recorder = asyncio.run(run(args, quote_count))
+
+    report = recorder.report({
+        "mode": args.mode,
+        "workers": args.workers if args.mode == "uvicorn" else None,
+        "users": args.users,
+        "duration_seconds": args.duration,
+        "think_time_seconds": args.think_time,
+        "seed": args.seed,
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "started_at": datetime.now(timezone.utc).isoformat(),
+    })
+
+    exit_code = 0
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            rows = compare(report, json.load(f), args.tolerance)
+        report["comparison"] = rows
+        regressions = [row["route"] for row in rows if row["regression"]]
+        for row in rows:
+            mark = "REGRESSION" if row["regression"] else "ok"
+            print(
+                f"{row['route']:<40} p95 {row['baseline_p95_ms']:>9.2f} -> {row['p95_ms']:>9.2f} ms  {mark}",
+                file=sys.stderr,
+            )
+        if regressions:
+            exit_code = 1
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+import random
+from datetime import datetime, timedelta, timezone
+
+from app.core.security import hash_password
+from app.models.bookmark import Bookmark
+from app.models.diary import Diary
+from app.models.quote import Quote
+from app.models.user import User
+from app.scraping.question_scraper import QUESTIONS_DATA, seed_questions
+from app.services.quote_service import QuoteService
+
+# 벤치마크용 사용자 (username = bench_user_<n>, 비밀번호 공통)
+USERNAME_PREFIX = "bench_user_"
+PASSWORD = "bench-password"
+WORDS = ("오늘", "하루", "마음", "생각", "감사", "친구", "공부", "산책", "커피", "저녁", "바람", "기록")
+
+
+def username(index: int) -> str:
+    return f"{USERNAME_PREFIX}{index}"
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+async def seed_dataset(
+    users: int,
+    diaries_per_user: int,
+    quotes: int,
+    questions: int,
+    bookmarks_per_user: int,
+    seed: int,
+) -> dict:
+    """
+    합성 데이터셋 생성 (같은 seed이면 같은 데이터)
+    - 이미 벤치마크 사용자가 충분히 있으면 건너뜀
+    - Tortoise가 초기화된 상태에서 호출
+    """
+    existing = await User.filter(username__startswith=USERNAME_PREFIX).count()
+    if existing >= users:
+        return {"skipped": True, "users": existing}
+
+    rng = random.Random(seed)
+    # pbkdf2 해시는 비싸므로 1번만 계산해서 모든 사용자에 사용
+    password_hash = hash_password(PASSWORD)
+
+    await User.bulk_create(
+        [
+            User(username=username(i), password_hash=password_hash, email=f"{username(i)}@example.com")
+            for i in range(existing, users)
+        ],
+        batch_size=1000,
+    )
+    user_ids = await User.filter(username__startswith=USERNAME_PREFIX).values_list("id", flat=True)
+
+    quote_count = await Quote.all().count()
+    if quote_count < quotes:
+        await Quote.bulk_create(
+            [
+                Quote(content=f"{_sentence(rng, 12)} #{i}", author=f"작가 {rng.randrange(200)}")
+                for i in range(quote_count, quotes)
+            ],
+            batch_size=1000,
+        )
+    quote_ids = await Quote.all().values_list("id", flat=True)
+
+    question_rows = list(QUESTIONS_DATA) + [
+        {"content": f"{_sentence(rng, 8)}? #{i}", "category": rng.choice(QUESTIONS_DATA)["category"]}
+        for i in range(max(0, questions - len(QUESTIONS_DATA)))
+    ]
+    await seed_questions(question_rows)
+
+    now = datetime.now(timezone.utc)
+    diaries = []
+    bookmarks = []
+    for user_id in user_ids:
+        for i in range(diaries_per_user):
+            diaries.append(Diary(
+                user_id=user_id,
+                title=_sentence(rng, 3),
+                content=_sentence(rng, 60),
+                created_at=now - timedelta(minutes=rng.randrange(60 * 24 * 365)),
+            ))
+        for quote_id in rng.sample(quote_ids, min(bookmarks_per_user, len(quote_ids))):
+            bookmarks.append(Bookmark(user_id=user_id, quote_id=quote_id))
+    await Diary.bulk_create(diaries, batch_size=1000)
+    await Bookmark.bulk_create(bookmarks, batch_size=1000, ignore_conflicts=True)
+    await QuoteService.reconcile_bookmark_counts()
+
+    return {
+        "skipped": False,
+        "users": len(user_ids),
+        "quotes": len(quote_ids),
+        "diaries": len(diaries),
+        "bookmarks": len(bookmarks),
+    }
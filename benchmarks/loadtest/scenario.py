@@ -0,0 +1,158 @@
+import asyncio
+import random
+import time
+from typing import Optional
+
+import httpx
+
+from benchmarks.loadtest.dataset import PASSWORD, WORDS, username
+from benchmarks.loadtest.stats import Recorder
+
+# (가중치, 동작 이름) — 읽기 위주의 일반적인 사용 패턴
+ACTIONS = (
+    (20, "list_diaries"),
+    (10, "get_diary"),
+    (8, "create_diary"),
+    (4, "update_diary"),
+    (3, "delete_diary"),
+    (15, "random_quote"),
+    (10, "random_question"),
+    (5, "today_question"),
+    (5, "top_quotes"),
+    (5, "search_quotes"),
+    (6, "list_bookmarks"),
+    (5, "toggle_bookmark"),
+    (4, "me"),
+    (8, "home"),
+)
+
+
+class VirtualUser:
+    """
+    로그인 후 deadline까지 가중치에 따라 동작을 골라 요청을 보내는 가상 사용자
+    - 사용자마다 Random(seed + index)를 써서 실행할 때마다 같은 요청 순서를 만듦
+    """
+
+    def __init__(self, client: httpx.AsyncClient, recorder: Recorder, index: int, seed: int, quote_count: int):
+        self.client = client
+        self.recorder = recorder
+        self.username = username(index)
+        self.rng = random.Random(seed + index)
+        self.quote_count = max(1, quote_count)
+        self.headers: dict[str, str] = {}
+        self.diary_ids: list[int] = []
+        self.bookmarked: set[int] = set()
+        weights, names = zip(*((weight, name) for weight, name in ACTIONS))
+        self.weights = weights
+        self.actions = [getattr(self, name) for name in names]
+
+    async def request(self, route: str, method: str, url: str, expected=(200,), **kwargs) -> Optional[httpx.Response]:
+        started = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, headers=self.headers, **kwargs)
+        except httpx.HTTPError:
+            self.recorder.record(route, time.perf_counter() - started, 0, False)
+            return None
+        self.recorder.record(route, time.perf_counter() - started, response.status_code, response.status_code in expected)
+        return response
+
+    async def run(self, deadline: float, think_time: float) -> None:
+        await self.login()
+        if not self.headers:
+            return
+        while time.monotonic() < deadline:
+            action = self.rng.choices(self.actions, weights=self.weights)[0]
+            await action()
+            if think_time:
+                await asyncio.sleep(self.rng.uniform(0, think_time * 2))
+
+    # ------------------------------------------------------------
+    # 동작
+    # ------------------------------------------------------------
+    async def login(self) -> None:
+        response = await self.request(
+            "POST /auth/login", "POST", "/auth/login", json={"username": self.username, "password": PASSWORD}
+        )
+        if response is not None and response.status_code == 200:
+            self.headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    async def me(self) -> None:
+        await self.request("GET /auth/me", "GET", "/auth/me")
+
+    async def home(self) -> None:
+        await self.request("GET /api/v1/home", "GET", "/api/v1/home")
+
+    async def list_diaries(self) -> None:
+        response = await self.request("GET /api/v1/diaries/", "GET", "/api/v1/diaries/")
+        if response is not None and response.status_code == 200 and not self.diary_ids:
+            self.diary_ids = [row["id"] for row in response.json()[:50]]
+
+    async def get_diary(self) -> None:
+        if not self.diary_ids:
+            return await self.list_diaries()
+        diary_id = self.rng.choice(self.diary_ids)
+        await self.request("GET /api/v1/diaries/{diary_id}", "GET", f"/api/v1/diaries/{diary_id}")
+
+    async def create_diary(self) -> None:
+        payload = {"title": " ".join(self.rng.choices(WORDS, k=3)), "content": " ".join(self.rng.choices(WORDS, k=60))}
+        response = await self.request("POST /api/v1/diaries/", "POST", "/api/v1/diaries/", expected=(201,), json=payload)
+        if response is not None and response.status_code == 201:
+            self.diary_ids.append(response.json()["id"])
+
+    async def update_diary(self) -> None:
+        if not self.diary_ids:
+            return await self.create_diary()
+        diary_id = self.rng.choice(self.diary_ids)
+        await self.request(
+            "PUT /api/v1/diaries/{diary_id}", "PUT", f"/api/v1/diaries/{diary_id}",
+            json={"content": " ".join(self.rng.choices(WORDS, k=40))},
+        )
+
+    async def delete_diary(self) -> None:
+        if not self.diary_ids:
+            return await self.create_diary()
+        diary_id = self.diary_ids.pop(self.rng.randrange(len(self.diary_ids)))
+        await self.request("DELETE /api/v1/diaries/{diary_id}", "DELETE", f"/api/v1/diaries/{diary_id}")
+
+    async def random_quote(self) -> None:
+        await self.request("GET /quotes/random", "GET", "/quotes/random")
+
+    async def random_question(self) -> None:
+        await self.request("GET /random", "GET", "/random")
+
+    async def today_question(self) -> None:
+        await self.request("GET /questions/today", "GET", "/questions/today")
+
+    async def top_quotes(self) -> None:
+        await self.request("GET /quotes/top", "GET", "/quotes/top", params={"limit": 10})
+
+    async def search_quotes(self) -> None:
+        await self.request("GET /quotes/search", "GET", "/quotes/search", params={"q": self.rng.choice(WORDS)})
+
+    async def list_bookmarks(self) -> None:
+        await self.request("GET /quotes/bookmarks", "GET", "/quotes/bookmarks")
+
+    async def toggle_bookmark(self) -> None:
+        if self.bookmarked and self.rng.random() < 0.5:
+            quote_id = self.bookmarked.pop()
+            await self.request(
+                "DELETE /quotes/{quote_id}/bookmark", "DELETE", f"/quotes/{quote_id}/bookmark", expected=(200, 204, 404)
+            )
+            return
+        quote_id = self.rng.randint(1, self.quote_count)
+        response = await self.request(
+            "POST /quotes/{quote_id}/bookmark", "POST", f"/quotes/{quote_id}/bookmark", expected=(200, 404, 409)
+        )
+        if response is not None and response.status_code == 200:
+            self.bookmarked.add(quote_id)
+
+
+async def run_traffic(
+    client: httpx.AsyncClient, users: int, duration: float, seed: int, quote_count: int, think_time: float = 0.0
+) -> Recorder:
+    recorder = Recorder()
+    deadline = time.monotonic() + duration
+    virtual_users = [VirtualUser(client, recorder, index, seed, quote_count) for index in range(users)]
+    await asyncio.gather(*(user.run(deadline, think_time) for user in virtual_users))
+    recorder.finish()
+    return recorder
@@ -0,0 +1,93 @@
+import time
+from typing import Optional
+
+
+def percentile(sorted_samples: list[float], fraction: float) -> float:
+    # nearest-rank 방식
+    if not sorted_samples:
+        return 0.0
+    index = min(len(sorted_samples) - 1, max(0, int(round(fraction * len(sorted_samples))) - 1))
+    return sorted_samples[index]
+
+
+class RouteStats:
+    __slots__ = ("latencies", "errors", "statuses")
+
+    def __init__(self):
+        self.latencies: list[float] = []
+        self.errors = 0
+        self.statuses: dict[int, int] = {}
+
+    def summary(self, elapsed: float) -> dict:
+        samples = sorted(self.latencies)
+        count = len(samples)
+        return {
+            "count": count,
+            "errors": self.errors,
+            "rps": round(count / elapsed, 2) if elapsed else 0.0,
+            "mean_ms": round(sum(samples) / count * 1000, 3) if count else 0.0,
+            "p50_ms": round(percentile(samples, 0.50) * 1000, 3),
+            "p95_ms": round(percentile(samples, 0.95) * 1000, 3),
+            "p99_ms": round(percentile(samples, 0.99) * 1000, 3),
+            "max_ms": round(samples[-1] * 1000, 3) if count else 0.0,
+            "statuses": {str(code): n for code, n in sorted(self.statuses.items())},
+        }
+
+
+class Recorder:
+    """라우트("GET /quotes/random" 형식)별 지연 시간 / 상태 코드 기록"""
+
+    def __init__(self):
+        self.routes: dict[str, RouteStats] = {}
+        self.started = time.perf_counter()
+        self.finished: Optional[float] = None
+
+    def record(self, route: str, seconds: float, status_code: int, ok: bool) -> None:
+        stats = self.routes.get(route)
+        if stats is None:
+            stats = self.routes[route] = RouteStats()
+        stats.latencies.append(seconds)
+        stats.statuses[status_code] = stats.statuses.get(status_code, 0) + 1
+        if not ok:
+            stats.errors += 1
+
+    def finish(self) -> None:
+        self.finished = time.perf_counter()
+
+    def report(self, meta: dict) -> dict:
+        elapsed = (self.finished or time.perf_counter()) - self.started
+        total = RouteStats()
+        for stats in self.routes.values():
+            total.latencies.extend(stats.latencies)
+            total.errors += stats.errors
+            for code, n in stats.statuses.items():
+                total.statuses[code] = total.statuses.get(code, 0) + n
+        return {
+            "meta": {**meta, "elapsed_seconds": round(elapsed, 3)},
+            "total": total.summary(elapsed),
+            "routes": {route: self.routes[route].summary(elapsed) for route in sorted(self.routes)},
+        }
+
+
+def compare(report: dict, baseline: dict, tolerance: float, min_count: int = 20) -> list[dict]:
+    """
+    기준 결과 대비 라우트별 p95 / p99 / 처리량 변화
+    - p95가 (1 + tolerance)배 이상 느려졌거나 에러가 새로 생긴 라우트는 regression=True
+    - 표본이 min_count보다 적은 라우트는 판단하지 않음
+    """
+    rows = []
+    for route, current in report["routes"].items():
+        before = baseline.get("routes", {}).get(route)
+        if before is None:
+            continue
+        row = {"route": route}
+        for key in ("p50_ms", "p95_ms", "p99_ms", "rps"):
+            row[key] = current[key]
+            row[f"baseline_{key}"] = before[key]
+            row[f"{key}_ratio"] = round(current[key] / before[key], 3) if before[key] else None
+        enough = current["count"] >= min_count and before["count"] >= min_count
+        slower = row["p95_ms_ratio"] is not None and row["p95_ms_ratio"] > 1 + tolerance
+        new_errors = current["errors"] > 0 and before["errors"] == 0
+        row["regression"] = enough and (slower or new_errors)
+        rows.append(row)
+    return rows
@@ -0,0 +1,107 @@
+"""
+목록 응답 직렬화 비용 마이크로 벤치마크 (1k 행 기준)
+
+사용법:
+    python -m benchmarks.serialization
+    python -m benchmarks.serialization --rows 5000 --rounds 200
+
+비교 대상:
+    - fastapi   : response_model 검증(from_attributes) + jsonable_encoder + json.dumps (기본 경로)
+    - adapter   : TypedDict TypeAdapter.dump_json (FAST_JSON_RESPONSES 경로)
+    - orjson    : orjson.dumps (설치되어 있을 때만)
+"""
+import argparse
+import json
+import statistics
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from app.schemas.diary import DiaryResponse, DiaryRowListAdapter
+from app.schemas.quote import QuoteBookmarkResponse, QuoteBookmarkRowListAdapter
+
+
+def _diary_rows(count: int) -> list[dict]:
+    now = datetime(2026, 1, 1, 9, 0, 0)
+    return [
+        {
+            "id": i,
+            "title": f"일기 제목 {i}",
+            "content": "오늘 있었던 일을 적어 본다. " * 8,
+            "created_at": now - timedelta(minutes=i),
+            "user_id": 1,
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+def _bookmark_rows(count: int) -> list[dict]:
+    return [
+        {
+            "id": i,
+            "quote": {"id": i * 3, "content": "작은 습관이 큰 변화를 만든다. " * 2, "author": f"작가 {i % 50}"},
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+def _as_objects(rows: list[dict]) -> list[SimpleNamespace]:
+    # ORM 모델 인스턴스 대용 (속성 접근)
+    return [
+        SimpleNamespace(**{k: SimpleNamespace(**v) if isinstance(v, dict) else v for k, v in row.items()})
+        for row in rows
+    ]
+
+
+def _measure(fn, rounds: int) -> float:
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+def _report(label: str, seconds: float, rows: int) -> None:
+    per_1k = seconds * 1_000_000 * 1000 / rows
+    print(f"{label:<32} {per_1k:10.1f} us / 1k rows")
+
+
+def bench(name: str, response_model, adapter: TypeAdapter, rows: list[dict], rounds: int) -> None:
+    objects = _as_objects(rows)
+    validator = TypeAdapter(list[response_model])
+
+    def fastapi_path():
+        validated = validator.validate_python(objects, from_attributes=True)
+        json.dumps(jsonable_encoder(validated)).encode()
+
+    def adapter_path():
+        adapter.dump_json(rows)
+
+    print(f"[{name}] rows={len(rows):,}")
+    _report("fastapi (validate+encode)", _measure(fastapi_path, rounds), len(rows))
+    _report("TypeAdapter.dump_json", _measure(adapter_path, rounds), len(rows))
+
+    try:
+        import orjson
+    except ImportError:
+        print(f"{'orjson':<32} (not installed)")
+    else:
+        _report("orjson.dumps", _measure(lambda: orjson.dumps(rows), rounds), len(rows))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="목록 응답 직렬화 벤치마크")
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=100)
+    args = parser.parse_args()
+
+    bench("diaries", DiaryResponse, DiaryRowListAdapter, _diary_rows(args.rows), args.rounds)
+    bench("bookmarks", QuoteBookmarkResponse, QuoteBookmarkRowListAdapter, _bookmark_rows(args.rows), args.rounds)
+
+
+if __name__ == "__main__":
+    main()
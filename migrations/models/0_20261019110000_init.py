@@ -0,0 +1,183 @@
+"""
+초기 스키마 (모델에 성능 관련 컬럼 / 인덱스를 추가하기 전 상태)
+
+- `aerich init-db`는 migrations/models 가 비어 있어야 실행되므로 초기 스키마를 직접 포함
+- 모든 문장이 CREATE TABLE IF NOT EXISTS 이므로
+  - 새 DB: 테이블을 만들고 이후 마이그레이션(1_, 2_)이 현재 모델 상태까지 올림
+  - 이전에 generate_schemas로 만든 운영 DB: aerich 테이블만 새로 생기고 나머지는 그대로
+- 사용법: `aerich upgrade` (새 DB / 기존 DB 동일)
+"""
+from tortoise import BaseDBAsyncClient
+
+SCHEMA = {
+    "postgres": """
+        CREATE TABLE IF NOT EXISTS "user" (
+            "id" SERIAL NOT NULL PRIMARY KEY,
+            "username" VARCHAR(50) NOT NULL UNIQUE,
+            "password_hash" VARCHAR(255) NOT NULL,
+            "email" VARCHAR(255)
+        );
+        CREATE TABLE IF NOT EXISTS "diary" (
+            "id" SERIAL NOT NULL PRIMARY KEY,
+            "title" VARCHAR(100) NOT NULL,
+            "content" TEXT NOT NULL,
+            "created_at" TIMESTAMPTZ NOT NULL,
+            "user_id" INT NOT NULL REFERENCES "user" ("id") ON DELETE CASCADE
+        );
+        CREATE TABLE IF NOT EXISTS "tokenblacklist" (
+            "id" SERIAL NOT NULL PRIMARY KEY,
+            "token" TEXT NOT NULL,
+            "expired_at" TIMESTAMPTZ,
+            "user_id" INT NOT NULL REFERENCES "user" ("id") ON DELETE CASCADE
+        );
+        CREATE TABLE IF NOT EXISTS "quote" (
+            "id" SERIAL NOT NULL PRIMARY KEY,
+            "content" TEXT NOT NULL,
+            "author" VARCHAR(100)
+        );
+        CREATE TABLE IF NOT EXISTS "bookmark" (
+            "id" SERIAL NOT NULL PRIMARY KEY,
+            "quote_id" INT NOT NULL REFERENCES "quote" ("id") ON DELETE CASCADE,
+            "user_id" INT NOT NULL REFERENCES "user" ("id") ON DELETE CASCADE,
+            CONSTRAINT "uid_bookmark_user_id_46416a" UNIQUE ("user_id", "quote_id")
+        );
+        CREATE TABLE IF NOT EXISTS "question" (
+            "id" SERIAL NOT NULL PRIMARY KEY,
+            "content" TEXT NOT NULL,
+            "category" VARCHAR(50)
+        );
+        COMMENT ON TABLE "question" IS 'QUESTIONS 테이블';
+        CREATE TABLE IF NOT EXISTS "userquestion" (
+            "id" SERIAL NOT NULL PRIMARY KEY,
+            "category" VARCHAR(50),
+            "answer_content" TEXT,
+            "answered_at" TIMESTAMPTZ,
+            "content_id" INT NOT NULL REFERENCES "question" ("id") ON DELETE CASCADE,
+            "user_id" INT NOT NULL REFERENCES "user" ("id") ON DELETE CASCADE,
+            CONSTRAINT "uid_userquestio_user_id_74c362" UNIQUE ("user_id", "content_id")
+        );
+        COMMENT ON TABLE "userquestion" IS 'USER_QUESTIONS 테이블';
+        CREATE TABLE IF NOT EXISTS "aerich" (
+            "id" SERIAL NOT NULL PRIMARY KEY,
+            "version" VARCHAR(255) NOT NULL,
+            "app" VARCHAR(100) NOT NULL,
+            "content" JSONB NOT NULL
+        );""",
+    "mysql": """
+        CREATE TABLE IF NOT EXISTS `user` (
+            `id` INT NOT NULL PRIMARY KEY AUTO_INCREMENT,
+            `username` VARCHAR(50) NOT NULL UNIQUE,
+            `password_hash` VARCHAR(255) NOT NULL,
+            `email` VARCHAR(255)
+        ) CHARACTER SET utf8mb4;
+        CREATE TABLE IF NOT EXISTS `diary` (
+            `id` INT NOT NULL PRIMARY KEY AUTO_INCREMENT,
+            `title` VARCHAR(100) NOT NULL,
+            `content` LONGTEXT NOT NULL,
+            `created_at` DATETIME(6) NOT NULL,
+            `user_id` INT NOT NULL,
+            CONSTRAINT `fk_diary_user_9023c106` FOREIGN KEY (`user_id`) REFERENCES `user` (`id`) ON DELETE CASCADE
+        ) CHARACTER SET utf8mb4;
+        CREATE TABLE IF NOT EXISTS `tokenblacklist` (
+            `id` INT NOT NULL PRIMARY KEY AUTO_INCREMENT,
+            `token` LONGTEXT NOT NULL,
+            `expired_at` DATETIME(6),
+            `user_id` INT NOT NULL,
+            CONSTRAINT `fk_tokenbla_user_e42fe5ff` FOREIGN KEY (`user_id`) REFERENCES `user` (`id`) ON DELETE CASCADE
+        ) CHARACTER SET utf8mb4;
+        CREATE TABLE IF NOT EXISTS `quote` (
+            `id` INT NOT NULL PRIMARY KEY AUTO_INCREMENT,
+            `content` LONGTEXT NOT NULL,
+            `author` VARCHAR(100)
+        ) CHARACTER SET utf8mb4;
+        CREATE TABLE IF NOT EXISTS `bookmark` (
+            `id` INT NOT NULL PRIMARY KEY AUTO_INCREMENT,
+            `quote_id` INT NOT NULL,
+            `user_id` INT NOT NULL,
+            UNIQUE KEY `uid_bookmark_user_id_46416a` (`user_id`, `quote_id`),
+            CONSTRAINT `fk_bookmark_quote_921adefc` FOREIGN KEY (`quote_id`) REFERENCES `quote` (`id`) ON DELETE CASCADE,
+            CONSTRAINT `fk_bookmark_user_43c4ec40` FOREIGN KEY (`user_id`) REFERENCES `user` (`id`) ON DELETE CASCADE
+        ) CHARACTER SET utf8mb4;
+        CREATE TABLE IF NOT EXISTS `question` (
+            `id` INT NOT NULL PRIMARY KEY AUTO_INCREMENT,
+            `content` LONGTEXT NOT NULL,
+            `category` VARCHAR(50)
+        ) CHARACTER SET utf8mb4 COMMENT='QUESTIONS 테이블';
+        CREATE TABLE IF NOT EXISTS `userquestion` (
+            `id` INT NOT NULL PRIMARY KEY AUTO_INCREMENT,
+            `category` VARCHAR(50),
+            `answer_content` LONGTEXT,
+            `answered_at` DATETIME(6),
+            `content_id` INT NOT NULL,
+            `user_id` INT NOT NULL,
+            UNIQUE KEY `uid_userquestio_user_id_74c362` (`user_id`, `content_id`),
+            CONSTRAINT `fk_userques_question_cbb62f06` FOREIGN KEY (`content_id`) REFERENCES `question` (`id`) ON DELETE CASCADE,
+            CONSTRAINT `fk_userques_user_29f4f3b0` FOREIGN KEY (`user_id`) REFERENCES `user` (`id`) ON DELETE CASCADE
+        ) CHARACTER SET utf8mb4 COMMENT='USER_QUESTIONS 테이블';
+        CREATE TABLE IF NOT EXISTS `aerich` (
+            `id` INT NOT NULL PRIMARY KEY AUTO_INCREMENT,
+            `version` VARCHAR(255) NOT NULL,
+            `app` VARCHAR(100) NOT NULL,
+            `content` JSON NOT NULL
+        ) CHARACTER SET utf8mb4;""",
+    "sqlite": """
+        CREATE TABLE IF NOT EXISTS "user" (
+            "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+            "username" VARCHAR(50) NOT NULL UNIQUE,
+            "password_hash" VARCHAR(255) NOT NULL,
+            "email" VARCHAR(255)
+        );
+        CREATE TABLE IF NOT EXISTS "diary" (
+            "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+            "title" VARCHAR(100) NOT NULL,
+            "content" TEXT NOT NULL,
+            "created_at" TIMESTAMP NOT NULL,
+            "user_id" INT NOT NULL REFERENCES "user" ("id") ON DELETE CASCADE
+        );
+        CREATE TABLE IF NOT EXISTS "tokenblacklist" (
+            "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+            "token" TEXT NOT NULL,
+            "expired_at" TIMESTAMP,
+            "user_id" INT NOT NULL REFERENCES "user" ("id") ON DELETE CASCADE
+        );
+        CREATE TABLE IF NOT EXISTS "quote" (
+            "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+            "content" TEXT NOT NULL,
+            "author" VARCHAR(100)
+        );
+        CREATE TABLE IF NOT EXISTS "bookmark" (
+            "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+            "quote_id" INT NOT NULL REFERENCES "quote" ("id") ON DELETE CASCADE,
+            "user_id" INT NOT NULL REFERENCES "user" ("id") ON DELETE CASCADE,
+            CONSTRAINT "uid_bookmark_user_id_46416a" UNIQUE ("user_id", "quote_id")
+        );
+        CREATE TABLE IF NOT EXISTS "question" (
+            "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+            "content" TEXT NOT NULL,
+            "category" VARCHAR(50)
+        ) /* QUESTIONS 테이블 */;
+        CREATE TABLE IF NOT EXISTS "userquestion" (
+            "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+            "category" VARCHAR(50),
+            "answer_content" TEXT,
+            "answered_at" TIMESTAMP,
+            "content_id" INT NOT NULL REFERENCES "question" ("id") ON DELETE CASCADE,
+            "user_id" INT NOT NULL REFERENCES "user" ("id") ON DELETE CASCADE,
+            CONSTRAINT "uid_userquestio_user_id_74c362" UNIQUE ("user_id", "content_id")
+        ) /* USER_QUESTIONS 테이블 */;
+        CREATE TABLE IF NOT EXISTS "aerich" (
+            "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+            "version" VARCHAR(255) NOT NULL,
+            "app" VARCHAR(100) NOT NULL,
+            "content" JSON NOT NULL
+        );""",
+}
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return SCHEMA[db.capabilities.dialect]
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    # 초기 스키마는 되돌리지 않음 (테이블 삭제는 직접 실행)
+    return ""
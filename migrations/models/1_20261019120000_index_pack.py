@@ -0,0 +1,152 @@
+"""
+인덱스 팩 마이그레이션
+
+- 0_*_init.py(초기 스키마) 이후 모델에 추가된 컬럼 / 인덱스를 기존 DB에도 만듦
+  - 컬럼: quote.bookmark_count, userquestion.assigned_date
+  - 모델 인덱스: diary(user_id, created_at), quote(bookmark_count, id), question(category),
+    UNIQUE userquestion(user_id, assigned_date) ← 스케줄러 bulk_create(ignore_conflicts)의 멱등성
+  - 인덱스 이름은 Tortoise가 모델에서 만드는 이름과 같게 둠
+    → generate_schemas 등으로 이미 만들어진 DB에서는 건너뜀 (중복 인덱스 없음)
+- 모든 문장은 이미 있으면 건너뛰므로 여러 번 실행해도 안전
+- PostgreSQL
+  - 운영 중인 테이블을 잠그지 않도록 CREATE INDEX CONCURRENTLY 사용
+  - CONCURRENTLY는 트랜잭션 안이나 여러 문장을 한 번에 보내는 쿼리에서 실행할 수 없으므로
+    RUN_IN_TRANSACTION = False로 두고 upgrade()에서 문장을 하나씩 실행함
+  - 중간에 실패하면 INVALID 인덱스가 남을 수 있으므로 해당 인덱스를 DROP 한 뒤 다시 upgrade
+  - 모델로 선언할 수 없는 인덱스도 추가
+    - TextField(content, token)의 정확히 일치 조회: 길이 제한이 없는 hash 인덱스
+    - FK 컬럼(bookmark.quote_id, tokenblacklist.user_id): Postgres는 FK에 인덱스를 자동으로 만들지 않음
+- MySQL / SQLite: ADD COLUMN IF NOT EXISTS가 없으므로 컬럼 / 인덱스가 있는지 확인하고 없는 것만 생성
+"""
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = False
+
+# (테이블, 컬럼, 타입)
+COLUMNS = (
+    ("quote", "bookmark_count", "INT NOT NULL DEFAULT 0"),
+    ("userquestion", "assigned_date", "DATE"),
+)
+
+# (인덱스 이름, 테이블, 컬럼, UNIQUE 여부) - 모델(Meta.indexes, index=True, unique_together)에 선언된 인덱스
+MODEL_INDEXES = (
+    # 사용자별 일기 목록 (최신순)
+    ("idx_diary_user_id_c15388", "diary", ("user_id", "created_at"), False),
+    # 인기 명언 (bookmark_count DESC, id DESC)
+    ("idx_quote_bookmar_48c034", "quote", ("bookmark_count", "id"), False),
+    # 카테고리별 질문
+    ("idx_question_categor_912f11", "question", ("category",), False),
+    # 오늘의 질문 (user_id, assigned_date)
+    ("uid_userquestio_user_id_726ee5", "userquestion", ("user_id", "assigned_date"), True),
+)
+
+# 모델로 선언할 수 없는 PostgreSQL 전용 인덱스
+POSTGRES_INDEXES = (
+    # bookmark_count 재계산 (quote_id별 COUNT)
+    'CREATE INDEX CONCURRENTLY IF NOT EXISTS "idx_bookmark_quote_id" ON "bookmark" ("quote_id")',
+    # 정확히 일치 조회 (스크래퍼 중복 확인, 로그아웃 토큰 확인)
+    'CREATE INDEX CONCURRENTLY IF NOT EXISTS "idx_quote_content_hash" ON "quote" USING hash ("content")',
+    'CREATE INDEX CONCURRENTLY IF NOT EXISTS "idx_question_content_hash" ON "question" USING hash ("content")',
+    'CREATE INDEX CONCURRENTLY IF NOT EXISTS "idx_tokenblacklist_token_hash" ON "tokenblacklist" USING hash ("token")',
+    # 사용자별 로그아웃 토큰 (FK)
+    'CREATE INDEX CONCURRENTLY IF NOT EXISTS "idx_tokenblacklist_user_id" ON "tokenblacklist" ("user_id")',
+)
+
+
+def _quote(dialect: str, name: str) -> str:
+    return f"`{name}`" if dialect == "mysql" else f'"{name}"'
+
+
+async def _existing_columns(db: BaseDBAsyncClient, table: str) -> set[str]:
+    if db.capabilities.dialect == "mysql":
+        rows = await db.execute_query_dict(
+            "SELECT COLUMN_NAME AS name FROM information_schema.COLUMNS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s",
+            [table],
+        )
+    else:
+        rows = await db.execute_query_dict("SELECT name FROM pragma_table_info(?)", [table])
+    return {row["name"] for row in rows}
+
+
+async def _existing_indexes(db: BaseDBAsyncClient, table: str) -> dict[str, tuple[str, ...]]:
+    # 인덱스 이름 → 컬럼 (SQLite의 인라인 UNIQUE 제약은 sqlite_autoindex_* 이름이라 컬럼으로도 비교)
+    if db.capabilities.dialect == "mysql":
+        rows = await db.execute_query_dict(
+            "SELECT INDEX_NAME AS name, COLUMN_NAME AS col FROM information_schema.STATISTICS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s ORDER BY INDEX_NAME, SEQ_IN_INDEX",
+            [table],
+        )
+    else:
+        rows = await db.execute_query_dict(
+            "SELECT il.name AS name, ii.name AS col FROM pragma_index_list(?) il "
+            "JOIN pragma_index_info(il.name) ii ORDER BY il.name, ii.seqno",
+            [table],
+        )
+    indexes: dict[str, tuple[str, ...]] = {}
+    for row in rows:
+        indexes[row["name"]] = indexes.get(row["name"], ()) + (row["col"],)
+    return indexes
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    dialect = db.capabilities.dialect
+    if dialect == "postgres":
+        for table, column, ddl in COLUMNS:
+            await db.execute_script(f'ALTER TABLE "{table}" ADD COLUMN IF NOT EXISTS "{column}" {ddl}')
+        for name, table, columns, unique in MODEL_INDEXES:
+            await db.execute_script(
+                f"CREATE {'UNIQUE ' if unique else ''}INDEX CONCURRENTLY IF NOT EXISTS {_quote(dialect, name)} "
+                f"ON {_quote(dialect, table)} ({', '.join(_quote(dialect, column) for column in columns)})"
+            )
+        for sql in POSTGRES_INDEXES:
+            await db.execute_script(sql)
+    else:
+        for table, column, ddl in COLUMNS:
+            if column not in await _existing_columns(db, table):
+                await db.execute_script(
+                    f"ALTER TABLE {_quote(dialect, table)} ADD COLUMN {_quote(dialect, column)} {ddl}"
+                )
+        for name, table, columns, unique in MODEL_INDEXES:
+            existing = await _existing_indexes(db, table)
+            if name not in existing and columns not in existing.values():
+                await db.execute_script(
+                    f"CREATE {'UNIQUE ' if unique else ''}INDEX {_quote(dialect, name)} "
+                    f"ON {_quote(dialect, table)} ({', '.join(_quote(dialect, column) for column in columns)})"
+                )
+    # 모든 문장을 위에서 실행했으므로 aerich가 실행할 SQL은 없음
+    return ""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    # downgrade는 aerich가 항상 트랜잭션 안에서 실행하므로 CONCURRENTLY 없이 삭제
+    dialect = db.capabilities.dialect
+    if dialect == "postgres":
+        return """
+        DROP INDEX IF EXISTS "idx_tokenblacklist_user_id";
+        DROP INDEX IF EXISTS "idx_tokenblacklist_token_hash";
+        DROP INDEX IF EXISTS "idx_question_content_hash";
+        DROP INDEX IF EXISTS "idx_quote_content_hash";
+        DROP INDEX IF EXISTS "idx_bookmark_quote_id";
+        ALTER TABLE "userquestion" DROP CONSTRAINT IF EXISTS "uid_userquestio_user_id_726ee5";
+        DROP INDEX IF EXISTS "uid_userquestio_user_id_726ee5";
+        DROP INDEX IF EXISTS "idx_question_categor_912f11";
+        DROP INDEX IF EXISTS "idx_quote_bookmar_48c034";
+        DROP INDEX IF EXISTS "idx_diary_user_id_c15388";
+        ALTER TABLE "userquestion" DROP COLUMN IF EXISTS "assigned_date";
+        ALTER TABLE "quote" DROP COLUMN IF EXISTS "bookmark_count";"""
+    if dialect == "mysql":
+        # diary(user_id, created_at)는 user_id FK가 사용하는 인덱스일 수 있으므로 남겨 둠
+        return """
+        ALTER TABLE `userquestion` DROP INDEX `uid_userquestio_user_id_726ee5`;
+        ALTER TABLE `question` DROP INDEX `idx_question_categor_912f11`;
+        ALTER TABLE `quote` DROP INDEX `idx_quote_bookmar_48c034`;
+        ALTER TABLE `userquestion` DROP COLUMN `assigned_date`;
+        ALTER TABLE `quote` DROP COLUMN `bookmark_count`;"""
+    return """
+        DROP INDEX IF EXISTS "uid_userquestio_user_id_726ee5";
+        DROP INDEX IF EXISTS "idx_question_categor_912f11";
+        DROP INDEX IF EXISTS "idx_quote_bookmar_48c034";
+        DROP INDEX IF EXISTS "idx_diary_user_id_c15388";
+        ALTER TABLE "userquestion" DROP COLUMN "assigned_date";
+        ALTER TABLE "quote" DROP COLUMN "bookmark_count";"""
@@ -0,0 +1,49 @@
+"""
+워커 간 캐시 무효화 이벤트 테이블
+
+- Postgres는 LISTEN/NOTIFY를 사용하므로 이 테이블에 쓰지 않지만, 모델과 스키마를 맞추기 위해 함께 생성
+- LISTEN/NOTIFY가 없는 DB에서는 각 워커가 id 기준으로 폴링하고 오래된 행은 주기적으로 삭제
+- 자동 증가 PK / 시간 타입 문법이 DB마다 달라서 db.capabilities.dialect 로 DDL을 나눔
+"""
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    dialect = db.capabilities.dialect
+    if dialect == "mysql":
+        return """
+        CREATE TABLE IF NOT EXISTS `cacheinvalidation` (
+            `id` BIGINT NOT NULL PRIMARY KEY AUTO_INCREMENT,
+            `topic` VARCHAR(50) NOT NULL,
+            `payload` VARCHAR(255) NOT NULL DEFAULT '',
+            `origin` VARCHAR(32) NOT NULL,
+            `created_at` DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6),
+            KEY `idx_cacheinvali_created_444e13` (`created_at`)
+        ) CHARACTER SET utf8mb4;"""
+    if dialect == "sqlite":
+        return """
+        CREATE TABLE IF NOT EXISTS "cacheinvalidation" (
+            "id" INTEGER NOT NULL PRIMARY KEY AUTOINCREMENT,
+            "topic" VARCHAR(50) NOT NULL,
+            "payload" VARCHAR(255) NOT NULL DEFAULT '',
+            "origin" VARCHAR(32) NOT NULL,
+            "created_at" TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+        );
+        CREATE INDEX IF NOT EXISTS "idx_cacheinvali_created_444e13" ON "cacheinvalidation" ("created_at");"""
+    return """
+        CREATE TABLE IF NOT EXISTS "cacheinvalidation" (
+            "id" BIGSERIAL NOT NULL PRIMARY KEY,
+            "topic" VARCHAR(50) NOT NULL,
+            "payload" VARCHAR(255) NOT NULL DEFAULT '',
+            "origin" VARCHAR(32) NOT NULL,
+            "created_at" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP
+        );
+        CREATE INDEX IF NOT EXISTS "idx_cacheinvali_created_444e13" ON "cacheinvalidation" ("created_at");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    if db.capabilities.dialect == "mysql":
+        return """
+        DROP TABLE IF EXISTS `cacheinvalidation`;"""
+    return """
+        DROP TABLE IF EXISTS "cacheinvalidation";"""
@@ -0,0 +1,66 @@
+from app.repositories.question_repo import AssignmentBitmap, AssignmentBitmapCache
+
+
+def test_bitmap_membership():
+    bitmap = AssignmentBitmap([1, 8, 1000])
+
+    assert 1 in bitmap and 8 in bitmap and 1000 in bitmap
+    assert 0 not in bitmap and 7 not in bitmap and 999 not in bitmap
+    # 배열 범위 밖 id
+    assert 1_000_000 not in bitmap
+
+
+def test_bitmap_add_grows():
+    bitmap = AssignmentBitmap()
+    assert 42 not in bitmap
+
+    bitmap.add(42)
+    bitmap.add(42)
+
+    assert 42 in bitmap
+    assert 41 not in bitmap and 43 not in bitmap
+
+
+def test_bitmap_cache_evicts_least_recently_used():
+    cache = AssignmentBitmapCache(max_users=2)
+    bitmaps = {user_id: AssignmentBitmap() for user_id in (1, 2, 3)}
+    cache.put(1, bitmaps[1])
+    cache.put(2, bitmaps[2])
+    cache.put(1, bitmaps[1])
+    cache.put(3, bitmaps[3])
+
+    for user_id in (1, 2, 3):
+        cache.mark_assigned(user_id, 7)
+
+    # 캐시에 남은 사용자(1, 3)의 비트맵만 갱신됨
+    assert 7 in bitmaps[1]
+    assert 7 not in bitmaps[2]
+    assert 7 in bitmaps[3]
+
+
+def test_bitmap_cache_mark_and_invalidate():
+    cache = AssignmentBitmapCache(max_users=10)
+    bitmap = AssignmentBitmap()
+    cache.put(1, bitmap)
+
+    cache.mark_assigned(1, 7)
+    # 캐시에 없는 사용자는 무시
+    cache.mark_assigned(2, 7)
+    assert 7 in bitmap
+
+    cache.invalidate(1)
+    cache.invalidate(1)
+    # 제거된 비트맵은 더 이상 갱신되지 않음
+    cache.mark_assigned(1, 8)
+    assert 8 not in bitmap
+
+
+def test_bitmap_cache_clear():
+    cache = AssignmentBitmapCache(max_users=10)
+    bitmap = AssignmentBitmap()
+    cache.put(1, bitmap)
+
+    cache.clear()
+    cache.mark_assigned(1, 7)
+
+    assert 7 not in bitmap
@@ -0,0 +1,101 @@
+import pytest
+import pytest_asyncio
+from tortoise import Tortoise, connections
+from tortoise.backends.sqlite import client as sqlite_client
+
+from app.db.instrumentation import add_query_listener, install_query_hooks, normalize_sql, remove_query_listener
+
+
+class _NestedClient(sqlite_client.SqliteClient):
+    # MySQL 클라이언트처럼 execute_query_dict가 execute_query를 부르는 클라이언트
+    async def execute_query_dict(self, query, values=None):
+        return [dict(row) for row in (await self.execute_query(query, values))[1]]
+
+
+# Tortoise가 engine 모듈에서 찾는 클라이언트 클래스
+client_class = _NestedClient
+
+
+@pytest.mark.parametrize(
+    ("sql", "shape"),
+    [
+        (
+            'SELECT "id" FROM "user" WHERE "id"=5 AND "user_id" IN ($1,$2)',
+            'SELECT "id" FROM "user" WHERE "id"=? AND "user_id" IN (...)',
+        ),
+        ("SELECT * FROM t WHERE name='it''s' AND x=%s", "SELECT * FROM t WHERE name=? AND x=?"),
+        ("SELECT  a\n  FROM t WHERE b = ? LIMIT 10", "SELECT a FROM t WHERE b = ? LIMIT ?"),
+        ("SELECT col1 FROM t2 WHERE v=1.5", "SELECT col1 FROM t2 WHERE v=?"),
+        ("INSERT INTO t (a,b) VALUES (?,?)", "INSERT INTO t (a,b) VALUES (...)"),
+    ],
+)
+def test_normalize_sql(sql, shape):
+    assert normalize_sql(sql) == shape
+
+
+def test_same_shape_for_different_values():
+    assert normalize_sql("SELECT * FROM t WHERE id IN (1, 2, 3)") == normalize_sql(
+        "SELECT * FROM t WHERE id IN ($1,$2)"
+    )
+
+
+@pytest_asyncio.fixture
+async def events():
+    await Tortoise.init(config={
+        "connections": {"default": {"engine": __name__, "credentials": {"file_path": ":memory:"}}},
+        "apps": {},
+    })
+    install_query_hooks()
+    events = []
+    add_query_listener(events.append)
+    try:
+        yield events
+    finally:
+        remove_query_listener(events.append)
+        await Tortoise.close_connections()
+
+
+@pytest.mark.asyncio
+async def test_queries_are_reported_to_listeners(events):
+    db = connections.get("default")
+    await db.execute_script("CREATE TABLE t (a INT)")
+    await db.execute_insert("INSERT INTO t (a) VALUES (?)", [1])
+
+    assert [(event.method, event.rows, event.error) for event in events] == [
+        ("execute_script", 0, None),
+        ("execute_insert", 1, None),
+    ]
+    assert events[1].connection_name == "default"
+    assert events[1].values == [1]
+
+
+@pytest.mark.asyncio
+async def test_nested_hooked_calls_are_observed_once(events):
+    db = connections.get("default")
+
+    assert await db.execute_query_dict("SELECT 1 AS a") == [{"a": 1}]
+    await db.execute_query("SELECT 2")
+
+    assert [(event.method, event.sql, event.rows) for event in events] == [
+        ("execute_query_dict", "SELECT 1 AS a", 1),
+        ("execute_query", "SELECT 2", 1),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_failed_query_is_reported(events):
+    db = connections.get("default")
+
+    with pytest.raises(Exception):
+        await db.execute_query("SELECT * FROM missing")
+
+    [event] = events
+    assert event.error is not None and event.rows == 0
+
+
+@pytest.mark.asyncio
+async def test_removed_listener_is_not_called(events):
+    remove_query_listener(events.append)
+    await connections.get("default").execute_query("SELECT 1")
+
+    assert events == []
@@ -0,0 +1,65 @@
+from benchmarks.loadtest.stats import Recorder, compare, percentile
+
+
+def test_percentile_nearest_rank():
+    samples = [float(i) for i in range(1, 101)]
+
+    assert percentile(samples, 0.50) == 50.0
+    assert percentile(samples, 0.95) == 95.0
+    assert percentile(samples, 0.99) == 99.0
+    assert percentile(samples, 1.0) == 100.0
+    assert percentile(samples, 0.0) == 1.0
+
+
+def test_percentile_small_and_empty():
+    assert percentile([], 0.5) == 0.0
+    assert percentile([7.0], 0.99) == 7.0
+    assert percentile([1.0, 2.0], 0.5) == 1.0
+
+
+def _report(route: str, latency: float, count: int, errors: int = 0) -> dict:
+    recorder = Recorder()
+    for i in range(count):
+        recorder.record(route, latency, 500 if i < errors else 200, ok=i >= errors)
+    return recorder.report({})
+
+
+def test_report_summary():
+    report = _report("GET /quotes/random", 0.01, 30, errors=2)
+    summary = report["routes"]["GET /quotes/random"]
+
+    assert summary["count"] == 30
+    assert summary["errors"] == 2
+    assert summary["p95_ms"] == 10.0
+    assert summary["statuses"] == {"200": 28, "500": 2}
+    assert report["total"]["count"] == 30
+
+
+def test_compare_flags_slower_p95():
+    baseline = _report("GET /quotes/top", 0.010, 50)
+    current = _report("GET /quotes/top", 0.013, 50)
+
+    [row] = compare(current, baseline, tolerance=0.2)
+    assert row["p95_ms_ratio"] == 1.3
+    assert row["regression"] is True
+
+    [row] = compare(current, baseline, tolerance=0.5)
+    assert row["regression"] is False
+
+
+def test_compare_flags_new_errors():
+    baseline = _report("GET /quotes/top", 0.010, 50)
+    current = _report("GET /quotes/top", 0.010, 50, errors=1)
+
+    [row] = compare(current, baseline, tolerance=0.2)
+    assert row["regression"] is True
+
+
+def test_compare_skips_small_samples_and_new_routes():
+    baseline = _report("GET /quotes/top", 0.010, 5)
+    current = _report("GET /quotes/top", 0.100, 5)
+    current["routes"].update(_report("GET /quotes/search", 0.010, 50)["routes"])
+
+    rows = compare(current, baseline, tolerance=0.2)
+    assert [row["route"] for row in rows] == ["GET /quotes/top"]
+    assert rows[0]["regression"] is False
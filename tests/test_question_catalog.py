@@ -0,0 +1,49 @@
+import pytest
+
+from app.services.question_catalog import QuestionCatalog, QuestionRecord
+
+
+def _catalog() -> QuestionCatalog:
+    return QuestionCatalog([
+        QuestionRecord(5, "다섯", "감정"),
+        QuestionRecord(1, "하나", "하루"),
+        QuestionRecord(3, "셋", "감정"),
+        QuestionRecord(9, "아홉", None),
+    ])
+
+
+def test_catalog_orders_ids_and_groups_categories():
+    catalog = _catalog()
+
+    assert len(catalog) == 4
+    assert list(catalog.ids) == [1, 3, 5, 9]
+    assert {category: list(ids) for category, ids in catalog.by_category.items()} == {
+        "하루": [1],
+        "감정": [3, 5],
+    }
+    assert catalog.categories() == [{"category": "하루", "count": 1}, {"category": "감정", "count": 2}]
+
+
+def test_catalog_get_and_pick():
+    catalog = _catalog()
+
+    assert catalog.get(3).content == "셋"
+    assert catalog.get(4) is None
+    assert {catalog.pick_id() for _ in range(200)} == {1, 3, 5, 9}
+    assert {catalog.pick("감정").id for _ in range(50)} <= {3, 5}
+    assert catalog.pick("없는 카테고리") is None
+
+
+def test_empty_catalog():
+    catalog = QuestionCatalog([])
+
+    assert len(catalog) == 0
+    assert catalog.pick_id() is None
+    assert catalog.pick() is None
+
+
+def test_question_record_is_immutable():
+    record = QuestionRecord(1, "하나", None)
+
+    with pytest.raises(AttributeError):
+        record.content = "둘"
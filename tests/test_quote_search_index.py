@@ -0,0 +1,72 @@
+from app.services.quote_search_service import QuoteSearchIndex
+
+ROWS = [
+    (3, "행복은 습관이다", "허버드"),
+    (1, "오늘 걷지 않으면 내일은 뛰어야 한다", "도스토옙스키"),
+    (2, "Life is what happens", "John Lennon"),
+    (4, "행복한 사람은 감사할 줄 안다", "허버트 스펜서"),
+    (5, "작가 없는 명언", None),
+]
+
+
+def _ids(results) -> list[int]:
+    return [result["id"] for result in results]
+
+
+def test_search_matches_substring_in_id_order():
+    index = QuoteSearchIndex(ROWS)
+
+    assert _ids(index.search("행복")) == [3, 4]
+    assert index.search("행복은")[0] == {"id": 3, "content": "행복은 습관이다", "author": "허버드"}
+
+
+def test_search_ignores_case_and_whitespace():
+    index = QuoteSearchIndex(ROWS)
+
+    assert _ids(index.search("LIFE IS")) == [2]
+    assert _ids(index.search("오늘걷지")) == [1]
+
+
+def test_single_character_query_uses_unigrams():
+    index = QuoteSearchIndex(ROWS)
+
+    assert _ids(index.search("뛰")) == [1]
+
+
+def test_search_rejects_grams_out_of_order():
+    # "bcabc"의 2-gram(bc, ca, ab)은 모두 "abcab"에 있지만 부분 문자열은 아님
+    index = QuoteSearchIndex([(1, "abcab", None), (2, "xbcabcx", None)])
+
+    assert _ids(index.search("bcabc")) == [2]
+
+
+def test_search_empty_or_unknown_query():
+    index = QuoteSearchIndex(ROWS)
+
+    assert index.search("   ") == []
+    assert index.search("없는단어") == []
+
+
+def test_search_respects_limit():
+    index = QuoteSearchIndex(ROWS)
+
+    assert _ids(index.search("다", limit=2)) == [1, 3]
+
+
+def test_autocomplete_authors_by_prefix():
+    index = QuoteSearchIndex(ROWS)
+
+    assert index.autocomplete_authors("허버") == ["허버드", "허버트 스펜서"]
+    assert index.autocomplete_authors("허버트스") == ["허버트 스펜서"]
+    assert index.autocomplete_authors("john") == ["John Lennon"]
+    assert index.autocomplete_authors("허버", limit=1) == ["허버드"]
+    assert index.autocomplete_authors("") == []
+    assert index.autocomplete_authors("없는") == []
+
+
+def test_stats_counts():
+    stats = QuoteSearchIndex(ROWS).stats()
+
+    assert stats["quotes"] == 5
+    assert stats["authors"] == 4
+    assert stats["memory_bytes"]["total"] > 0
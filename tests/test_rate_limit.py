@@ -0,0 +1,106 @@
+import asyncio
+
+import pytest
+
+from app.middleware import rate_limit
+from app.middleware.rate_limit import ConcurrencyLimiter, TokenBucketLimiter
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(rate_limit.time, "monotonic", clock)
+    return clock
+
+
+def test_token_bucket_allows_burst_then_rejects(clock):
+    limiter = TokenBucketLimiter(per_minute=60, burst=3, max_keys=10)
+
+    assert [limiter.acquire("a") for _ in range(3)] == [0.0, 0.0, 0.0]
+    # 초당 1개씩 차므로 다음 토큰까지 1초
+    assert limiter.acquire("a") == pytest.approx(1.0)
+    # 다른 키는 따로 계산
+    assert limiter.acquire("b") == 0.0
+
+
+def test_token_bucket_refills_up_to_burst(clock):
+    limiter = TokenBucketLimiter(per_minute=60, burst=2, max_keys=10)
+    limiter.acquire("a")
+    limiter.acquire("a")
+
+    clock.now += 0.5
+    assert limiter.acquire("a") == pytest.approx(0.5)
+
+    clock.now += 60
+    assert [limiter.acquire("a") for _ in range(2)] == [0.0, 0.0]
+    assert limiter.acquire("a") > 0
+
+
+def test_token_bucket_evicts_least_recently_used_key(clock):
+    limiter = TokenBucketLimiter(per_minute=60, burst=1, max_keys=2)
+    limiter.acquire("a")
+    limiter.acquire("b")
+    limiter.acquire("a")
+    limiter.acquire("c")
+
+    assert len(limiter) == 2
+    # 제거된 "b"는 새 버킷으로 다시 시작
+    assert limiter.acquire("b") == 0.0
+    assert limiter.acquire("c") > 0
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limiter_rejects_without_queue():
+    limiter = ConcurrencyLimiter(max_in_flight=1, queue_timeout=0, pool_waiters=0)
+
+    assert await limiter.acquire() is None
+    assert await limiter.acquire() == "concurrency"
+    assert limiter.in_flight == 1
+
+    limiter.release()
+    assert await limiter.acquire() is None
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limiter_queues_until_release():
+    limiter = ConcurrencyLimiter(max_in_flight=1, queue_timeout=1, pool_waiters=0)
+    await limiter.acquire()
+
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    assert limiter.queued == 1
+
+    limiter.release()
+    assert await waiter is None
+    assert limiter.queued == 0
+    assert limiter.in_flight == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limiter_queue_timeout():
+    limiter = ConcurrencyLimiter(max_in_flight=1, queue_timeout=0.01, pool_waiters=0)
+    await limiter.acquire()
+
+    assert await limiter.acquire() == "concurrency"
+    assert limiter.queued == 0
+    assert limiter.in_flight == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limiter_sheds_on_pool_waiters(monkeypatch):
+    class _Monitor:
+        waiting = 5
+
+    monkeypatch.setattr(rate_limit, "pool_monitors", {"default": _Monitor()})
+    limiter = ConcurrencyLimiter(max_in_flight=10, queue_timeout=0, pool_waiters=5)
+
+    assert await limiter.acquire() == "db_pool"
+    assert limiter.in_flight == 0
@@ -0,0 +1,91 @@
+"""
+ReadReplicaRouter 라우팅 테스트
+
+primary / replica 를 서로 다른 SQLite 메모리 DB로 두고 같은 테이블에 다른 데이터를 넣어서
+조회 결과로 어느 연결을 탔는지 확인
+"""
+import pytest
+import pytest_asyncio
+from tortoise import Tortoise, connections
+from tortoise.utils import get_schema_sql
+
+from app.db import routing
+from app.db.base import TORTOISE_MODELS
+from app.db.routing import bind_request_user, read_only
+from app.models.quote import Quote
+from app.services.quote_service import QuoteService
+
+pytestmark = pytest.mark.asyncio
+
+USER_ID = 7
+
+
+@read_only
+async def _read_contents() -> list[str]:
+    return await Quote.all().order_by("id").values_list("content", flat=True)
+
+
+@pytest_asyncio.fixture
+async def primary_and_replica():
+    await Tortoise.init(config={
+        "connections": {"default": "sqlite://:memory:", routing.REPLICA_CONNECTION: "sqlite://:memory:"},
+        "apps": {"models": {"models": TORTOISE_MODELS, "default_connection": "default"}},
+        "routers": ["app.db.routing.ReadReplicaRouter"],
+    })
+    try:
+        primary = connections.get("default")
+        replica = connections.get(routing.REPLICA_CONNECTION)
+        # 모델은 default 연결에 묶여 있으므로 primary 기준 스키마를 두 DB에 똑같이 생성
+        schema = get_schema_sql(primary, safe=False)
+        for conn, content in ((primary, "primary"), (replica, "replica")):
+            await conn.execute_script(schema)
+            await conn.execute_insert(
+                'INSERT INTO "quote" ("content", "author", "bookmark_count") VALUES (?, ?, ?)',
+                [content, "author", 0],
+            )
+        routing._sticky_until.clear()
+        yield
+    finally:
+        routing._sticky_until.clear()
+        await Tortoise.close_connections()
+
+
+async def test_read_only_reads_go_to_replica(primary_and_replica):
+    assert await _read_contents() == ["replica"]
+    assert [quote.content for quote in await QuoteService.get_all()] == ["replica"]
+
+
+async def test_reads_outside_read_only_go_to_primary(primary_and_replica):
+    assert await Quote.all().values_list("content", flat=True) == ["primary"]
+
+
+async def test_writes_go_to_primary(primary_and_replica):
+    await Quote.create(content="written", author="author")
+
+    assert await Quote.all().order_by("id").values_list("content", flat=True) == ["primary", "written"]
+    assert await Quote.filter(content="written").using_db(
+        connections.get(routing.REPLICA_CONNECTION)
+    ).exists() is False
+
+
+async def test_reads_after_write_stick_to_primary(primary_and_replica):
+    bind_request_user(USER_ID)
+    await Quote.create(content="written", author="author")
+
+    assert await _read_contents() == ["primary", "written"]
+
+
+async def test_sticky_window_expires(primary_and_replica, monkeypatch):
+    monkeypatch.setattr(routing.settings, "REPLICA_STICKY_SECONDS", 0)
+    bind_request_user(USER_ID)
+    await Quote.create(content="written", author="author")
+
+    assert await _read_contents() == ["replica"]
+
+
+async def test_other_users_still_read_from_replica(primary_and_replica):
+    bind_request_user(USER_ID)
+    await Quote.create(content="written", author="author")
+    bind_request_user(USER_ID + 1)
+
+    assert await _read_contents() == ["replica"]
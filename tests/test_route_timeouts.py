@@ -0,0 +1,13 @@
+from app.core.config import settings
+from app.main import app
+
+
+def test_route_statement_timeouts_match_registered_routes():
+    # 키가 실제 라우트 템플릿과 다르면 조용히 기본 timeout이 적용되므로 여기서 확인
+    routes = {
+        f"{method} {route.path}"
+        for route in app.routes
+        for method in getattr(route, "methods", None) or ()
+    }
+    unknown = sorted(set(settings.ROUTE_STATEMENT_TIMEOUTS) - routes)
+    assert not unknown, f"ROUTE_STATEMENT_TIMEOUTS keys without a route: {unknown}"